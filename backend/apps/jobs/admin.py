@@ -0,0 +1,34 @@
+from django.contrib import admin
+
+from .models import Job, PeriodicSchedule
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "name",
+        "queue",
+        "status",
+        "attempts",
+        "max_attempts",
+        "run_at",
+        "locked_by",
+        "created_at",
+        "finished_at",
+    ]
+    list_display_links = list_display
+    ordering = ("-created_at",)
+    list_filter = ["status", "queue", "created_at"]
+    search_fields = ["name", "last_error"]
+    list_per_page = 16
+
+
+@admin.register(PeriodicSchedule)
+class PeriodicScheduleAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "next_run_at"]
+    list_display_links = list_display
+    ordering = ("name",)
+    list_filter = []
+    search_fields = ["name"]
+    list_per_page = 16
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    """Django app configuration for the background jobs app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "jobs"
+
+    def ready(self) -> None:
+        # Register the tasks declared in each app's tasks module
+        from django.utils.module_loading import autodiscover_modules
+
+        autodiscover_modules("tasks")
@@ -0,0 +1,59 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from jobs.registry import tasks
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    """Run a background job worker against the database job queue.
+
+    Any number of workers may run on any number of nodes. Each claims due
+    jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database
+    supports it, retries failures with backoff and enqueues periodic tasks.
+    """
+
+    help = "Process queued background jobs."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="Only process jobs of the given queue. May be repeated.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.JOBS_CONCURRENCY,
+            help="Number of jobs to run at the same time.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help="Seconds between polls while the queues are empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no due job is left instead of polling.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queues = options["queues"] or sorted({task.queue for task in tasks.values()})
+        worker = Worker(
+            queues=queues,
+            concurrency=max(options["concurrency"], 1),
+            poll_interval=options["interval"],
+        )
+        signal.signal(signal.SIGTERM, worker.stop)
+        signal.signal(signal.SIGINT, worker.stop)
+
+        self.stdout.write(
+            f"Worker {worker.worker_id} processing {', '.join(queues)} "
+            f"with concurrency {worker.concurrency}"
+        )
+        worker.run(once=options["once"])
+        self.stdout.write(self.style.SUCCESS("Worker stopped"))
@@ -0,0 +1,3 @@
+from .job import Job, PeriodicSchedule
+
+__all__ = ["Job", "PeriodicSchedule"]
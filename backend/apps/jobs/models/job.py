@@ -0,0 +1,86 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """Model class for a queued call of a registered background task"""
+
+    class Meta:
+        db_table = "job"
+        verbose_name = "job"
+        verbose_name_plural = "jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "queue", "run_at"], name="job_claim_idx"),
+        ]
+
+    objects = models.Manager()
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    # Model fields for Job
+    name = models.CharField(
+        max_length=200,
+        blank=False,
+        null=False,
+        db_index=True,
+        help_text="Registered name of the task to call",
+    )
+    args = models.JSONField(default=list, blank=True, null=False)
+    kwargs = models.JSONField(default=dict, blank=True, null=False)
+    queue = models.CharField(max_length=50, blank=False, null=False, default="default")
+    priority = models.SmallIntegerField(
+        default=0,
+        blank=False,
+        null=False,
+        help_text="Jobs with a higher priority are claimed first",
+    )
+    status = models.CharField(
+        max_length=10,
+        blank=False,
+        null=False,
+        choices=STATUS_CHOICES,
+        default=QUEUED,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, blank=False, null=False)
+    max_attempts = models.PositiveSmallIntegerField(default=1, blank=False, null=False)
+    run_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="The job is not claimed before this time",
+    )
+    locked_by = models.CharField(max_length=100, blank=True, null=False, default="")
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=False, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
+
+
+class PeriodicSchedule(models.Model):
+    """Model class for the next due time of a periodic task"""
+
+    class Meta:
+        db_table = "periodic_schedule"
+        verbose_name = "periodic schedule"
+        verbose_name_plural = "periodic schedules"
+        ordering = ["name"]
+
+    objects = models.Manager()
+
+    # Model fields for PeriodicSchedule
+    name = models.CharField(max_length=200, unique=True, blank=False, null=False)
+    next_run_at = models.DateTimeField(blank=False, null=False)
+
+    def __str__(self) -> str:
+        return f"{self.name} at {self.next_run_at}"
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from django.conf import settings
+from django.utils import timezone
+from jobs.models import Job
+
+
+@dataclass
+class Task:
+    """A function registered to run as a background job."""
+
+    name: str
+    func: Callable[..., Any]
+    queue: str
+    max_attempts: int
+    priority: int = 0
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, **kwargs) -> Job | None:
+        """Queue a call of the task with JSON-serializable arguments."""
+        return enqueue(self, args=args, kwargs=kwargs)
+
+
+@dataclass
+class PeriodicTask:
+    """A registered task enqueued every ``interval`` by the workers."""
+
+    task: Task
+    interval: timedelta
+
+
+# Registered tasks and periodic tasks keyed by task name
+tasks: dict[str, Task] = {}
+periodic_tasks: dict[str, PeriodicTask] = {}
+
+
+def task(
+    name: str | None = None,
+    queue: str = "default",
+    max_attempts: int | None = None,
+    priority: int = 0,
+) -> Callable[[Callable[..., Any]], Task]:
+    """Register a function as a background task.
+
+    Args:
+        name (str | None): Registered name, defaults to ``module.function``.
+        queue (str): Queue workers select jobs of this task from.
+        max_attempts (int | None): Runs before a failing job is given up,
+            defaults to JOBS_MAX_ATTEMPTS.
+        priority (int): Jobs with a higher priority are claimed first.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Task:
+        registered = Task(
+            name=name or f"{func.__module__}.{func.__qualname__}",
+            func=func,
+            queue=queue,
+            max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+            priority=priority,
+        )
+        tasks[registered.name] = registered
+        return registered
+
+    return decorator
+
+
+def periodic_task(
+    every: timedelta, name: str | None = None, queue: str = "default"
+) -> Callable[[Callable[..., Any]], Task]:
+    """Register a task without arguments that workers enqueue every ``every``."""
+
+    def decorator(func: Callable[..., Any]) -> Task:
+        registered = task(name=name, queue=queue)(func)
+        periodic_tasks[registered.name] = PeriodicTask(registered, every)
+        return registered
+
+    return decorator
+
+
+def enqueue(
+    task: Task,
+    args: tuple | list = (),
+    kwargs: dict | None = None,
+    run_at: datetime | None = None,
+) -> Job | None:
+    """Insert a job row for a task, or run it inline when JOBS_EAGER is on.
+
+    The row is written in the caller's transaction, so a job queued while
+    creating a model is only visible to workers once that model is.
+
+    Returns:
+        Job | None: The queued job, or None if the task ran inline.
+    """
+    if settings.JOBS_EAGER:
+        task.func(*args, **(kwargs or {}))
+        return None
+
+    return Job.objects.create(
+        name=task.name,
+        args=list(args),
+        kwargs=kwargs or {},
+        queue=task.queue,
+        priority=task.priority,
+        max_attempts=task.max_attempts,
+        run_at=run_at or timezone.now(),
+    )
@@ -0,0 +1,15 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from jobs.models import Job
+from jobs.registry import periodic_task
+
+
+@periodic_task(every=timedelta(hours=1))
+def prune_finished_jobs() -> None:
+    """Delete finished jobs older than JOBS_RETENTION seconds."""
+    Job.objects.filter(
+        status__in=[Job.DONE, Job.FAILED],
+        finished_at__lt=timezone.now() - timedelta(seconds=settings.JOBS_RETENTION),
+    ).delete()
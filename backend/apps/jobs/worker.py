@@ -0,0 +1,211 @@
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from logging import getLogger
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from jobs.models import Job, PeriodicSchedule
+from jobs.registry import enqueue, periodic_tasks, tasks
+
+logger = getLogger(__name__)
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Return the exponential backoff, with jitter, before the next attempt."""
+    delay = min(
+        settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1),
+        settings.JOBS_RETRY_BACKOFF_MAX,
+    )
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+def claim_jobs(worker_id: str, queues: list[str], limit: int) -> list[Job]:
+    """Atomically mark up to ``limit`` due jobs as running for this worker.
+
+    Databases with ``SELECT ... FOR UPDATE SKIP LOCKED`` let concurrent
+    workers claim disjoint rows without waiting on each other. Elsewhere,
+    SQLite in particular, each candidate is claimed with a conditional
+    update so a job is still only ever handed to one worker.
+    """
+    now = timezone.now()
+    due = Job.objects.filter(
+        status=Job.QUEUED, queue__in=queues, run_at__lte=now
+    ).order_by("-priority", "run_at", "id")
+    claim = {
+        "status": Job.RUNNING,
+        "locked_by": worker_id,
+        "locked_at": now,
+        "attempts": F("attempts") + 1,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job_ids = list(
+                due.select_for_update(skip_locked=True).values_list("id", flat=True)[
+                    :limit
+                ]
+            )
+            Job.objects.filter(id__in=job_ids).update(**claim)
+    else:
+        job_ids = [
+            job_id
+            for job_id in due.values_list("id", flat=True)[:limit]
+            if Job.objects.filter(id=job_id, status=Job.QUEUED).update(**claim)
+        ]
+
+    return list(Job.objects.filter(id__in=job_ids).order_by("-priority", "run_at"))
+
+
+def run_job(job: Job) -> bool:
+    """Call a claimed job's task and record the outcome.
+
+    Failed jobs are queued again with an exponential backoff until they
+    have used up their attempts.
+
+    Returns:
+        bool: True if the task completed without raising.
+    """
+    registered = tasks.get(job.name)
+    try:
+        if registered is None:
+            raise LookupError(f"Task is not registered: {job.name}")
+        registered.func(*job.args, **job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            run_at = timezone.now() + get_retry_delay(job.attempts)
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.QUEUED, run_at=run_at, last_error=error
+            )
+            logger.warning(f"Job {job.pk} {job.name} failed, retrying at {run_at}")
+        else:
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.FAILED, finished_at=timezone.now(), last_error=error
+            )
+            logger.error(f"Job {job.pk} {job.name} failed permanently:\n{error}")
+        return False
+
+    Job.objects.filter(pk=job.pk).update(status=Job.DONE, finished_at=timezone.now())
+    return True
+
+
+def requeue_stale_jobs() -> int:
+    """Release jobs whose worker died without recording an outcome.
+
+    Returns:
+        int: The number of jobs queued again or marked as failed.
+    """
+    stale = Job.objects.filter(
+        status=Job.RUNNING,
+        locked_at__lt=timezone.now()
+        - timedelta(seconds=settings.JOBS_VISIBILITY_TIMEOUT),
+    )
+    requeued = stale.filter(attempts__lt=F("max_attempts")).update(
+        status=Job.QUEUED, last_error="Worker stopped before the job finished."
+    )
+    failed = stale.update(
+        status=Job.FAILED,
+        finished_at=timezone.now(),
+        last_error="Worker stopped before the job finished.",
+    )
+    return requeued + failed
+
+
+def schedule_periodic_tasks() -> None:
+    """Enqueue periodic tasks that are due, once across all workers.
+
+    Each schedule row is advanced with a conditional update, so only the
+    worker that wins the update enqueues the task.
+    """
+    now = timezone.now()
+    for name, periodic in periodic_tasks.items():
+        schedule, _ = PeriodicSchedule.objects.get_or_create(
+            name=name, defaults={"next_run_at": now}
+        )
+        if schedule.next_run_at > now:
+            continue
+        advanced = PeriodicSchedule.objects.filter(
+            pk=schedule.pk, next_run_at=schedule.next_run_at
+        ).update(next_run_at=now + periodic.interval)
+        if advanced:
+            enqueue(periodic.task)
+
+
+class Worker:
+    """Polling worker running claimed jobs on a pool of threads.
+
+    Tasks of this project mostly wait on ffmpeg subprocesses, which use
+    their own cores. Start one worker per node, or several per node for
+    CPU-bound Python tasks; SKIP LOCKED keeps them from colliding.
+    """
+
+    def __init__(
+        self, queues: list[str], concurrency: int, poll_interval: float
+    ) -> None:
+        self.queues = queues
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.running = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+
+    def stop(self, *args) -> None:
+        """Finish the running jobs and stop claiming new ones."""
+        self.stopping.set()
+        self.wakeup.set()
+
+    def run(self, once: bool = False) -> None:
+        """Poll for jobs until stopped, or until the queues are drained with ``once``."""
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while not self.stopping.is_set():
+                close_old_connections()
+                requeue_stale_jobs()
+                schedule_periodic_tasks()
+
+                jobs = self.claim()
+                for job in jobs:
+                    executor.submit(self.execute, job)
+                if jobs:
+                    continue
+
+                if once and self.running == 0:
+                    break
+                # Sleep until a thread frees up, the worker stops or the poll
+                self.wakeup.wait(self.poll_interval)
+                self.wakeup.clear()
+
+    def claim(self) -> list[Job]:
+        """Claim as many jobs as there are idle threads."""
+        with self.lock:
+            free = self.concurrency - self.running
+        if not free:
+            return []
+
+        jobs = claim_jobs(self.worker_id, self.queues, free)
+        with self.lock:
+            self.running += len(jobs)
+        return jobs
+
+    def execute(self, job: Job) -> None:
+        try:
+            started_at = time.monotonic()
+            done = run_job(job)
+            logger.info(
+                f"Job {job.pk} {job.name} {'done' if done else 'failed'} "
+                f"in {time.monotonic() - started_at:.2f}s"
+            )
+        finally:
+            close_old_connections()
+            with self.lock:
+                self.running -= 1
+            self.wakeup.set()
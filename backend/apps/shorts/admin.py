@@ -1,11 +1,13 @@
 from django.contrib import admin
 
+from .models.blob import Blob
 from .models.comment import Comment
 from .models.follow import Follow
 from .models.like import Like
 from .models.report import Report
 from .models.tag import Tag
 from .models.video import Video
+from .models.video_upload import VideoDirectUpload, VideoUpload
 from .models.view import View
 
 
@@ -37,6 +39,44 @@ class VideoAdmin(admin.ModelAdmin):
     list_per_page = 16
 
 
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "sha256", "size", "ref_count", "created_at"]
+    list_display_links = list_display
+    ordering = ("-created_at",)
+    list_filter = ["created_at"]
+    search_fields = ["sha256", "name"]
+    list_per_page = 16
+
+
+@admin.register(VideoUpload)
+class VideoUploadAdmin(admin.ModelAdmin):
+    list_display = [
+        field.name
+        for field in VideoUpload._meta.get_fields()
+        if not (field.many_to_many or field.one_to_many)
+    ]
+    list_display_links = list_display
+    ordering = ("-created_at",)
+    list_filter = ["created_at", "expires_at"]
+    search_fields = ["filename"]
+    list_per_page = 16
+
+
+@admin.register(VideoDirectUpload)
+class VideoDirectUploadAdmin(admin.ModelAdmin):
+    list_display = [
+        field.name
+        for field in VideoDirectUpload._meta.get_fields()
+        if not (field.many_to_many or field.one_to_many)
+    ]
+    list_display_links = list_display
+    ordering = ("-created_at",)
+    list_filter = ["created_at", "expires_at"]
+    search_fields = ["name"]
+    list_per_page = 16
+
+
 @admin.register(View)
 class ViewAdmin(admin.ModelAdmin):
     list_display = [
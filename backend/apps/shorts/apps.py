@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ShortsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "shorts"
+
+    def ready(self) -> None:
+        # Register signal handlers
+        from shorts import signals  # noqa: F401
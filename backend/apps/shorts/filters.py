@@ -1,11 +1,14 @@
-from django_filters import CharFilter, FilterSet
+from django_filters import CharFilter, FilterSet, NumberFilter
 from shorts.models.video import Video
 
 
 class VideoFilterSet(FilterSet):
     username = CharFilter(field_name="owner__username", lookup_expr="iexact")
     tag = CharFilter(field_name="tags__name", lookup_expr="iexact")
+    min_duration = NumberFilter(field_name="duration", lookup_expr="gte")
+    max_duration = NumberFilter(field_name="duration", lookup_expr="lte")
+    min_height = NumberFilter(field_name="height", lookup_expr="gte")
 
     class Meta:
         model = Video
-        fields = ["username", "tag"]
+        fields = ["username", "tag", "min_duration", "max_duration", "min_height"]
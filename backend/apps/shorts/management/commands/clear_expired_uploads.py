@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from shorts.models.video_upload import VideoDirectUpload, VideoUpload
+from shorts.uploads import discard_direct_upload
+
+
+class Command(BaseCommand):
+    """Discard resumable and direct uploads that were never finalized."""
+
+    help = "Delete expired upload sessions, their staging files and objects."
+
+    def handle(self, *args, **options) -> None:
+        now = timezone.now()
+
+        # Deleting row by row fires the signal that removes staging files
+        expired = VideoUpload.objects.filter(expires_at__lte=now)
+        count = 0
+        for upload in expired.iterator():
+            upload.delete()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} expired uploads"))
+
+        # Objects uploaded straight to storage but never confirmed
+        expired = VideoDirectUpload.objects.filter(expires_at__lte=now)
+        count = 0
+        for upload in expired.iterator():
+            discard_direct_upload(upload)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} expired direct uploads"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import FFmpegError, ensure_faststart, index_keyframes
+
+
+class Command(BaseCommand):
+    """Backfill faststart MP4 files for videos uploaded before remuxing."""
+
+    help = "Relocate the moov atom of existing videos to the front of the file."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only process the given video ID. May be repeated.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queryset = Video.objects.filter(is_faststart=False).order_by("id")
+        if options["video_ids"]:
+            queryset = queryset.filter(id__in=options["video_ids"])
+
+        for video in queryset.iterator():
+            if not video.has_local_file():
+                self.stdout.write(f"Skipped remote video {video.pk}")
+                continue
+            try:
+                remuxed = ensure_faststart(video)
+            except (FFmpegError, OSError) as error:
+                self.stderr.write(f"Failed video {video.pk}: {error}")
+                continue
+
+            if remuxed:
+                # Remuxing moves the media data, so stored offsets are stale
+                index_keyframes(video)
+                self.stdout.write(self.style.SUCCESS(f"Remuxed video {video.pk}"))
+            else:
+                self.stdout.write(f"Already faststart video {video.pk}")
@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import FFmpegError, generate_storyboard
+
+
+class Command(BaseCommand):
+    """Render seek-bar storyboard sprites with a local ffmpeg.
+
+    Without ``--watch`` all videos lacking a storyboard are processed once.
+    With ``--watch`` the command runs as a local worker that keeps polling
+    for new uploads, skipping videos that already failed in this run.
+    """
+
+    help = "Generate storyboard sprites and coordinate maps for videos."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only (re)generate the given video ID. May be repeated.",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep polling for videos without a storyboard instead of exiting.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10.0,
+            help="Seconds between polls in --watch mode.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["video_ids"]:
+            queryset = Video.objects.filter(id__in=options["video_ids"])
+        else:
+            queryset = Video.objects.filter(storyboard_map={})
+
+        failed = set()
+        while True:
+            for video in queryset.exclude(id__in=failed).order_by("id").iterator():
+                if not video.has_local_file():
+                    failed.add(video.pk)
+                    self.stdout.write(f"Skipped remote video {video.pk}")
+                    continue
+                try:
+                    generate_storyboard(video)
+                except (FFmpegError, OSError) as error:
+                    failed.add(video.pk)
+                    self.stderr.write(f"Failed video {video.pk}: {error}")
+                    continue
+                self.stdout.write(
+                    self.style.SUCCESS(f"Storyboard for video {video.pk}")
+                )
+
+            if not options["watch"] or options["video_ids"]:
+                break
+            time.sleep(options["interval"])
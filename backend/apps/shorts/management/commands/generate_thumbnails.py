@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django import db
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import FFmpegError, generate_thumbnails
+
+
+def setup_worker() -> None:
+    """Prepare Django in a pool process started without forking."""
+    django.setup()
+
+
+def render_video_thumbnails(video_id: int) -> str | None:
+    """Generate one video's thumbnails in a pool process.
+
+    Returns:
+        str | None: The error message, or None on success.
+    """
+    try:
+        video = Video.objects.get(pk=video_id)
+        if not video.has_local_file():
+            return "Skipped remote video file"
+        generate_thumbnails(video)
+    except (FFmpegError, OSError, Video.DoesNotExist) as error:
+        return str(error)
+    finally:
+        db.connections.close_all()
+    return None
+
+
+class Command(BaseCommand):
+    """Backfill thumbnail renditions on a pool of processes.
+
+    Decoding frames and encoding images is CPU bound, so each video is
+    rendered in its own process to use every core.
+    """
+
+    help = "Generate WebP and JPEG thumbnail renditions for existing videos."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only (re)generate the given video ID. May be repeated.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Number of worker processes, defaults to the CPU count.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["video_ids"]:
+            queryset = Video.objects.filter(id__in=options["video_ids"])
+        else:
+            queryset = Video.objects.filter(thumbnails={})
+        video_ids = list(queryset.order_by("id").values_list("id", flat=True))
+
+        # Forked processes must not share the parent's database connections
+        db.connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options["processes"], initializer=setup_worker
+        ) as executor:
+            for video_id, error in zip(
+                video_ids, executor.map(render_video_thumbnails, video_ids)
+            ):
+                if error:
+                    self.stderr.write(f"Failed video {video_id}: {error}")
+                else:
+                    self.stdout.write(
+                        self.style.SUCCESS(f"Thumbnails for video {video_id}")
+                    )
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import index_keyframes
+
+
+class Command(BaseCommand):
+    """Backfill keyframe seek indexes for videos uploaded before indexing."""
+
+    help = "Parse the MP4 sample tables of videos into keyframe seek indexes."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only process the given video ID. May be repeated.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-index videos that already have a keyframe index.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queryset = Video.objects.order_by("id")
+        if not options["all"]:
+            queryset = queryset.filter(keyframe_index=[])
+        if options["video_ids"]:
+            queryset = queryset.filter(id__in=options["video_ids"])
+
+        for video in queryset.iterator():
+            if not video.has_local_file():
+                self.stdout.write(f"Skipped remote video {video.pk}")
+                continue
+            try:
+                count = index_keyframes(video)
+            except OSError as error:
+                self.stderr.write(f"Failed video {video.pk}: {error}")
+                continue
+
+            if count:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Indexed {count} keyframes of video {video.pk}")
+                )
+            else:
+                self.stdout.write(f"No keyframe index for video {video.pk}")
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import FFmpegError, probe_video
+
+
+class Command(BaseCommand):
+    """Backfill technical metadata for videos uploaded before probing."""
+
+    help = "Probe the duration, resolution, bitrate and codecs of videos."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only process the given video ID. May be repeated.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-probe videos that already have metadata.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queryset = Video.objects.order_by("id")
+        if not options["all"]:
+            queryset = queryset.filter(duration__isnull=True)
+        if options["video_ids"]:
+            queryset = queryset.filter(id__in=options["video_ids"])
+
+        for video in queryset.iterator():
+            if not video.has_local_file():
+                self.stdout.write(f"Skipped remote video {video.pk}")
+                continue
+            try:
+                metadata = probe_video(video)
+            except (FFmpegError, OSError) as error:
+                self.stderr.write(f"Failed video {video.pk}: {error}")
+                continue
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Probed video {video.pk}: {metadata['width']}x"
+                    f"{metadata['height']}, {metadata['duration']}s"
+                )
+            )
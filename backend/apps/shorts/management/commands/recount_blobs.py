@@ -0,0 +1,42 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from shorts.models.blob import Blob
+from shorts.models.video import Video
+from shorts.storage import content_addressed_storage
+
+
+class Command(BaseCommand):
+    """Repair blob reference counts from the Video rows referencing them.
+
+    Counts can drift when a request fails between storing a file and
+    saving its row. Blobs left without references are deleted.
+    """
+
+    help = "Recompute blob reference counts and delete unreferenced blobs."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the changes that would be made.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        references = Counter()
+        for names in Video.objects.values_list("video", "thumbnail").iterator():
+            references.update(name for name in names if name)
+
+        for blob in Blob.objects.order_by("id").iterator():
+            count = references[blob.name]
+            if count == blob.ref_count:
+                continue
+
+            self.stdout.write(f"Blob {blob.name}: {blob.ref_count} -> {count}")
+            if options["dry_run"]:
+                continue
+            if count:
+                Blob.objects.filter(pk=blob.pk).update(ref_count=count)
+            else:
+                blob.delete()
+                content_addressed_storage.delete(blob.name)
@@ -0,0 +1,185 @@
+import os
+import re
+from datetime import timedelta
+
+from core.sharded_upload_to import ShardedUploadTo
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from jobs.registry import enqueue
+from shorts.tasks import release_media_file
+
+# File fields moved into hash-sharded directories, as "app.Model.field".
+# With content-addressed storage (VIDEO_CONTENT_ADDRESSED_STORAGE) new
+# video and thumbnail files are already named blobs/ab/cd/<sha256>, so
+# for those fields only files saved before it was enabled are moved.
+SHARDED_FIELDS = [
+    "shorts.Video.video",
+    "shorts.Video.thumbnail",
+    "shorts.Video.storyboard",
+    "user_auth.User.picture",
+]
+
+
+class Command(BaseCommand):
+    """Move files stored in flat upload directories into sharded ones.
+
+    Rows are processed in primary key batches and only rows whose file is
+    still directly in the flat directory are selected, so an interrupted
+    run simply continues where it stopped when started again. A file that
+    was moved before its row could be updated is detected and only the row
+    is fixed.
+
+    Files are hard-linked to their new name and the old name is released
+    by a job once ``VIDEO_FILE_CACHE_TTL`` has passed, so stream workers
+    still holding the old path in their file caches keep serving it.
+    """
+
+    help = "Move flat media files into hash-sharded directories."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--field",
+            action="append",
+            dest="fields",
+            choices=SHARDED_FIELDS,
+            help="Only migrate the given field. May be repeated.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows loaded per query.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the moves that would be made.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        for label in options["fields"] or SHARDED_FIELDS:
+            app_label, model_name, field_name = label.split(".")
+            model = apps.get_model(app_label, model_name)
+            field = model._meta.get_field(field_name)
+            if not isinstance(field.upload_to, ShardedUploadTo):
+                raise CommandError(f"{label} does not use a sharded upload_to")
+
+            moved = self.migrate_field(model, field, options)
+            self.stdout.write(self.style.SUCCESS(f"Moved {moved} files of {label}"))
+
+    def migrate_field(self, model, field, options) -> int:
+        """Move the flat files of one field, returning how many were moved."""
+        directory = field.upload_to.directory.rstrip("/") + "/"
+        flat = model.objects.filter(
+            **{f"{field.name}__regex": rf"^{re.escape(directory)}[^/]+$"}
+        ).order_by("pk")
+
+        moved, last_pk = 0, None
+        while True:
+            batch = flat if last_pk is None else flat.filter(pk__gt=last_pk)
+            rows = list(batch.values_list("pk", field.name)[: options["batch_size"]])
+            if not rows:
+                return moved
+
+            release_at = timezone.now() + timedelta(
+                seconds=settings.VIDEO_FILE_CACHE_TTL
+            )
+
+            for pk, name in rows:
+                new_name = self.move_file(field, name, options["dry_run"])
+                if new_name is None:
+                    continue
+                if not options["dry_run"]:
+                    # Rows sharing the file all follow it to the new name
+                    model.objects.filter(**{field.name: name}).update(
+                        **{field.name: new_name}
+                    )
+                    enqueue(
+                        release_media_file,
+                        args=[f"{model._meta.label}.{field.name}", name],
+                        run_at=release_at,
+                    )
+                self.stdout.write(f"{model.__name__} {pk}: {name} -> {new_name}")
+                moved += 1
+            last_pk = rows[-1][0]
+
+    def move_file(self, field, name: str, dry_run: bool) -> str | None:
+        """Move a file to its sharded name and return that name.
+
+        Returns:
+            str | None: The new name, or None when the file is missing or
+            no name within the field's max_length is available.
+        """
+        storage = field.storage
+        new_name = fit_name(field.upload_to(None, name), field.max_length)
+        if new_name is None:
+            self.stderr.write(f"Sharded name too long for {field.name}: {name}")
+            return None
+
+        if not storage.exists(name):
+            # Moved by an interrupted run before its row was updated
+            if storage.exists(new_name):
+                return new_name
+            self.stderr.write(f"Missing file: {name}")
+            return None
+        if storage.exists(new_name) and self.is_same_file(storage, name, new_name):
+            # Linked by an interrupted run before its row was updated
+            return new_name
+
+        if storage.exists(new_name):
+            # A newer upload already took the sharded name
+            try:
+                new_name = storage.get_available_name(
+                    new_name, max_length=field.max_length
+                )
+            except SuspiciousFileOperation as error:
+                self.stderr.write(f"Cannot rename {name}: {error}")
+                return None
+        if dry_run:
+            return new_name
+
+        try:
+            source, target = storage.path(name), storage.path(new_name)
+        except NotImplementedError:
+            # Remote storages cannot link, the original is released later
+            with storage.open(name, "rb") as file:
+                return storage.save(new_name, file, max_length=field.max_length)
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            # Never replaces a file, unlike a content-addressed save
+            os.link(source, target)
+        except FileExistsError:
+            self.stderr.write(f"Cannot rename {name}: {new_name} exists")
+            return None
+        return new_name
+
+    def is_same_file(self, storage, name: str, new_name: str) -> bool:
+        """Return whether two names of a local storage link the same file."""
+        try:
+            return os.path.samefile(storage.path(name), storage.path(new_name))
+        except NotImplementedError:
+            return False
+
+
+def fit_name(name: str, max_length: int | None) -> str | None:
+    """Shorten a file name's root so the name fits ``max_length``.
+
+    The same name always gives the same result, so an interrupted run
+    finds the files it already moved.
+
+    Returns:
+        str | None: The name, or None if the root cannot be shortened enough.
+    """
+    if max_length is None or len(name) <= max_length:
+        return name
+
+    dir_name, file_name = os.path.split(name)
+    file_root, file_ext = os.path.splitext(file_name)
+    file_root = file_root[: len(file_root) - (len(name) - max_length)]
+    if not file_root:
+        return None
+    return os.path.join(dir_name, file_root + file_ext)
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import (
+    get_demotion_candidates,
+    get_promotion_candidates,
+    move_video_tier,
+)
+
+
+class Command(BaseCommand):
+    """Move videos between the hot and cold storage by their recent views.
+
+    Videos are promoted before others are demoted, so a run never fills
+    the hot storage with files it is about to move out again.
+    """
+
+    help = "Move unwatched videos to the cold storage and watched ones back."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=settings.VIDEO_TIER_BATCH_SIZE,
+            help="Videos moved in each direction per run.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the videos that would be moved.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        self.move(get_promotion_candidates(), Video.STORAGE_HOT, options)
+        self.move(get_demotion_candidates(), Video.STORAGE_COLD, options)
+
+    def move(self, queryset, tier: str, options) -> None:
+        moved = 0
+        for video in queryset[: options["limit"]]:
+            if options["dry_run"]:
+                self.stdout.write(f"Would move video {video.pk} to the {tier} tier")
+                continue
+            try:
+                if move_video_tier(video, tier):
+                    moved += 1
+            except OSError as error:
+                self.stderr.write(f"Failed video {video.pk}: {error}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Moved {moved} videos to the {tier} tier")
+        )
@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from shorts.models.video import Video
+from shorts.processing import process_pending_hls
+
+
+class Command(BaseCommand):
+    """Transcode uploaded videos into HLS renditions with a local ffmpeg.
+
+    Without ``--watch`` all pending videos are processed once. With
+    ``--watch`` the command runs as a local worker that keeps polling for
+    new uploads.
+    """
+
+    help = "Transcode pending videos into an HLS bitrate ladder."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--video-id",
+            type=int,
+            action="append",
+            dest="video_ids",
+            help="Only (re)transcode the given video ID. May be repeated.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Queue videos whose previous transcoding failed again.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of ffmpeg processes to run concurrently.",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep polling for pending videos instead of exiting.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10.0,
+            help="Seconds between polls in --watch mode.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queryset = Video.objects.all()
+        if options["video_ids"]:
+            queryset = queryset.filter(id__in=options["video_ids"])
+            queryset.update(hls_status=Video.HLS_PENDING)
+        elif options["retry_failed"]:
+            queryset.filter(hls_status=Video.HLS_FAILED).update(
+                hls_status=Video.HLS_PENDING
+            )
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            while True:
+                video_ids = list(
+                    queryset.filter(hls_status=Video.HLS_PENDING)
+                    .order_by("id")
+                    .values_list("id", flat=True)
+                )
+                for video_id, done in zip(
+                    video_ids, executor.map(process_pending_hls, video_ids)
+                ):
+                    if done:
+                        self.stdout.write(
+                            self.style.SUCCESS(f"Transcoded video {video_id}")
+                        )
+                    else:
+                        self.stdout.write(
+                            self.style.WARNING(f"Skipped or failed video {video_id}")
+                        )
+
+                if not options["watch"]:
+                    break
+                time.sleep(options["interval"])
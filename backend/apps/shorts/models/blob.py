@@ -0,0 +1,46 @@
+from django.db import models
+
+
+class Blob(models.Model):
+    """Model class for a content-addressed media file shared by reference"""
+
+    class Meta:
+        db_table = "blob"
+        verbose_name = "blob"
+        verbose_name_plural = "blobs"
+        ordering = ["-created_at"]
+
+    objects = models.Manager()
+
+    # Model fields for Blob
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        blank=False,
+        null=False,
+        help_text="Storage name of the file, derived from its digest",
+    )
+    sha256 = models.CharField(
+        max_length=64,
+        blank=False,
+        null=False,
+        db_index=True,
+        help_text="Hex SHA-256 digest of the file",
+    )
+    size = models.PositiveBigIntegerField(blank=False, null=False)
+    ref_count = models.PositiveIntegerField(
+        default=0,
+        blank=False,
+        null=False,
+        help_text="Number of file fields referencing this blob",
+    )
+    challenges = models.JSONField(
+        default=list,
+        blank=True,
+        null=False,
+        help_text="[offset, length, hex SHA-256] of byte ranges sampled on upload",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.name
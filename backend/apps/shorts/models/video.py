@@ -1,5 +1,12 @@
+from core.sharded_upload_to import ShardedUploadTo
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.core.files.storage import Storage
+from shorts.storage import (
+    get_cold_video_storage,
+    get_video_storage,
+    is_local_storage,
+)
 
 from .tag import Tag
 
@@ -22,6 +29,24 @@ class Video(models.Model):
         ("private", "Private"),
     ]
 
+    HLS_PENDING = "pending"
+    HLS_PROCESSING = "processing"
+    HLS_READY = "ready"
+    HLS_FAILED = "failed"
+    HLS_STATUS_CHOICES = [
+        (HLS_PENDING, "Pending"),
+        (HLS_PROCESSING, "Processing"),
+        (HLS_READY, "Ready"),
+        (HLS_FAILED, "Failed"),
+    ]
+
+    STORAGE_HOT = "hot"
+    STORAGE_COLD = "cold"
+    STORAGE_TIER_CHOICES = [
+        (STORAGE_HOT, "Hot"),
+        (STORAGE_COLD, "Cold"),
+    ]
+
     # Model fields for Video
     owner = models.ForeignKey(
         User,
@@ -43,12 +68,14 @@ class Video(models.Model):
             "does_not_exist": "Object does not exist",
         },
     )
+    # With content-addressed storage new files are named blobs/ab/cd/<sha256>
+    # and upload_to only shapes the names of plain storages
     video = models.FileField(
-        upload_to="shorts/videos/",
+        upload_to=ShardedUploadTo("shorts/videos/"),
         max_length=100,
         blank=False,
         null=False,
-        storage=None,
+        storage=get_video_storage,
         db_index=False,
         error_messages={
             "invalid": "No file was submitted",
@@ -60,11 +87,11 @@ class Video(models.Model):
         },
     )
     thumbnail = models.ImageField(
-        upload_to="shorts/thumbnails/",
+        upload_to=ShardedUploadTo("shorts/thumbnails/"),
         max_length=100,
         blank=True,
         null=True,
-        storage=None,
+        storage=get_video_storage,
         db_index=False,
         default=None,
         error_messages={
@@ -110,8 +137,163 @@ class Video(models.Model):
             "max_length": "Ensure this value has at most 10 characters",
         },
     )
+    hls_status = models.CharField(
+        max_length=10,
+        unique=False,
+        blank=True,
+        null=False,
+        db_index=True,
+        choices=HLS_STATUS_CHOICES,
+        default=HLS_PENDING,
+        error_messages={
+            "invalid": "Please choose a valid HLS status",
+            "max_length": "Ensure this value has at most 10 characters",
+        },
+    )
+    is_faststart = models.BooleanField(
+        default=False,
+        blank=True,
+        null=False,
+        db_index=True,
+        help_text="Whether the MP4 moov atom is stored before the media data",
+    )
+    storage_tier = models.CharField(
+        max_length=10,
+        unique=False,
+        blank=True,
+        null=False,
+        db_index=True,
+        choices=STORAGE_TIER_CHOICES,
+        default=STORAGE_HOT,
+        help_text="Storage holding the video file, see `manage.py tier_videos`",
+        error_messages={
+            "invalid": "Please choose a valid storage tier",
+            "max_length": "Ensure this value has at most 10 characters",
+        },
+    )
+    tiered_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the video file last moved between storage tiers",
+    )
+    sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        null=False,
+        db_index=True,
+        default="",
+        help_text="Hex SHA-256 digest of the video file computed during upload",
+    )
+    duration = models.FloatField(
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Duration in seconds, probed after upload",
+    )
+    width = models.PositiveIntegerField(blank=True, null=True)
+    height = models.PositiveIntegerField(blank=True, null=True, db_index=True)
+    bitrate = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        help_text="Overall bitrate in bits per second",
+    )
+    video_codec = models.CharField(max_length=20, blank=True, null=False, default="")
+    audio_codec = models.CharField(max_length=20, blank=True, null=False, default="")
+    file_size = models.PositiveBigIntegerField(
+        blank=True,
+        null=True,
+        help_text="Size of the video file in bytes",
+    )
+    keyframe_index = models.JSONField(
+        default=list,
+        blank=True,
+        null=False,
+        help_text="Sorted [milliseconds, byte offset] pairs of the MP4 keyframes",
+    )
+    thumbnails = models.JSONField(
+        default=dict,
+        blank=True,
+        null=False,
+        help_text="Width, height and WebP/JPEG names of each thumbnail size",
+    )
+    storyboard = models.ImageField(
+        upload_to=ShardedUploadTo("shorts/storyboards/"),
+        max_length=100,
+        blank=True,
+        null=True,
+        storage=None,
+        db_index=False,
+        default=None,
+        help_text="Sprite of preview frames tiled for seek-bar scrubbing",
+    )
+    storyboard_map = models.JSONField(
+        default=dict,
+        blank=True,
+        null=False,
+        help_text="Interval, tile size and [seconds, x, y] of each storyboard frame",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields owned by tier moves, which update rows without loading them
+    TIER_FIELDS = ("video", "storage_tier", "tiered_at")
+
     def __str__(self) -> str:
         return self.caption
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_tier = instance.get_tier_values()
+        return instance
+
+    def get_tier_values(self) -> dict:
+        """Return the stored values of the tier fields loaded on this instance."""
+        values = {}
+        for field_name in self.TIER_FIELDS:
+            if field_name in self.__dict__:
+                value = getattr(self, field_name)
+                values[field_name] = getattr(value, "name", value)
+        return values
+
+    def save(self, *args, **kwargs) -> None:
+        """Save the video without reverting a tier move made since it was loaded.
+
+        Full saves re-read the tier fields this instance did not change, so
+        a stale instance never points the row back at a file that moved.
+        """
+        loaded = getattr(self, "_loaded_tier", None)
+        if loaded and kwargs.get("update_fields") is None:
+            current = Video.objects.filter(pk=self.pk).values(*loaded).first()
+            changed = self.get_tier_values()
+            for field_name, value in (current or {}).items():
+                if changed[field_name] == loaded[field_name]:
+                    setattr(self, field_name, value)
+        super().save(*args, **kwargs)
+        self._loaded_tier = self.get_tier_values()
+
+    @classmethod
+    def get_tier_storage(cls, tier: str) -> Storage:
+        """Return the storage holding video files of a storage tier."""
+        if tier == cls.STORAGE_COLD:
+            return get_cold_video_storage()
+        return cls._meta.get_field("video").storage
+
+    def get_video_file_storage(self) -> Storage:
+        """Return the storage currently holding this video's file.
+
+        ``self.video.storage`` is always the hot storage, files moved to
+        the cold tier keep their name in the cold storage.
+        """
+        return self.get_tier_storage(self.storage_tier)
+
+    def has_local_file(self) -> bool:
+        """Return whether this video's file is on the local file system.
+
+        ffmpeg and the MP4 parsers can only process local files.
+        """
+        return is_local_storage(self.get_video_file_storage())
+
+    def get_video_file_path(self) -> str:
+        """Return the local path of this video's file in its current tier."""
+        return self.get_video_file_storage().path(self.video.name)
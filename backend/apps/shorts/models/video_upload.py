@@ -0,0 +1,151 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+User = get_user_model()
+
+
+class VideoUpload(models.Model):
+    """Model class for a resumable, chunked video upload session"""
+
+    class Meta:
+        db_table = "video_upload"
+        verbose_name = "video upload"
+        verbose_name_plural = "video uploads"
+        ordering = ["-created_at"]
+
+    objects = models.Manager()
+
+    # Model fields for VideoUpload
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=False,
+        related_name="video_uploads_as_owner",
+        related_query_name=None,
+        limit_choices_to={},
+        parent_link=False,
+        blank=False,
+        null=False,
+        db_index=True,
+        db_constraint=True,
+        error_messages={
+            "invalid": "Invalid value",
+            "invalid_choice": "Select a valid choice",
+            "null": "This field cannot be null",
+            "blank": "This field cannot be blank",
+            "does_not_exist": "Object does not exist",
+        },
+    )
+    filename = models.CharField(
+        max_length=100,
+        blank=False,
+        null=False,
+        error_messages={
+            "blank": "This field cannot be blank",
+            "max_length": "Ensure this value has at most 100 characters",
+        },
+    )
+    size = models.PositiveBigIntegerField(
+        blank=False,
+        null=False,
+        help_text="Total size of the file in bytes",
+    )
+    chunk_size = models.PositiveIntegerField(
+        blank=False,
+        null=False,
+        help_text="Size of every chunk except the last one in bytes",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"{self.owner} uploading {self.filename}"
+
+    @property
+    def total_chunks(self) -> int:
+        return max(-(-self.size // self.chunk_size), 1)
+
+    def get_chunk_length(self, index: int) -> int:
+        """Return the exact byte length expected for a chunk index."""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+
+class VideoUploadChunk(models.Model):
+    """Model class for a verified chunk of a VideoUpload"""
+
+    class Meta:
+        db_table = "video_upload_chunk"
+        verbose_name = "video upload chunk"
+        verbose_name_plural = "video upload chunks"
+        ordering = ["index"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["upload", "index"], name="unique_video_upload_chunk"
+            )
+        ]
+
+    objects = models.Manager()
+
+    # Model fields for VideoUploadChunk
+    upload = models.ForeignKey(
+        VideoUpload,
+        on_delete=models.CASCADE,
+        related_name="chunks",
+        blank=False,
+        null=False,
+        db_index=True,
+    )
+    index = models.PositiveIntegerField(blank=False, null=False)
+    checksum = models.CharField(
+        max_length=64,
+        blank=False,
+        null=False,
+        help_text="Hex SHA-256 digest of the chunk",
+    )
+    received_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Chunk {self.index} of {self.upload_id}"
+
+
+class VideoDirectUpload(models.Model):
+    """Model class for a pending upload straight to object storage"""
+
+    class Meta:
+        db_table = "video_direct_upload"
+        verbose_name = "video direct upload"
+        verbose_name_plural = "video direct uploads"
+        ordering = ["-created_at"]
+
+    objects = models.Manager()
+
+    # Model fields for VideoDirectUpload
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="video_direct_uploads_as_owner",
+        blank=False,
+        null=False,
+        db_index=True,
+    )
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        blank=False,
+        null=False,
+        help_text="Storage name of the object the client uploads",
+    )
+    size = models.PositiveBigIntegerField(
+        blank=False,
+        null=False,
+        help_text="Announced size of the file in bytes",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"{self.owner} uploading {self.name}"
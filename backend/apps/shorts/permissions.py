@@ -1,5 +1,7 @@
 from typing import Any, Literal
 
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
 from rest_framework.permissions import BasePermission
 from shorts.models.video import Video
 
@@ -9,3 +11,17 @@ class CanUpdateAndDelete(BasePermission):
         if request.method in ("PUT", "PATCH", "DELETE"):
             return obj.owner == request.user
         return True
+
+
+class HasStreamMetricsToken(BasePermission):
+    """Allow scrapers presenting the VIDEO_STREAM_METRICS_TOKEN bearer token.
+
+    The metrics endpoint is disabled while the token is not configured.
+    """
+
+    def has_permission(self, request, view) -> bool:
+        token = settings.VIDEO_STREAM_METRICS_TOKEN
+        if not token:
+            return False
+        header = request.headers.get("Authorization", "")
+        return constant_time_compare(header, f"Bearer {token}")
@@ -0,0 +1,61 @@
+"""
+Offline processing of uploaded short videos with a local ffmpeg.
+
+Includes:
+- FFmpegError: Raised when an ffmpeg or ffprobe command fails
+- run_ffmpeg: Runs a local ffmpeg command
+- is_faststart: Checks whether an MP4 has its moov atom first
+- ensure_faststart: Remuxes a video's MP4 so its moov atom comes first
+- build_keyframe_index: Parses an MP4's sample tables into keyframe offsets
+- index_keyframes: Stores the keyframe index of a video
+- find_keyframe: Looks up the keyframe at or before a timestamp
+- process_uploaded_video: Runs the post-upload steps of a new video
+- probe_media: Reads duration, resolution, bitrate and codecs with ffprobe
+- probe_video: Stores the probed metadata of a video on its row
+- transcode_to_hls: Transcodes a video into the HLS bitrate ladder
+- process_pending_hls: Claims and transcodes a pending video
+- generate_storyboard: Tiles preview frames into a scrubbing sprite
+- generate_thumbnails: Renders WebP and JPEG thumbnails in several sizes
+- get_demotion_candidates: Hot videos without recent views
+- get_promotion_candidates: Cold videos watched again
+- move_video_tier: Moves a video's file between the hot and cold storage
+"""
+
+from .faststart import ensure_faststart, is_faststart, remux_faststart
+from .ffmpeg import FFmpegError, run_ffmpeg
+from .hls import get_hls_dir, process_pending_hls, transcode_to_hls
+from .keyframes import build_keyframe_index, find_keyframe, index_keyframes
+from .pipeline import process_uploaded_video
+from .probe import probe_duration, probe_media, probe_video
+from .storyboard import build_storyboard_map, generate_storyboard
+from .thumbnails import delete_thumbnails, generate_thumbnails
+from .tiering import (
+    get_demotion_candidates,
+    get_promotion_candidates,
+    move_video_tier,
+)
+
+__all__ = [
+    "FFmpegError",
+    "run_ffmpeg",
+    "is_faststart",
+    "remux_faststart",
+    "ensure_faststart",
+    "build_keyframe_index",
+    "index_keyframes",
+    "find_keyframe",
+    "process_uploaded_video",
+    "get_hls_dir",
+    "transcode_to_hls",
+    "process_pending_hls",
+    "probe_duration",
+    "probe_media",
+    "probe_video",
+    "build_storyboard_map",
+    "generate_storyboard",
+    "generate_thumbnails",
+    "delete_thumbnails",
+    "get_demotion_candidates",
+    "get_promotion_candidates",
+    "move_video_tier",
+]
@@ -0,0 +1,125 @@
+import os
+import struct
+import tempfile
+from logging import getLogger
+
+from django.core.files import File
+from shorts.models.video import Video
+from shorts.storage import ContentAddressedStorage, hash_file
+
+from .ffmpeg import run_ffmpeg
+
+logger = getLogger(__name__)
+
+
+def is_faststart(path: str) -> bool:
+    """Return True if the MP4 ``moov`` atom comes before the ``mdat`` atom.
+
+    Only the top-level box headers are read, so this is cheap even for
+    large files.
+    """
+    with open(path, "rb") as file:
+        file_size = os.fstat(file.fileno()).st_size
+        offset = 0
+        while offset + 8 <= file_size:
+            file.seek(offset)
+            size, box_type = struct.unpack(">I4s", file.read(8))
+            if size == 1:
+                # 64-bit size stored right after the box type
+                if offset + 16 > file_size:
+                    return False
+                size = struct.unpack(">Q", file.read(8))[0]
+            elif size == 0:
+                # Box extends to the end of the file
+                size = file_size - offset
+            if box_type == b"moov":
+                return True
+            if box_type == b"mdat" or size < 8:
+                return False
+            offset += size
+    return False
+
+
+def write_faststart_copy(source: str, target: str) -> None:
+    """Write a copy of an MP4 with the ``moov`` atom in front, without re-encoding."""
+    run_ffmpeg(
+        [
+            "-y",
+            "-i",
+            source,
+            "-map",
+            "0:v",
+            "-map",
+            "0:a?",
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            "-f",
+            "mp4",
+            target,
+        ]
+    )
+
+
+def remux_faststart(path: str) -> None:
+    """Move the ``moov`` atom to the front of an MP4 without re-encoding.
+
+    The remuxed copy is written next to the original and swapped in with
+    an atomic rename.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix=".mp4", dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        write_faststart_copy(path, temp_path)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def store_faststart_blob(video: Video) -> None:
+    """Store a faststart copy of a blob-stored video as a new blob.
+
+    Blobs are named after their digest and may be shared with other
+    videos, so they are never rewritten. The video is moved to the new
+    blob and its save signal releases the reference to the old one.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix=".mp4")
+    os.close(fd)
+    try:
+        write_faststart_copy(video.get_video_file_path(), temp_path)
+        with open(temp_path, "rb") as file:
+            remuxed = File(file, os.path.basename(video.video.name))
+            remuxed.sha256 = hash_file(remuxed)
+            video.video.save(remuxed.name, remuxed, save=False)
+        video.sha256 = remuxed.sha256
+        video.is_faststart = True
+        video.save(update_fields=["video", "sha256", "is_faststart"])
+    finally:
+        os.remove(temp_path)
+
+
+def ensure_faststart(video: Video) -> bool:
+    """Make a video's file faststart and record it on the model.
+
+    Returns:
+        bool: True if the file had to be remuxed.
+    """
+    if video.is_faststart:
+        return False
+
+    path = video.get_video_file_path()
+    remuxed = not is_faststart(path)
+    if remuxed and isinstance(video.get_video_file_storage(), ContentAddressedStorage):
+        store_faststart_blob(video)
+        logger.info(f"Stored faststart copy of {path} as: {video.video.name}")
+        return True
+    if remuxed:
+        remux_faststart(path)
+        logger.info(f"Relocated moov atom to the front of: {path}")
+
+    video.is_faststart = True
+    video.save(update_fields=["is_faststart"])
+    return remuxed
@@ -0,0 +1,42 @@
+import subprocess
+from logging import getLogger
+
+from django.conf import settings
+
+logger = getLogger(__name__)
+
+
+class FFmpegError(Exception):
+    """Raised when an ffmpeg or ffprobe command fails."""
+
+
+def run_ffmpeg(args: list[str], binary: str | None = None) -> str:
+    """Run a local ffmpeg (or ffprobe) command and return its stdout.
+
+    Args:
+        args (list[str]): Command line arguments, without the binary.
+        binary (str | None): Binary to run, defaults to FFMPEG_BINARY.
+
+    Returns:
+        str: The decoded standard output of the command.
+
+    Raises:
+        FFmpegError: If the binary is missing or exits with an error.
+    """
+    command = [binary or settings.FFMPEG_BINARY, *args]
+    logger.debug(f"Running command: {' '.join(command)}")
+    try:
+        result = subprocess.run(
+            command,
+            check=True,
+            capture_output=True,
+            timeout=settings.FFMPEG_TIMEOUT,
+        )
+    except FileNotFoundError as error:
+        raise FFmpegError(f"Binary not found: {command[0]}") from error
+    except subprocess.TimeoutExpired as error:
+        raise FFmpegError(f"Command timed out: {' '.join(command)}") from error
+    except subprocess.CalledProcessError as error:
+        stderr = error.stderr.decode("utf-8", "replace").strip()
+        raise FFmpegError(stderr.splitlines()[-1] if stderr else str(error)) from error
+    return result.stdout.decode("utf-8", "replace")
@@ -0,0 +1,162 @@
+import os
+import secrets
+import shutil
+import tempfile
+from logging import getLogger
+
+from django.conf import settings
+from shorts.models.video import Video
+
+from .ffmpeg import run_ffmpeg
+
+logger = getLogger(__name__)
+
+# Name of the master playlist inside a video's HLS directory
+MASTER_PLAYLIST = "master.m3u8"
+
+
+def get_hls_dir(video_id: int) -> str:
+    """Return the absolute directory holding a video's HLS renditions."""
+    return os.path.join(settings.MEDIA_ROOT, settings.VIDEO_HLS_DIR, str(video_id))
+
+
+def transcode_rendition(source: str, output_dir: str, rendition: dict) -> None:
+    """Transcode one ladder rung into fMP4 segments and a media playlist."""
+    rendition_dir = os.path.join(output_dir, rendition["name"])
+    os.makedirs(rendition_dir, exist_ok=True)
+    run_ffmpeg(
+        [
+            "-y",
+            "-i",
+            source,
+            "-map",
+            "0:v:0",
+            "-map",
+            "0:a:0?",
+            # Never upscale beyond the source height
+            "-vf",
+            f"scale=-2:'min(ih,{rendition['height']})'",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            "-b:v",
+            rendition["video_bitrate"],
+            "-maxrate",
+            rendition["video_bitrate"],
+            "-bufsize",
+            rendition["video_bitrate"],
+            # Keyframe at every segment boundary
+            "-force_key_frames",
+            f"expr:gte(t,n_forced*{settings.VIDEO_HLS_SEGMENT_SECONDS})",
+            "-c:a",
+            "aac",
+            "-b:a",
+            rendition["audio_bitrate"],
+            "-f",
+            "hls",
+            "-hls_time",
+            str(settings.VIDEO_HLS_SEGMENT_SECONDS),
+            "-hls_playlist_type",
+            "vod",
+            "-hls_segment_type",
+            "fmp4",
+            "-hls_flags",
+            "independent_segments",
+            "-hls_fmp4_init_filename",
+            "init.mp4",
+            "-hls_segment_filename",
+            os.path.join(rendition_dir, "segment_%05d.m4s"),
+            os.path.join(rendition_dir, "index.m3u8"),
+        ]
+    )
+
+
+def write_master_playlist(output_dir: str, ladder: list[dict], generation: str) -> None:
+    """Write the master playlist pointing at every rendition playlist.
+
+    Renditions live in a ``generation`` directory unique to a transcode, so
+    segments of a re-transcoded video get new URLs and may be cached forever.
+    """
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for rendition in ladder:
+        bandwidth = sum(
+            int(rendition[key].rstrip("k")) * 1000
+            for key in ("video_bitrate", "audio_bitrate")
+        )
+        lines.append(f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth}")
+        lines.append(f"{generation}/{rendition['name']}/index.m3u8")
+    with open(os.path.join(output_dir, MASTER_PLAYLIST), "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def transcode_to_hls(video: Video) -> str:
+    """Transcode a video into the configured HLS bitrate ladder.
+
+    Renditions are written to a temporary directory next to the final one
+    and moved into place once complete, so the segment endpoint never
+    serves a half-written ladder. Each transcode nests its renditions in a
+    new generation directory, so no segment URL is ever reused.
+
+    Args:
+        video (Video): The video whose uploaded file is transcoded.
+
+    Returns:
+        str: The absolute directory holding the master playlist.
+    """
+    hls_dir = get_hls_dir(video.pk)
+    parent_dir = os.path.dirname(hls_dir)
+    os.makedirs(parent_dir, exist_ok=True)
+
+    work_dir = tempfile.mkdtemp(prefix=f".{video.pk}-", dir=parent_dir)
+    generation = secrets.token_hex(4)
+    try:
+        for rendition in settings.VIDEO_HLS_LADDER:
+            transcode_rendition(
+                video.get_video_file_path(),
+                os.path.join(work_dir, generation),
+                rendition,
+            )
+        write_master_playlist(work_dir, settings.VIDEO_HLS_LADDER, generation)
+
+        shutil.rmtree(hls_dir, ignore_errors=True)
+        os.rename(work_dir, hls_dir)
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    logger.info(f"HLS renditions ready for video {video.pk} at: {hls_dir}")
+    return hls_dir
+
+
+def process_pending_hls(video_id: int) -> bool:
+    """Claim a pending video and transcode it, recording the outcome.
+
+    The claim is a conditional update, so several workers can poll the
+    same table without transcoding a video twice.
+
+    Returns:
+        bool: True if the video was claimed and transcoded successfully.
+    """
+    claimed = Video.objects.filter(id=video_id, hls_status=Video.HLS_PENDING).update(
+        hls_status=Video.HLS_PROCESSING
+    )
+    if not claimed:
+        return False
+
+    video = Video.objects.get(id=video_id)
+    if not video.has_local_file():
+        # ffmpeg needs the source on the local disk, retry once it is local
+        logger.info(f"Skipped HLS transcoding of remote video {video_id}")
+        Video.objects.filter(id=video_id).update(hls_status=Video.HLS_FAILED)
+        return False
+
+    try:
+        transcode_to_hls(video)
+    except Exception as error:
+        logger.error(f"HLS transcoding failed for video {video_id}: {error}")
+        Video.objects.filter(id=video_id).update(hls_status=Video.HLS_FAILED)
+        return False
+
+    Video.objects.filter(id=video_id).update(hls_status=Video.HLS_READY)
+    return True
@@ -0,0 +1,190 @@
+import os
+import struct
+from bisect import bisect_right
+from logging import getLogger
+from typing import BinaryIO, Iterator
+
+from shorts.models.video import Video
+
+logger = getLogger(__name__)
+
+# Boxes whose payload is a list of child boxes
+CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def iter_boxes(data: bytes, start: int = 0, end: int | None = None) -> Iterator:
+    """Yield ``(type, payload_start, box_end)`` for the boxes in ``data``."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def find_box(data: bytes, path: list[bytes], start: int = 0, end=None):
+    """Return ``(payload_start, box_end)`` of the first box along ``path``."""
+    for box_type, payload_start, box_end in iter_boxes(data, start, end):
+        if box_type == path[0]:
+            if len(path) == 1:
+                return payload_start, box_end
+            return find_box(data, path[1:], payload_start, box_end)
+    return None
+
+
+def read_moov(file: BinaryIO) -> bytes | None:
+    """Read the top-level ``moov`` box of an MP4 file into memory."""
+    file_size = os.fstat(file.fileno()).st_size
+    offset = 0
+    while offset + 8 <= file_size:
+        file.seek(offset)
+        size, box_type = struct.unpack(">I4s", file.read(8))
+        if size == 1:
+            # 64-bit size stored right after the box type
+            if offset + 16 > file_size:
+                return None
+            size = struct.unpack(">Q", file.read(8))[0]
+        elif size == 0:
+            size = file_size - offset
+        if size < 8:
+            return None
+        if box_type == b"moov":
+            file.seek(offset)
+            return file.read(size)
+        offset += size
+    return None
+
+
+def parse_video_track(data: bytes, trak: tuple[int, int]) -> list[list[int]] | None:
+    """Return ``[milliseconds, byte_offset]`` of every sync sample of a video track."""
+    hdlr = find_box(data, [b"mdia", b"hdlr"], *trak)
+    if hdlr is None or data[hdlr[0] + 8 : hdlr[0] + 12] != b"vide":
+        return None
+
+    mdhd = find_box(data, [b"mdia", b"mdhd"], *trak)
+    stbl = find_box(data, [b"mdia", b"minf", b"stbl"], *trak)
+    if mdhd is None or stbl is None:
+        return None
+    version = data[mdhd[0]]
+    timescale_at = mdhd[0] + (20 if version == 1 else 12)
+    timescale = struct.unpack_from(">I", data, timescale_at)[0]
+
+    tables = {
+        box_type: payload_start
+        for box_type, payload_start, _ in iter_boxes(data, *stbl)
+    }
+    if b"stts" not in tables or b"stsz" not in tables or b"stsc" not in tables:
+        return None
+
+    def entries(box_type: bytes, fmt: str) -> list[tuple]:
+        start = tables[box_type]
+        count = struct.unpack_from(">I", data, start + 4)[0]
+        return list(
+            struct.iter_unpack(fmt, data[start + 8 :][: count * struct.calcsize(fmt)])
+        )
+
+    # Sample sizes
+    stsz = tables[b"stsz"]
+    sample_size, sample_count = struct.unpack_from(">II", data, stsz + 4)
+    if sample_size:
+        sizes = [sample_size] * sample_count
+    else:
+        sizes = list(struct.unpack_from(f">{sample_count}I", data, stsz + 12))
+
+    # Chunk offsets
+    if b"co64" in tables:
+        chunk_offsets = [offset for (offset,) in entries(b"co64", ">Q")]
+    elif b"stco" in tables:
+        chunk_offsets = [offset for (offset,) in entries(b"stco", ">I")]
+    else:
+        return None
+
+    # Sync samples, all samples are sync samples without an stss box
+    sync = None
+    if b"stss" in tables:
+        sync = {number - 1 for (number,) in entries(b"stss", ">I")}
+
+    # Decode times per sample
+    times = []
+    elapsed = 0
+    for count, delta in entries(b"stts", ">II"):
+        for _ in range(count):
+            times.append(elapsed)
+            elapsed += delta
+
+    # Walk the chunks to find each sample's byte offset
+    stsc = entries(b"stsc", ">III")
+    index = []
+    sample = 0
+    for entry, (first_chunk, per_chunk, _) in enumerate(stsc):
+        last_chunk = (
+            stsc[entry + 1][0] - 1 if entry + 1 < len(stsc) else len(chunk_offsets)
+        )
+        for chunk in range(first_chunk - 1, last_chunk):
+            offset = chunk_offsets[chunk]
+            for _ in range(per_chunk):
+                if sample >= sample_count:
+                    break
+                if (sync is None or sample in sync) and sample < len(times):
+                    index.append([times[sample] * 1000 // timescale, offset])
+                offset += sizes[sample]
+                sample += 1
+    return index
+
+
+def build_keyframe_index(path: str) -> list[list[int]]:
+    """Parse an MP4's sample tables into a keyframe index.
+
+    Returns:
+        list[list[int]]: ``[milliseconds, byte_offset]`` pairs sorted by
+        time, or an empty list for fragmented or unparsable files.
+    """
+    with open(path, "rb") as file:
+        try:
+            data = read_moov(file)
+        except struct.error:
+            data = None
+    if data is None:
+        return []
+
+    moov = (8, len(data))
+    for box_type, payload_start, box_end in iter_boxes(data, *moov):
+        if box_type != b"trak":
+            continue
+        try:
+            index = parse_video_track(data, (payload_start, box_end))
+        except (struct.error, IndexError, ZeroDivisionError):
+            index = None
+        if index:
+            return sorted(index)
+    return []
+
+
+def index_keyframes(video: Video) -> int:
+    """Build and store the keyframe index of a video.
+
+    Returns:
+        int: The number of keyframes indexed.
+    """
+    video.keyframe_index = build_keyframe_index(video.get_video_file_path())
+    video.save(update_fields=["keyframe_index"])
+    logger.info(f"Indexed {len(video.keyframe_index)} keyframes of video {video.pk}")
+    return len(video.keyframe_index)
+
+
+def find_keyframe(index: list[list[int]], seconds: float) -> list[int] | None:
+    """Return the last ``[milliseconds, byte_offset]`` keyframe at or before ``seconds``."""
+    if not index:
+        return None
+    position = bisect_right(index, [int(seconds * 1000), float("inf")])
+    return index[max(position - 1, 0)]
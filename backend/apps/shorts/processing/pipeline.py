@@ -0,0 +1,28 @@
+from logging import getLogger
+
+from shorts.models.video import Video
+
+from .faststart import ensure_faststart
+from .ffmpeg import FFmpegError
+from .keyframes import index_keyframes
+
+logger = getLogger(__name__)
+
+
+def process_uploaded_video(video: Video) -> None:
+    """Run the synchronous post-upload steps of a newly created video.
+
+    Failures are logged rather than raised, so a video is still created
+    when a step fails and can be fixed later by the backfill commands.
+    """
+    # Relocate the moov atom so playback can start from the first range
+    try:
+        ensure_faststart(video)
+    except (FFmpegError, OSError) as error:
+        logger.error(f"Faststart remux failed for video {video.pk}: {error}")
+
+    # Index keyframe offsets after remuxing, which moves the media data
+    try:
+        index_keyframes(video)
+    except OSError as error:
+        logger.error(f"Keyframe indexing failed for video {video.pk}: {error}")
@@ -0,0 +1,78 @@
+import json
+import os
+from logging import getLogger
+
+from django.conf import settings
+from shorts.models.video import Video
+
+from .ffmpeg import FFmpegError, run_ffmpeg
+
+logger = getLogger(__name__)
+
+
+def run_ffprobe(path: str, entries: str) -> dict:
+    """Run ffprobe on a file and return its JSON output."""
+    output = run_ffmpeg(
+        ["-v", "error", "-show_entries", entries, "-of", "json", path],
+        binary=settings.FFPROBE_BINARY,
+    )
+    try:
+        return json.loads(output)
+    except ValueError as error:
+        raise FFmpegError(f"Unreadable ffprobe output for: {path}") from error
+
+
+def probe_duration(path: str) -> float:
+    """Return the duration of a media file in seconds using ffprobe."""
+    try:
+        return float(run_ffprobe(path, "format=duration")["format"]["duration"])
+    except (KeyError, TypeError, ValueError) as error:
+        raise FFmpegError(f"Unknown duration of: {path}") from error
+
+
+def probe_media(path: str) -> dict:
+    """Return the technical metadata of a video file.
+
+    Returns:
+        dict: ``duration`` (seconds), ``width``, ``height``, ``bitrate``
+        (bits per second), ``video_codec``, ``audio_codec`` and
+        ``file_size`` (bytes). Values ffprobe cannot tell are None.
+    """
+    data = run_ffprobe(
+        path,
+        "format=duration,bit_rate:stream=codec_type,codec_name,width,height",
+    )
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), {})
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), {})
+    media_format = data.get("format", {})
+
+    def number(value, cast):
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return None
+
+    return {
+        "duration": number(media_format.get("duration"), float),
+        "width": video.get("width"),
+        "height": video.get("height"),
+        "bitrate": number(media_format.get("bit_rate"), int),
+        "video_codec": video.get("codec_name", ""),
+        "audio_codec": audio.get("codec_name", ""),
+        "file_size": os.path.getsize(path),
+    }
+
+
+def probe_video(video: Video) -> dict:
+    """Probe a video's file once and store its metadata on the row.
+
+    Returns:
+        dict: The stored metadata.
+    """
+    metadata = probe_media(video.get_video_file_path())
+    for field_name, value in metadata.items():
+        setattr(video, field_name, value)
+    video.save(update_fields=list(metadata))
+    logger.info(f"Probed video {video.pk}: {metadata}")
+    return metadata
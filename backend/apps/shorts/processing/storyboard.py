@@ -0,0 +1,107 @@
+import hashlib
+import math
+import os
+import tempfile
+from logging import getLogger
+
+from django.conf import settings
+from django.core.files import File
+from shorts.models.video import Video
+
+from .ffmpeg import run_ffmpeg
+from .probe import probe_duration
+
+logger = getLogger(__name__)
+
+
+def build_storyboard_map(duration: float) -> dict:
+    """Plan the frame times and tile coordinates of a storyboard sprite.
+
+    The interval grows for long videos so a sprite never holds more than
+    VIDEO_STORYBOARD_MAX_FRAMES tiles.
+    """
+    interval = max(
+        settings.VIDEO_STORYBOARD_INTERVAL,
+        duration / settings.VIDEO_STORYBOARD_MAX_FRAMES,
+    )
+    count = max(math.ceil(duration / interval), 1)
+    columns = min(settings.VIDEO_STORYBOARD_COLUMNS, count)
+    width = settings.VIDEO_STORYBOARD_TILE_WIDTH
+    height = settings.VIDEO_STORYBOARD_TILE_HEIGHT
+    return {
+        "interval": round(interval, 3),
+        "width": width,
+        "height": height,
+        "columns": columns,
+        "rows": math.ceil(count / columns),
+        "frames": [
+            [
+                round(index * interval, 3),
+                index % columns * width,
+                index // columns * height,
+            ]
+            for index in range(count)
+        ],
+    }
+
+
+def render_storyboard(source: str, output: str, storyboard_map: dict) -> None:
+    """Extract frames at the planned interval and tile them into one image."""
+    width, height = storyboard_map["width"], storyboard_map["height"]
+    run_ffmpeg(
+        [
+            "-y",
+            "-i",
+            source,
+            "-an",
+            "-vf",
+            ",".join(
+                [
+                    f"fps=1/{storyboard_map['interval']}",
+                    # Letterbox every frame into a fixed tile
+                    f"scale={width}:{height}:force_original_aspect_ratio=decrease",
+                    f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2",
+                    f"tile={storyboard_map['columns']}x{storyboard_map['rows']}",
+                ]
+            ),
+            "-frames:v",
+            "1",
+            "-q:v",
+            str(settings.VIDEO_STORYBOARD_QUALITY),
+            output,
+        ]
+    )
+
+
+def generate_storyboard(video: Video) -> dict:
+    """Render a video's storyboard sprite and store it with its coordinate map.
+
+    The sprite name carries a digest of its content, so its URL changes
+    whenever it is regenerated and clients may cache it forever.
+
+    Returns:
+        dict: The stored coordinate map.
+    """
+    source = video.get_video_file_path()
+    storyboard_map = build_storyboard_map(video.duration or probe_duration(source))
+
+    fd, temp_path = tempfile.mkstemp(suffix=".jpg")
+    os.close(fd)
+    try:
+        render_storyboard(source, temp_path, storyboard_map)
+        with open(temp_path, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()[:12]
+            file.seek(0)
+
+            previous = video.storyboard.name if video.storyboard else None
+            video.storyboard.save(f"{video.pk}-{digest}.jpg", File(file), save=False)
+    finally:
+        os.remove(temp_path)
+
+    if previous and previous != video.storyboard.name:
+        video.storyboard.storage.delete(previous)
+
+    video.storyboard_map = storyboard_map
+    video.save(update_fields=["storyboard", "storyboard_map"])
+    logger.info(f"Storyboard ready for video {video.pk}: {video.storyboard.name}")
+    return storyboard_map
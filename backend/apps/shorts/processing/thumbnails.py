@@ -0,0 +1,118 @@
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+from logging import getLogger
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+from shorts.models.video import Video
+
+from .ffmpeg import run_ffmpeg
+
+logger = getLogger(__name__)
+
+# Pillow format, file extension and save options of each rendition format
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def extract_frame(source: str, output: str) -> None:
+    """Write the most representative of the first frames of a video as a JPEG.
+
+    ffmpeg's ``thumbnail`` filter picks the frame closest to the average
+    of a batch, which skips black fades and transition frames.
+    """
+    run_ffmpeg(
+        [
+            "-y",
+            "-i",
+            source,
+            "-an",
+            "-vf",
+            f"thumbnail={settings.VIDEO_THUMBNAIL_SAMPLE_FRAMES}",
+            "-frames:v",
+            "1",
+            "-q:v",
+            "2",
+            output,
+        ]
+    )
+
+
+def render_thumbnails(image: Image.Image, video_id: int) -> dict:
+    """Save every configured size of an image in each rendition format.
+
+    File names carry a digest of their content, so the URLs change when
+    the renditions are regenerated and clients may cache them forever.
+
+    Returns:
+        dict: Width, height and storage name per format, keyed by size.
+    """
+    renditions = {}
+    for size, width in settings.VIDEO_THUMBNAIL_SIZES.items():
+        resized = image.copy()
+        # Fit the width without ever upscaling, keeping the aspect ratio
+        resized.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+
+        rendition = {"width": resized.width, "height": resized.height}
+        for format_key, (format_name, ext, options) in THUMBNAIL_FORMATS.items():
+            buffer = BytesIO()
+            resized.save(buffer, format_name, **options)
+            content = buffer.getvalue()
+            digest = hashlib.sha256(content).hexdigest()[:12]
+            name = f"{settings.VIDEO_THUMBNAIL_DIR}/{video_id}/{size}-{digest}.{ext}"
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(content))
+            rendition[format_key] = name
+        renditions[size] = rendition
+    return renditions
+
+
+def delete_thumbnails(renditions: dict) -> None:
+    """Remove the files of previously generated renditions."""
+    for rendition in renditions.values():
+        for format_key in THUMBNAIL_FORMATS:
+            if rendition.get(format_key):
+                default_storage.delete(rendition[format_key])
+
+
+def generate_thumbnails(video: Video) -> dict:
+    """Generate the thumbnail renditions of a video and store them on the model.
+
+    The uploaded ``Video.thumbnail`` is used as the source when there is
+    one, otherwise a representative frame is extracted from the video.
+
+    Returns:
+        dict: The stored renditions keyed by size.
+    """
+    if video.thumbnail:
+        with video.thumbnail.open("rb") as file:
+            image = ImageOps.exif_transpose(Image.open(file)).convert("RGB")
+    else:
+        fd, frame_path = tempfile.mkstemp(suffix=".jpg")
+        os.close(fd)
+        try:
+            extract_frame(video.get_video_file_path(), frame_path)
+            with Image.open(frame_path) as frame:
+                image = frame.convert("RGB")
+        finally:
+            os.remove(frame_path)
+
+    previous = video.thumbnails
+    video.thumbnails = render_thumbnails(image, video.pk)
+    video.save(update_fields=["thumbnails"])
+    delete_thumbnails(
+        {
+            size: rendition
+            for size, rendition in previous.items()
+            if rendition != video.thumbnails.get(size)
+        }
+    )
+
+    logger.info(f"Thumbnails ready for video {video.pk}")
+    return video.thumbnails
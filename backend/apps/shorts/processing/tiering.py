@@ -0,0 +1,90 @@
+from datetime import timedelta
+from logging import getLogger
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Count, Exists, OuterRef, Q, QuerySet
+from django.utils import timezone
+from jobs.registry import enqueue
+from shorts.models.video import Video
+from shorts.models.view import View
+from shorts.streaming.cache import video_file_cache
+from shorts.streaming.prefix_cache import video_prefix_cache
+
+logger = getLogger(__name__)
+
+
+def get_demotion_candidates() -> QuerySet[Video]:
+    """Return hot videos without a view in the last ``VIDEO_TIER_COLD_AFTER`` days.
+
+    Videos uploaded or promoted within that time are left alone, so a
+    promoted video is not moved back before it had time to be watched.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.VIDEO_TIER_COLD_AFTER)
+    recent_views = View.objects.filter(video=OuterRef("pk"), timestamp__gte=cutoff)
+    return (
+        Video.objects.filter(storage_tier=Video.STORAGE_HOT, created_at__lt=cutoff)
+        .filter(Q(tiered_at__isnull=True) | Q(tiered_at__lt=cutoff))
+        .exclude(Exists(recent_views))
+        .order_by("id")
+    )
+
+
+def get_promotion_candidates() -> QuerySet[Video]:
+    """Return cold videos with enough views in the promotion window."""
+    since = timezone.now() - timedelta(hours=settings.VIDEO_TIER_PROMOTE_WINDOW)
+    return (
+        Video.objects.filter(storage_tier=Video.STORAGE_COLD)
+        .annotate(
+            recent_views=Count(
+                "views_as_video", filter=Q(views_as_video__timestamp__gte=since)
+            )
+        )
+        .filter(recent_views__gte=settings.VIDEO_TIER_PROMOTE_VIEWS)
+        .order_by("-recent_views")
+    )
+
+
+def move_video_tier(video: Video, tier: str) -> bool:
+    """Move a video's file to the storage of another tier.
+
+    The file is copied first and the row is switched with a conditional
+    update, so streams keep working from the old copy until the switch and
+    a video changed in the meantime is left untouched. Other workers keep
+    the old path in their file caches and clients hold presigned URLs to
+    it, so the old copy is only released ``VIDEO_TIER_RELEASE_DELAY``
+    seconds later. Content-addressed blobs are only removed with their
+    last reference.
+
+    Returns:
+        bool: True if the video was moved.
+    """
+    if video.storage_tier == tier:
+        return False
+
+    source = video.get_video_file_storage()
+    target = Video.get_tier_storage(tier)
+    name = video.video.name
+    with source.open(name, "rb") as file:
+        # The target keeps the name unless it already holds another file
+        new_name = target.save(name, File(file, name))
+
+    updated = Video.objects.filter(
+        pk=video.pk, video=name, storage_tier=video.storage_tier
+    ).update(video=new_name, storage_tier=tier, tiered_at=timezone.now())
+    if not updated:
+        target.delete(new_name)
+        return False
+
+    # shorts.tasks imports this module, so the task is imported late
+    from shorts.tasks import release_tier_file
+
+    enqueue(
+        release_tier_file,
+        args=[video.storage_tier, name],
+        run_at=timezone.now() + timedelta(seconds=settings.VIDEO_TIER_RELEASE_DELAY),
+    )
+    video_file_cache.invalidate(video.pk)
+    video_prefix_cache.invalidate(video.pk)
+    logger.info(f"Moved video {video.pk} to the {tier} tier as: {new_name}")
+    return True
@@ -1,15 +1,42 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
 from rest_core.serializers.mixins import FileFieldUrlMixin, RecordsCreationMixin
-from rest_framework.serializers import ModelSerializer, SerializerMethodField
+from rest_framework.serializers import (
+    ModelSerializer,
+    PrimaryKeyRelatedField,
+    Serializer,
+    SerializerMethodField,
+    ValidationError,
+)
 from shorts.models.comment import Comment
 from shorts.models.like import Like
+from shorts.models.tag import Tag
 from shorts.models.video import Video
 from shorts.models.view import View
+from shorts.streaming import sign_stream_token
+from shorts.uploads import StagedUploadedFile
 from user_auth.serializers.user_serializers import UserPublicSerializer
 
+from core.url_builder import URLBuilder
+
 from .tag import TagSerializer
 
 
-class VideoSerializer(RecordsCreationMixin, FileFieldUrlMixin, ModelSerializer):
+class VideoTagsMixin(Serializer):
+    """Writable ``tag_ids`` shared by every serializer that creates videos"""
+
+    tag_ids = PrimaryKeyRelatedField(
+        source="tags",
+        many=True,
+        queryset=Tag.objects.all(),
+        required=False,
+        write_only=True,
+    )
+
+
+class VideoSerializer(
+    VideoTagsMixin, RecordsCreationMixin, FileFieldUrlMixin, ModelSerializer
+):
     """Serializer class for Video"""
 
     # Call nested serializers
@@ -18,6 +45,8 @@ class VideoSerializer(RecordsCreationMixin, FileFieldUrlMixin, ModelSerializer):
     total_views = SerializerMethodField()
     total_likes = SerializerMethodField()
     total_comments = SerializerMethodField()
+    stream_url = SerializerMethodField()
+    thumbnail_rendition = SerializerMethodField()
 
     class Meta:
         model = Video
@@ -26,20 +55,58 @@ class VideoSerializer(RecordsCreationMixin, FileFieldUrlMixin, ModelSerializer):
             "owner",
             "video",
             "thumbnail",
+            "thumbnail_rendition",
             "caption",
             "tags",
+            "tag_ids",
             "total_views",
             "total_likes",
             "total_comments",
+            "stream_url",
             "privacy",
+            "hls_status",
+            "storage_tier",
+            "duration",
+            "width",
+            "height",
+            "bitrate",
+            "video_codec",
+            "audio_codec",
+            "file_size",
             "updated_at",
         ]
         read_only_fields = [
             "id",
             "owner",
+            "hls_status",
+            "storage_tier",
+            "duration",
+            "width",
+            "height",
+            "bitrate",
+            "video_codec",
+            "audio_codec",
+            "file_size",
             "updated_at",
         ]
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # The field's storage only knows hot files, cold ones live elsewhere
+        if instance.storage_tier == Video.STORAGE_COLD and data.get("video"):
+            request = self.context.get("request")
+            url = instance.get_video_file_storage().url(instance.video.name)
+            data["video"] = request.build_absolute_uri(url) if request else url
+        return data
+
+    def validate_video(self, value):
+        # Staged uploads carry a MIME type sniffed from their content
+        if isinstance(value, StagedUploadedFile) and not value.content_type.startswith(
+            "video/"
+        ):
+            raise ValidationError("Upload a valid video file.")
+        return value
+
     def get_total_views(self, obj) -> int:
         return View.objects.filter(video=obj.id).count()
 
@@ -48,3 +115,51 @@ class VideoSerializer(RecordsCreationMixin, FileFieldUrlMixin, ModelSerializer):
 
     def get_total_comments(self, obj) -> int:
         return Comment.objects.filter(video=obj.id).count()
+
+    def get_thumbnail_rendition(self, obj) -> dict | None:
+        """Return the WebP and JPEG URLs of the thumbnail size of this context."""
+        size = self.context.get("thumbnail_size", settings.VIDEO_THUMBNAIL_LIST_SIZE)
+        rendition = obj.thumbnails.get(size)
+        if rendition is None:
+            return None
+
+        request = self.context.get("request")
+        data = {
+            "size": size,
+            "width": rendition["width"],
+            "height": rendition["height"],
+        }
+        for format_key in ("webp", "jpeg"):
+            url = default_storage.url(rendition[format_key])
+            data[format_key] = request.build_absolute_uri(url) if request else url
+        return data
+
+    def get_stream_url(self, obj) -> str | None:
+        """Return a signed, expiring stream URL the requester may use."""
+        request = self.context.get("request")
+        if not settings.VIDEO_STREAM_SIGNED_URLS or request is None:
+            return None
+
+        # Private videos are only signed for their owner
+        private = obj.privacy == "private"
+        if private and obj.owner_id != request.user.id:
+            return None
+
+        token = sign_stream_token(obj.id, obj.video.name, private)
+        return URLBuilder(
+            request=request,
+            viewname="shorts:videos-stream-signed",
+            kwargs={"token": token},
+        ).build()
+
+
+class VideoDetailSerializer(VideoSerializer):
+    """Serializer class for a single Video with its scrubbing storyboard"""
+
+    class Meta(VideoSerializer.Meta):
+        fields = [*VideoSerializer.Meta.fields, "storyboard", "storyboard_map"]
+        read_only_fields = [
+            *VideoSerializer.Meta.read_only_fields,
+            "storyboard",
+            "storyboard_map",
+        ]
@@ -0,0 +1,75 @@
+from django.conf import settings
+from rest_framework.serializers import (
+    CharField,
+    IntegerField,
+    ModelSerializer,
+    ReadOnlyField,
+    Serializer,
+    SerializerMethodField,
+    ValidationError,
+)
+from shorts.models.video import Video
+from shorts.models.video_upload import VideoUpload
+
+from .video import VideoTagsMixin
+
+
+class VideoUploadSerializer(ModelSerializer):
+    """Serializer class for VideoUpload"""
+
+    total_chunks = ReadOnlyField()
+    received_chunks = SerializerMethodField()
+
+    class Meta:
+        model = VideoUpload
+        fields = [
+            "id",
+            "filename",
+            "size",
+            "chunk_size",
+            "total_chunks",
+            "received_chunks",
+            "created_at",
+            "expires_at",
+        ]
+        read_only_fields = ["id", "chunk_size", "created_at", "expires_at"]
+
+    def get_received_chunks(self, obj) -> list[int]:
+        return list(obj.chunks.values_list("index", flat=True))
+
+    def validate_size(self, value: int) -> int:
+        if not 0 < value <= settings.VIDEO_UPLOAD_MAX_SIZE:
+            raise ValidationError(
+                f"Ensure the file size is between 1 and "
+                f"{settings.VIDEO_UPLOAD_MAX_SIZE} bytes."
+            )
+        return value
+
+
+class VideoUploadFinalizeSerializer(VideoTagsMixin, ModelSerializer):
+    """Serializer class for the Video fields sent when finalizing an upload"""
+
+    class Meta:
+        model = Video
+        fields = ["caption", "tag_ids", "thumbnail", "privacy"]
+
+
+class VideoDirectUploadSerializer(Serializer):
+    """Serializer class for a file a client will upload straight to storage"""
+
+    filename = CharField(max_length=255)
+    size = IntegerField()
+    content_type = CharField(max_length=100)
+
+    def validate_size(self, value: int) -> int:
+        if not 0 < value <= settings.VIDEO_UPLOAD_MAX_SIZE:
+            raise ValidationError(
+                f"Ensure the file size is between 1 and "
+                f"{settings.VIDEO_UPLOAD_MAX_SIZE} bytes."
+            )
+        return value
+
+    def validate_content_type(self, value: str) -> str:
+        if not value.startswith("video/"):
+            raise ValidationError("Upload a valid video file.")
+        return value
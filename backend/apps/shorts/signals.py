@@ -0,0 +1,112 @@
+import shutil
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from shorts.models.video import Video
+from shorts.models.video_upload import VideoUpload
+from shorts.processing import delete_thumbnails, get_hls_dir
+from shorts.storage import ContentAddressedStorage
+from shorts.streaming.cache import video_file_cache
+from shorts.streaming.prefix_cache import video_prefix_cache
+from shorts.uploads import discard_upload
+
+
+@receiver(post_save, sender=Video)
+@receiver(post_delete, sender=Video)
+def invalidate_video_file_cache(sender, instance: Video, **kwargs) -> None:
+    """Drop cached file metadata and prefixes when a video is changed or removed."""
+    video_file_cache.invalidate(instance.pk)
+    video_prefix_cache.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=Video)
+def delete_video_hls_renditions(sender, instance: Video, **kwargs) -> None:
+    """Remove the HLS renditions of a deleted video."""
+    shutil.rmtree(get_hls_dir(instance.pk), ignore_errors=True)
+
+
+@receiver(post_delete, sender=Video)
+def delete_video_storyboard(sender, instance: Video, **kwargs) -> None:
+    """Remove the storyboard sprite of a deleted video."""
+    if instance.storyboard:
+        instance.storyboard.delete(save=False)
+
+
+@receiver(post_delete, sender=Video)
+def delete_video_thumbnails(sender, instance: Video, **kwargs) -> None:
+    """Remove the generated thumbnail renditions of a deleted video."""
+    delete_thumbnails(instance.thumbnails)
+
+
+# File fields of Video whose blobs are reference counted
+BLOB_FIELDS = ("video", "thumbnail")
+
+
+def uses_blob_storage() -> bool:
+    return isinstance(Video._meta.get_field("video").storage, ContentAddressedStorage)
+
+
+@receiver(pre_save, sender=Video)
+def remember_video_blobs(sender, instance: Video, update_fields=None, **kwargs) -> None:
+    """Remember the stored file names a save may replace."""
+    instance._previous_blobs = {}
+    instance._previous_cold_video = None
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(BLOB_FIELDS) & set(update_fields):
+        return
+    previous = (
+        Video.objects.filter(pk=instance.pk)
+        .values(*BLOB_FIELDS, "storage_tier")
+        .first()
+    ) or {}
+
+    # A cold copy already gave up its blob reference when it was moved
+    if previous.pop("storage_tier", None) == Video.STORAGE_COLD:
+        cold_name = previous.pop("video")
+        # Only a newly assigned file replaces the cold copy, a stale
+        # instance saved after a tier move must not delete it
+        if not instance.video._committed or instance.video.name != cold_name:
+            instance._previous_cold_video = cold_name
+    if uses_blob_storage():
+        instance._previous_blobs = previous
+
+
+@receiver(post_save, sender=Video)
+def release_replaced_video_blobs(sender, instance: Video, **kwargs) -> None:
+    """Drop the blob references of files replaced by a save."""
+    for field_name, name in getattr(instance, "_previous_blobs", {}).items():
+        field_file = getattr(instance, field_name)
+        if name and name != field_file.name:
+            field_file.storage.delete(name)
+
+    # Replacing the file of a cold video brings it back to the hot tier
+    cold_name = getattr(instance, "_previous_cold_video", None)
+    if cold_name:
+        Video.get_tier_storage(Video.STORAGE_COLD).delete(cold_name)
+
+
+@receiver(post_delete, sender=Video)
+def release_video_blobs(sender, instance: Video, **kwargs) -> None:
+    """Drop the blob references of a deleted video."""
+    if not uses_blob_storage():
+        return
+    for field_name in BLOB_FIELDS:
+        if field_name == "video" and instance.storage_tier == Video.STORAGE_COLD:
+            continue
+        field_file = getattr(instance, field_name)
+        if field_file:
+            field_file.storage.delete(field_file.name)
+
+
+@receiver(post_delete, sender=Video)
+def delete_cold_video_file(sender, instance: Video, **kwargs) -> None:
+    """Remove the cold-tier copy of a deleted video."""
+    if instance.storage_tier == Video.STORAGE_COLD and instance.video:
+        instance.get_video_file_storage().delete(instance.video.name)
+
+
+@receiver(post_delete, sender=VideoUpload)
+def delete_video_upload_staging_file(sender, instance: VideoUpload, **kwargs) -> None:
+    """Remove the staging file of a cancelled, expired or finalized upload."""
+    discard_upload(instance)
@@ -0,0 +1,43 @@
+"""
+Storage backends for short video media files.
+
+Includes:
+- ContentAddressedStorage: Deduplicating, reference-counted file storage
+- content_addressed_storage: Shared ContentAddressedStorage instance
+- get_video_storage: Returns the storage of the Video file fields
+- get_cold_video_storage: Returns the storage of cold-tier video files
+- hash_file: Returns the SHA-256 of a file, reusing a digest from upload
+- download_to: Copies a stored file into an open local file
+- is_local_storage: Whether a storage keeps its files on the local disk
+- supports_presigned_uploads: Whether clients can PUT files to a storage
+- presign_put_url: Returns a presigned PUT URL of an S3-compatible storage
+- read_object_head: Reads the first bytes of an object with a ranged GET
+"""
+
+from .content_addressed import (
+    ContentAddressedStorage,
+    content_addressed_storage,
+    get_cold_video_storage,
+    get_video_storage,
+    hash_file,
+)
+from .remote import (
+    download_to,
+    is_local_storage,
+    presign_put_url,
+    read_object_head,
+    supports_presigned_uploads,
+)
+
+__all__ = [
+    "ContentAddressedStorage",
+    "content_addressed_storage",
+    "get_cold_video_storage",
+    "get_video_storage",
+    "hash_file",
+    "download_to",
+    "is_local_storage",
+    "presign_put_url",
+    "read_object_head",
+    "supports_presigned_uploads",
+]
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import posixpath
+import secrets
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage, storages
+from django.db import transaction
+from django.db.models import F
+from shorts.models.blob import Blob
+
+
+def hash_file(content) -> str:
+    """Return the hex SHA-256 of a file, reusing a digest computed on upload."""
+    sha256 = getattr(content, "sha256", "")
+    if sha256:
+        return sha256
+
+    digest = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def sample_challenges(content, count: int, length: int) -> list[list]:
+    """Hash random byte ranges a client must later reproduce to claim a blob.
+
+    The ranges are sampled while the uploaded bytes are at hand, so claims
+    are verified without reading the stored file.
+    """
+    length = min(length, content.size)
+    challenges = []
+    for _ in range(count):
+        offset = secrets.randbelow(content.size - length + 1)
+        content.seek(offset)
+        digest = hashlib.sha256(content.read(length)).hexdigest()
+        challenges.append([offset, length, digest])
+    content.seek(0)
+    return challenges
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """File system storage keeping a single reference-counted copy per content.
+
+    Saved files are named after their SHA-256 (``blobs/ab/cd/<sha256>.mp4``).
+    Saving content that is already stored only increments the ``Blob``
+    reference count, and deleting a name only removes the file once no
+    file field references it anymore. Names without a ``Blob`` row, such as
+    files saved before this storage was enabled, are handled like a plain
+    file system storage.
+    """
+
+    def __init__(self, prefix: str = "blobs", **kwargs) -> None:
+        # Equal names always hold equal bytes, so rewriting one is harmless
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+        self.prefix = prefix
+
+    def get_blob_name(self, sha256: str, name: str) -> str:
+        """Return the storage name of the content with the given digest."""
+        ext = os.path.splitext(name)[1].lower()
+        return posixpath.join(self.prefix, sha256[:2], sha256[2:4], sha256 + ext)
+
+    def get_available_name(self, name: str, max_length: int | None = None) -> str:
+        # Blob names are derived from the content in _save
+        return name
+
+    def _save(self, name: str, content) -> str:
+        sha256 = hash_file(content)
+        blob_name = self.get_blob_name(sha256, name)
+        with transaction.atomic():
+            blob, created = Blob.objects.select_for_update().get_or_create(
+                name=blob_name,
+                defaults={
+                    "sha256": sha256,
+                    "size": content.size,
+                    "challenges": sample_challenges(
+                        content,
+                        settings.VIDEO_BLOB_CHALLENGE_COUNT,
+                        settings.VIDEO_BLOB_CHALLENGE_LENGTH,
+                    ),
+                },
+            )
+            Blob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+            if created or not self.exists(blob_name):
+                super()._save(blob_name, content)
+        return blob_name
+
+    def retain(self, name: str) -> bool:
+        """Add a reference to an already stored blob.
+
+        Returns:
+            bool: False if the blob was removed in the meantime.
+        """
+        updated = Blob.objects.filter(name=name, ref_count__gt=0).update(
+            ref_count=F("ref_count") + 1
+        )
+        return bool(updated)
+
+    def delete(self, name: str) -> None:
+        """Drop a reference, removing the file with its last reference."""
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(name=name).first()
+            if blob is not None and blob.ref_count > 1:
+                Blob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") - 1)
+                return
+            if blob is not None:
+                blob.delete()
+            super().delete(name)
+
+
+# Shared storage of the Video file fields
+content_addressed_storage = ContentAddressedStorage()
+
+
+def get_video_storage():
+    """Return the storage of ``Video.video`` and ``Video.thumbnail``."""
+    if settings.VIDEO_STORAGE_BACKEND == "s3":
+        return storages["videos"]
+    if settings.VIDEO_CONTENT_ADDRESSED_STORAGE:
+        return content_addressed_storage
+    return default_storage
+
+
+def get_cold_video_storage():
+    """Return the cheaper storage videos without recent views are moved to."""
+    return storages["cold_videos"]
@@ -0,0 +1,59 @@
+import shutil
+
+from django.core.files.storage import Storage
+
+
+def is_local_storage(storage: Storage) -> bool:
+    """Return whether a storage keeps its files on the local file system."""
+    try:
+        storage.path("")
+    except NotImplementedError:
+        return False
+    return True
+
+
+def supports_presigned_uploads(storage: Storage) -> bool:
+    """Return whether a storage is an S3-compatible bucket clients can PUT to."""
+    return hasattr(storage, "bucket_name") and hasattr(storage, "bucket")
+
+
+def get_object_client(storage):
+    """Return the boto3 S3 client of an S3-compatible storage."""
+    return storage.bucket.meta.client
+
+
+def presign_put_url(storage, name: str, content_type: str, expires_in: int) -> str:
+    """Return a URL a client can PUT the file ``name`` to without credentials.
+
+    The content type is part of the signature, so the client must send the
+    same ``Content-Type`` header. Keys equal the storage names, the videos
+    storage is configured without a ``location`` prefix.
+    """
+    return get_object_client(storage).generate_presigned_url(
+        "put_object",
+        Params={
+            "Bucket": storage.bucket_name,
+            "Key": name,
+            "ContentType": content_type,
+        },
+        ExpiresIn=expires_in,
+        HttpMethod="PUT",
+    )
+
+
+def read_object_head(storage, name: str, length: int) -> bytes:
+    """Read the first ``length`` bytes of a stored object with a ranged GET."""
+    response = get_object_client(storage).get_object(
+        Bucket=storage.bucket_name, Key=name, Range=f"bytes=0-{length - 1}"
+    )
+    return response["Body"].read()
+
+
+def download_to(storage: Storage, name: str, file) -> None:
+    """Copy a stored file into an open binary file."""
+    if supports_presigned_uploads(storage):
+        # Multipart download without S3File spooling the object first
+        get_object_client(storage).download_fileobj(storage.bucket_name, name, file)
+        return
+    with storage.open(name, "rb") as source:
+        shutil.copyfileobj(source, file, 1024 * 1024)
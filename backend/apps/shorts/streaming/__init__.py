@@ -0,0 +1,76 @@
+"""
+Helpers for streaming short videos to clients.
+
+Includes:
+- RangeFile: File-like view over a byte range of an open file
+- CoalescedRangeFile: RangeFile sharing block reads with concurrent readers
+- BlockReadCoalescer: Single-flight reads of aligned file blocks
+- MultipartRangeFile: File-like multipart/byteranges body over several ranges
+- RangeIterator: Sync iterator streaming a RangeFile under WSGI
+- AsyncRangeIterator: Async iterator streaming a RangeFile under ASGI
+- BandwidthScheduler: Fair-share token bucket pacing of concurrent streams
+- bandwidth_scheduler: Per-process BandwidthScheduler shared by the iterators
+- parse_range_header: Parses an RFC 7233 Range header
+- if_range_matches: Evaluates an If-Range precondition
+- make_etag: Builds a strong ETag from file size and mtime
+- VideoFileCache: In-process LRU of video file metadata and descriptors
+- video_file_cache: Per-process VideoFileCache shared by the stream views
+- VideoPrefixCache: Size-bounded LRU of the first bytes of hot videos
+- video_prefix_cache: Per-process VideoPrefixCache shared by the stream views
+- MediaDiskCache: Size-bounded local disk cache of hot remote media files
+- media_disk_cache: Per-process MediaDiskCache shared by the stream views
+- StreamMetrics: Per-worker streaming telemetry in the Prometheus format
+- stream_metrics: Per-process StreamMetrics shared by the stream views
+- sign_stream_token: Signs the claims of an expiring stream URL
+- unsign_stream_token: Verifies a signed stream URL token
+- build_stream_response: Builds a streaming response for the configured mode
+- build_offload_response: Builds an empty response for reverse-proxy offload
+"""
+
+from .cache import VideoFileCache, VideoFileInfo, video_file_cache
+from .coalescing import BlockReadCoalescer, block_read_coalescer
+from .disk_cache import MediaDiskCache, media_disk_cache
+from .files import (
+    AsyncRangeIterator,
+    CoalescedRangeFile,
+    MultipartRangeFile,
+    RangeFile,
+    RangeIterator,
+)
+from .metrics import StreamMetrics, StreamRecorder, stream_metrics
+from .pacing import BandwidthScheduler, StreamPacer, bandwidth_scheduler
+from .prefix_cache import VideoPrefixCache, video_prefix_cache
+from .ranges import if_range_matches, make_etag, parse_range_header
+from .signing import StreamToken, sign_stream_token, unsign_stream_token
+from .responses import build_offload_response, build_stream_response
+
+__all__ = [
+    "VideoFileCache",
+    "VideoFileInfo",
+    "video_file_cache",
+    "StreamMetrics",
+    "StreamRecorder",
+    "stream_metrics",
+    "VideoPrefixCache",
+    "video_prefix_cache",
+    "MediaDiskCache",
+    "media_disk_cache",
+    "RangeFile",
+    "CoalescedRangeFile",
+    "BlockReadCoalescer",
+    "block_read_coalescer",
+    "MultipartRangeFile",
+    "RangeIterator",
+    "AsyncRangeIterator",
+    "BandwidthScheduler",
+    "StreamPacer",
+    "bandwidth_scheduler",
+    "parse_range_header",
+    "if_range_matches",
+    "make_etag",
+    "StreamToken",
+    "sign_stream_token",
+    "unsign_stream_token",
+    "build_stream_response",
+    "build_offload_response",
+]
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from django.conf import settings
+
+from .ranges import make_etag
+
+
+@dataclass
+class VideoFileInfo:
+    """Cached file metadata of a video plus its idle open descriptors."""
+
+    video_id: int
+    name: str
+    path: str
+    size: int
+    mtime: int
+    etag: str
+    loaded_at: float
+    keyframes: list[list[int]] | None = None
+    bitrate: int | None = None
+    cold: bool = False
+    files: list[BinaryIO] = field(default_factory=list)
+    valid: bool = True
+
+
+class PooledFile:
+    """Open video file checked out of the cache pool.
+
+    Closing it returns the descriptor to the pool instead of closing it,
+    unless the cache entry was invalidated or the pool is already full.
+    """
+
+    def __init__(
+        self, cache: "VideoFileCache", info: VideoFileInfo, file: BinaryIO
+    ) -> None:
+        self.cache = cache
+        self.info = info
+        self.file: BinaryIO | None = file
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.cache.release(self.info, self.file)
+            self.file = None
+
+
+class VideoFileCache:
+    """Bounded in-process LRU of video file metadata and open descriptors.
+
+    Entries are keyed by video ID so repeated Range requests for a hot
+    video skip the database lookup, the ``stat`` call and the ``open``.
+    Entries are dropped by the ``Video`` save/delete signals of this
+    process and expire after ``ttl`` seconds, which bounds staleness for
+    changes made by other worker processes.
+    """
+
+    def __init__(self, max_entries: int, pool_size: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.pool_size = pool_size
+        self.ttl = ttl
+        self.entries: OrderedDict[int, VideoFileInfo] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, video_id: int) -> VideoFileInfo | None:
+        """Return the cached entry for a video, or None if missing or expired."""
+        with self.lock:
+            info = self.entries.get(video_id)
+            if info is None:
+                return None
+            if time.monotonic() - info.loaded_at > self.ttl:
+                self._discard(video_id)
+                return None
+            self.entries.move_to_end(video_id)
+            return info
+
+    def load(
+        self,
+        video_id: int,
+        name: str,
+        path: str,
+        keyframes: list[list[int]] | None = None,
+        bitrate: int | None = None,
+        cold: bool = False,
+    ) -> VideoFileInfo:
+        """Stat a video file and store its metadata in the cache.
+
+        Args:
+            video_id (int): The video the file belongs to.
+            name (str): The file name relative to the storage root.
+            path (str): The absolute path of the file.
+            keyframes (list | None): The video's keyframe index, if known.
+            bitrate (int | None): The probed bitrate used to pace streams.
+            cold (bool): Whether the file lives in the cold storage tier.
+        """
+        stat = os.stat(path)
+        info = VideoFileInfo(
+            video_id=video_id,
+            name=name,
+            path=path,
+            size=stat.st_size,
+            mtime=int(stat.st_mtime),
+            etag=make_etag(stat.st_size, stat.st_mtime_ns),
+            loaded_at=time.monotonic(),
+            keyframes=keyframes,
+            bitrate=bitrate,
+            cold=cold,
+        )
+        with self.lock:
+            self._discard(video_id)
+            self.entries[video_id] = info
+            while len(self.entries) > self.max_entries:
+                self._discard(next(iter(self.entries)))
+        return info
+
+    def open(self, info: VideoFileInfo) -> PooledFile:
+        """Check out an idle descriptor for the video, opening one if needed."""
+        with self.lock:
+            file = info.files.pop() if info.files else None
+        if file is None:
+            file = open(info.path, "rb")
+        return PooledFile(self, info, file)
+
+    def release(self, info: VideoFileInfo, file: BinaryIO) -> None:
+        """Return a descriptor to the pool, or close it if it cannot be kept."""
+        with self.lock:
+            if info.valid and len(info.files) < self.pool_size:
+                info.files.append(file)
+                return
+        file.close()
+
+    def invalidate(self, video_id: int) -> None:
+        """Drop a video's entry and close its idle descriptors."""
+        with self.lock:
+            self._discard(video_id)
+
+    def _discard(self, video_id: int) -> None:
+        info = self.entries.pop(video_id, None)
+        if info is None:
+            return
+        info.valid = False
+        for file in info.files:
+            file.close()
+        info.files.clear()
+
+
+# Per-process cache shared by the stream views
+video_file_cache = VideoFileCache(
+    max_entries=settings.VIDEO_FILE_CACHE_MAX_ENTRIES,
+    pool_size=settings.VIDEO_FILE_CACHE_POOL_SIZE,
+    ttl=settings.VIDEO_FILE_CACHE_TTL,
+)
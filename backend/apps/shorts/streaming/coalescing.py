@@ -0,0 +1,68 @@
+import os
+import threading
+from typing import BinaryIO
+
+from django.conf import settings
+
+
+class BlockFlight:
+    """A block read in progress, shared by every concurrent reader."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data = b""
+        self.error: BaseException | None = None
+        self.readers = 0
+
+
+class BlockReadCoalescer:
+    """Single-flight disk reads of aligned file blocks.
+
+    Concurrent readers of the same ``(key, block)`` share one ``pread``
+    and one buffer. The buffer is dropped as soon as the last reader of
+    the flight has taken its copy, so nothing is cached beyond the
+    moment of contention.
+    """
+
+    def __init__(self, block_size: int) -> None:
+        self.block_size = block_size
+        self.flights: dict[tuple[str, int], BlockFlight] = {}
+        self.lock = threading.Lock()
+
+    def read_block(self, key: str, file: BinaryIO, index: int) -> bytes:
+        """Return block ``index`` of ``file``, joining an in-flight read."""
+        flight_key = (key, index)
+        with self.lock:
+            flight = self.flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[flight_key] = BlockFlight()
+            flight.readers += 1
+
+        try:
+            if leader:
+                try:
+                    flight.data = os.pread(
+                        file.fileno(), self.block_size, index * self.block_size
+                    )
+                except BaseException as error:
+                    flight.error = error
+                finally:
+                    flight.done.set()
+            else:
+                flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+            return flight.data
+        finally:
+            with self.lock:
+                flight.readers -= 1
+                if flight.readers == 0:
+                    self.flights.pop(flight_key, None)
+
+
+# Per-process coalescer shared by the stream views
+block_read_coalescer = BlockReadCoalescer(
+    block_size=settings.VIDEO_STREAM_COALESCE_BLOCK_SIZE
+)
@@ -0,0 +1,207 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from django.conf import settings
+from django.core.files.storage import Storage
+from shorts.storage import download_to
+
+logger = getLogger(__name__)
+
+# Upper bound of uncached names whose requests are being counted
+MAX_TRACKED_MISSES = 10_000
+
+
+class MediaDiskCache:
+    """Size-bounded read-through cache of remote media files on local disk.
+
+    Files are stored under ``root`` named after a hash of their storage
+    name. A file is only copied once it was requested ``min_hits`` times
+    within ``hit_window`` seconds, so cold videos keep streaming straight
+    from the remote storage and never push hot ones out of the cache.
+
+    Fills run on a small thread pool. Each one writes a ``.part`` file
+    created with ``O_EXCL`` and renames it into place, so readers never
+    see a partial file and a file is only fetched once even when several
+    threads or worker processes want it. Hits bump the access time of a
+    file and the least recently accessed files are deleted when a fill
+    would exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int,
+        min_hits: int,
+        hit_window: float,
+        fill_workers: int,
+        fill_timeout: float,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.min_hits = min_hits
+        self.hit_window = hit_window
+        self.fill_workers = fill_workers
+        self.fill_timeout = fill_timeout
+        self.misses: dict[str, tuple[float, int]] = {}
+        self.pending: set[str] = set()
+        self.executor: ThreadPoolExecutor | None = None
+        self.counters = {"hits": 0, "misses": 0, "fills": 0, "fill_errors": 0}
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get_cache_path(self, name: str) -> str:
+        """Return the local path a storage name is cached at."""
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        ext = os.path.splitext(name)[1].lower()
+        return os.path.join(self.root, digest[:2], digest + ext)
+
+    def get_path(self, name: str) -> str | None:
+        """Return the local path of a cached file, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        path = self.get_cache_path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self.lock:
+                self.counters["misses"] += 1
+            return None
+
+        # Only the access time is bumped, the mtime feeds the stream ETag
+        os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
+        with self.lock:
+            self.counters["hits"] += 1
+        return path
+
+    def record_miss(self, storage: Storage, name: str) -> None:
+        """Count a request for an uncached file and fill it once it is hot."""
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            started_at, count = self.misses.get(name, (now, 0))
+            if now - started_at > self.hit_window:
+                started_at, count = now, 0
+            count += 1
+
+            if count < self.min_hits or name in self.pending:
+                self.misses[name] = (started_at, count)
+                if len(self.misses) > MAX_TRACKED_MISSES:
+                    self._prune_misses(now)
+                return
+
+            self.misses.pop(name, None)
+            self.pending.add(name)
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    self.fill_workers, thread_name_prefix="media-cache-fill"
+                )
+        self.executor.submit(self._fill_in_background, storage, name)
+
+    def fill(self, storage: Storage, name: str) -> str | None:
+        """Copy a remote file into the cache and return its local path.
+
+        Returns:
+            str | None: The local path, or None if the file cannot fit in
+            the cache or another process is already filling it.
+        """
+        path = self.get_cache_path(name)
+        if os.path.exists(path):
+            return path
+
+        size = storage.size(name)
+        if size > self.max_bytes:
+            return None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        part_path = path + ".part"
+        try:
+            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            # Another fill is running, unless it died and left its part file
+            if time.time() - os.path.getmtime(part_path) > self.fill_timeout:
+                os.remove(part_path)
+            return None
+
+        try:
+            self.evict(size)
+            with os.fdopen(fd, "wb") as file:
+                download_to(storage, name, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(part_path, path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        with self.lock:
+            self.counters["fills"] += 1
+        logger.info(f"Cached media file {name} at: {path}")
+        return path
+
+    def evict(self, incoming: int) -> None:
+        """Delete the least recently accessed files until ``incoming`` bytes fit."""
+        entries, total = [], 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(".part"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime_ns, stat.st_size, path))
+                total += stat.st_size
+
+        # Open descriptors keep serving a deleted file until they are closed
+        for _, size, path in sorted(entries):
+            if total + incoming <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and fill counters of this process."""
+        with self.lock:
+            return {**self.counters, "pending": len(self.pending)}
+
+    def _fill_in_background(self, storage: Storage, name: str) -> None:
+        try:
+            self.fill(storage, name)
+        except Exception as error:
+            with self.lock:
+                self.counters["fill_errors"] += 1
+            logger.error(f"Caching media file {name} failed: {error}")
+        finally:
+            with self.lock:
+                self.pending.discard(name)
+
+    def _prune_misses(self, now: float) -> None:
+        for name, (started_at, _) in list(self.misses.items()):
+            if now - started_at > self.hit_window:
+                del self.misses[name]
+
+
+# Per-process disk cache of remote media shared by the stream views
+media_disk_cache = MediaDiskCache(
+    root=str(settings.VIDEO_DISK_CACHE_DIR),
+    max_bytes=settings.VIDEO_DISK_CACHE_MAX_BYTES,
+    min_hits=settings.VIDEO_DISK_CACHE_MIN_HITS,
+    hit_window=settings.VIDEO_DISK_CACHE_HIT_WINDOW,
+    fill_workers=settings.VIDEO_DISK_CACHE_FILL_WORKERS,
+    fill_timeout=settings.VIDEO_DISK_CACHE_FILL_TIMEOUT,
+)
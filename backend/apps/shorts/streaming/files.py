@@ -0,0 +1,217 @@
+import asyncio
+import os
+import time
+from typing import AsyncIterator, BinaryIO, Iterator
+
+from asgiref.sync import sync_to_async
+
+from .coalescing import block_read_coalescer
+from .metrics import StreamRecorder
+from .pacing import StreamPacer
+
+
+class RangeFile:
+    """File-like view over a byte range of an open file.
+
+    Reads never go past the end of the range, so WSGI file wrappers that
+    fall back to ``read()`` stay inside the requested range, while servers
+    that use ``fileno()`` with the current offset can hand the range to
+    the kernel's ``sendfile`` directly.
+    """
+
+    def __init__(self, file: BinaryIO, start: int, length: int) -> None:
+        self.file = file
+        self.start = start
+        self.length = length
+        self.remaining = length
+        self.recorder: StreamRecorder | None = None
+        self.file.seek(start, os.SEEK_SET)
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def tell(self) -> int:
+        return self.start + self.length - self.remaining
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most ``size`` bytes without leaving the range."""
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.read_bytes(size)
+        self.remaining -= len(data)
+        if self.recorder is not None:
+            self.recorder.record_sent(len(data))
+        return data
+
+    def read_bytes(self, size: int) -> bytes:
+        """Read ``size`` bytes at the current position of the range."""
+        return self.file.read(size)
+
+    def close(self) -> None:
+        if self.recorder is not None:
+            self.recorder.finish()
+        self.file.close()
+
+
+class CoalescedRangeFile(RangeFile):
+    """``RangeFile`` whose reads are shared with concurrent readers.
+
+    Reads are served from aligned blocks fetched through the
+    ``block_read_coalescer``, so hundreds of viewers of a viral video
+    reading the same bytes at once cause a single disk read per block.
+    """
+
+    def __init__(self, file: BinaryIO, start: int, length: int, key: str) -> None:
+        super().__init__(file, start, length)
+        self.key = key
+
+    def read_bytes(self, size: int) -> bytes:
+        block_size = block_read_coalescer.block_size
+        position = self.tell()
+        end = position + size
+        chunks = []
+        while position < end:
+            index = position // block_size
+            block = block_read_coalescer.read_block(self.key, self.file, index)
+            offset = position - index * block_size
+            chunk = block[offset : offset + end - position]
+            if not chunk:
+                break
+            chunks.append(chunk)
+            position += len(chunk)
+        return b"".join(chunks)
+
+
+class MultipartRangeFile:
+    """File-like ``multipart/byteranges`` body over several ranges of a file.
+
+    The part headers and file ranges are produced lazily by ``read()``,
+    so the body can be streamed by the same iterators as a ``RangeFile``
+    and ``length`` is known up front for ``Content-Length``.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        ranges: list[tuple[int, int]],
+        size: int,
+        content_type: str,
+        boundary: str,
+    ) -> None:
+        self.file = file
+        self.segments: list[bytes | tuple[int, int]] = []
+        for start, end in ranges:
+            self.segments.append(
+                (
+                    f"\r\n--{boundary}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+                ).encode("ascii")
+            )
+            self.segments.append((start, end - start + 1))
+        self.segments.append(f"\r\n--{boundary}--\r\n".encode("ascii"))
+        self.length = sum(
+            len(segment) if isinstance(segment, bytes) else segment[1]
+            for segment in self.segments
+        )
+        self.current: RangeFile | bytes | None = None
+        self.recorder: StreamRecorder | None = None
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most ``size`` bytes, moving across part boundaries."""
+        if size is None or size < 0:
+            size = self.length
+        chunks = []
+        while size > 0:
+            if not self.current:
+                if not self.segments:
+                    break
+                segment = self.segments.pop(0)
+                if isinstance(segment, bytes):
+                    self.current = segment
+                else:
+                    self.current = RangeFile(self.file, *segment)
+            if isinstance(self.current, bytes):
+                chunk, self.current = self.current[:size], self.current[size:]
+            else:
+                chunk = self.current.read(size)
+                if not chunk:
+                    break
+                if self.current.remaining <= 0:
+                    self.current = None
+            chunks.append(chunk)
+            size -= len(chunk)
+        data = b"".join(chunks)
+        if self.recorder is not None:
+            self.recorder.record_sent(len(data))
+        return data
+
+    def close(self) -> None:
+        if self.recorder is not None:
+            self.recorder.finish()
+        self.file.close()
+
+
+class RangeIterator:
+    """Sync iterator that streams a ``RangeFile`` under WSGI.
+
+    With a ``pacer`` the iterator sleeps between chunks to hold the
+    stream to its bandwidth share.
+    """
+
+    def __init__(
+        self,
+        range_file: RangeFile | MultipartRangeFile,
+        chunk_size: int,
+        pacer: StreamPacer | None = None,
+    ) -> None:
+        self.range_file = range_file
+        self.chunk_size = chunk_size
+        self.pacer = pacer
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.range_file.read(self.chunk_size):
+            yield chunk
+            if self.pacer is not None:
+                time.sleep(self.pacer.delay(len(chunk)))
+
+    def close(self) -> None:
+        if self.pacer is not None:
+            self.pacer.close()
+        self.range_file.close()
+
+
+class AsyncRangeIterator:
+    """Async iterator that streams a ``RangeFile`` under ASGI.
+
+    Each chunk is read in the thread pool, so the event loop is never
+    blocked on disk and no thread is pinned while a slow client drains
+    the previous chunk. The next read only starts once the server has
+    awaited the send of the current one, which gives natural
+    backpressure. With a ``pacer`` the iterator also sleeps on the event
+    loop between chunks to hold the stream to its bandwidth share.
+    """
+
+    def __init__(
+        self,
+        range_file: RangeFile | MultipartRangeFile,
+        chunk_size: int,
+        pacer: StreamPacer | None = None,
+    ) -> None:
+        self.range_file = range_file
+        self.chunk_size = chunk_size
+        self.pacer = pacer
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        read = sync_to_async(self.range_file.read, thread_sensitive=False)
+        while chunk := await read(self.chunk_size):
+            yield chunk
+            if self.pacer is not None:
+                await asyncio.sleep(self.pacer.delay(len(chunk)))
+
+    def close(self) -> None:
+        if self.pacer is not None:
+            self.pacer.close()
+        self.range_file.close()
@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+from collections import Counter
+
+# Histogram bucket upper bounds
+TTFB_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+RANGE_BUCKETS = (
+    64 * 1024,
+    256 * 1024,
+    1024 * 1024,
+    4 * 1024 * 1024,
+    16 * 1024 * 1024,
+    64 * 1024 * 1024,
+)
+
+# Number of hottest videos exported by bytes served
+TOP_VIDEOS = 20
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus exposition format."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        lines = [f"# TYPE {name} histogram"]
+        for bound, count in zip(self.buckets, self.counts):
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class StreamRecorder:
+    """Tracks a single stream from the view until its body is closed."""
+
+    def __init__(
+        self,
+        metrics: "StreamMetrics",
+        video_id: int,
+        length: int,
+        started_at: float | None = None,
+    ) -> None:
+        self.metrics = metrics
+        self.video_id = video_id
+        self.length = length
+        self.sent = 0
+        self.started_at = started_at or time.monotonic()
+        self.first_byte_at: float | None = None
+        self.offloaded = False
+        self.finished = False
+
+    def record_sent(self, size: int) -> None:
+        """Record bytes handed to the server by a Python iterator."""
+        if self.first_byte_at is None:
+            self.first_byte_at = time.monotonic()
+        self.sent += size
+
+    def finish(self) -> None:
+        """Record the outcome once the response body is closed."""
+        if self.finished:
+            return
+        self.finished = True
+        if self.offloaded:
+            # Zero-copy sends happen in the server, assume they completed
+            self.sent = self.length
+            self.first_byte_at = self.first_byte_at or self.started_at
+        self.metrics.finish(self)
+
+
+class StreamMetrics:
+    """Per-worker streaming telemetry exposed for scraping.
+
+    Records bytes sent, time to first byte, stream duration, client
+    aborts, requested range sizes and a live gauge of open streams.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active_streams = 0
+        self.streams_total = 0
+        self.aborts_total = 0
+        self.bytes_sent_total = 0
+        self.video_bytes: Counter[int] = Counter()
+        self.ttfb = Histogram(TTFB_BUCKETS)
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.range_bytes = Histogram(RANGE_BUCKETS)
+
+    def start(
+        self, video_id: int, length: int, started_at: float | None = None
+    ) -> StreamRecorder:
+        """Open a stream and return the recorder tracking it.
+
+        Args:
+            video_id (int): The streamed video.
+            length (int): Number of bytes the response will send.
+            started_at (float | None): ``time.monotonic()`` when the request
+                reached the view, so TTFB includes the lookup.
+        """
+        with self.lock:
+            self.active_streams += 1
+            self.range_bytes.observe(length)
+        return StreamRecorder(self, video_id, length, started_at)
+
+    def finish(self, recorder: StreamRecorder) -> None:
+        now = time.monotonic()
+        with self.lock:
+            self.active_streams -= 1
+            self.streams_total += 1
+            self.bytes_sent_total += recorder.sent
+            self.video_bytes[recorder.video_id] += recorder.sent
+            if recorder.sent < recorder.length:
+                self.aborts_total += 1
+            if recorder.first_byte_at is not None:
+                self.ttfb.observe(recorder.first_byte_at - recorder.started_at)
+            self.duration.observe(now - recorder.started_at)
+
+            # Keep the per-video counter bounded to the hottest videos
+            if len(self.video_bytes) > TOP_VIDEOS * 10:
+                self.video_bytes = Counter(
+                    dict(self.video_bytes.most_common(TOP_VIDEOS))
+                )
+
+    def render(self, extra: dict[str, dict[str, int]] | None = None) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            extra (dict[str, dict[str, int]] | None): Additional gauge
+                groups, e.g. cache statistics, rendered as
+                ``video_stream_<group>_<name>``.
+        """
+        labels = f'worker="{os.getpid()}"'
+        with self.lock:
+            lines = [
+                "# TYPE video_stream_active gauge",
+                f"video_stream_active{{{labels}}} {self.active_streams}",
+                "# TYPE video_stream_total counter",
+                f"video_stream_total{{{labels}}} {self.streams_total}",
+                "# TYPE video_stream_aborts_total counter",
+                f"video_stream_aborts_total{{{labels}}} {self.aborts_total}",
+                "# TYPE video_stream_bytes_sent_total counter",
+                f"video_stream_bytes_sent_total{{{labels}}} {self.bytes_sent_total}",
+            ]
+            lines += self.ttfb.render("video_stream_ttfb_seconds", labels)
+            lines += self.duration.render("video_stream_duration_seconds", labels)
+            lines += self.range_bytes.render("video_stream_range_bytes", labels)
+            lines.append("# TYPE video_stream_video_bytes_sent counter")
+            for video_id, sent in self.video_bytes.most_common(TOP_VIDEOS):
+                lines.append(
+                    f'video_stream_video_bytes_sent{{{labels},video="{video_id}"}} {sent}'
+                )
+
+        for group, values in (extra or {}).items():
+            for name, value in values.items():
+                metric = f"video_stream_{group}_{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# Per-process metrics shared by the stream views
+stream_metrics = StreamMetrics()
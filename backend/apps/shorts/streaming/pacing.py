@@ -0,0 +1,90 @@
+import threading
+import time
+
+from django.conf import settings
+
+
+class StreamPacer:
+    """Token bucket pacing a single stream.
+
+    The bucket starts full with ``burst_seconds`` worth of bytes, so the
+    first seconds of playback are sent as fast as possible. After that
+    the stream is held to its fair share of the worker budget.
+    """
+
+    def __init__(
+        self, scheduler: "BandwidthScheduler", rate: float, burst_seconds: float
+    ) -> None:
+        self.scheduler = scheduler
+        self.rate = rate
+        self.burst_seconds = burst_seconds
+        self.started_at = self.updated_at = time.monotonic()
+        self.tokens = rate * burst_seconds
+        self.closed = False
+
+    def delay(self, size: int) -> float:
+        """Take ``size`` bytes from the bucket and return the seconds to wait."""
+        now = time.monotonic()
+        rate = self.scheduler.fair_rate(self.rate)
+        if now - self.started_at < self.burst_seconds:
+            capacity = self.rate * self.burst_seconds
+        else:
+            capacity = rate
+        self.tokens = min(capacity, self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+        self.tokens -= size
+        return max(0.0, -self.tokens / rate)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.scheduler.release()
+
+
+class BandwidthScheduler:
+    """Shares a worker's streaming bandwidth fairly across its streams.
+
+    Each stream is paced at ``multiplier`` times the video bitrate, capped
+    at an equal share of ``worker_rate`` among the streams open in this
+    process, so a few prefetching clients cannot starve the others.
+    """
+
+    def __init__(
+        self,
+        worker_rate: int,
+        multiplier: float,
+        burst_seconds: float,
+        default_bitrate: int,
+    ) -> None:
+        self.worker_rate = worker_rate
+        self.multiplier = multiplier
+        self.burst_seconds = burst_seconds
+        self.default_bitrate = default_bitrate
+        self.active = 0
+        self.lock = threading.Lock()
+
+    def open(self, bitrate: int | None = None) -> StreamPacer:
+        """Open a paced stream for a video of ``bitrate`` bits per second."""
+        with self.lock:
+            self.active += 1
+        rate = (bitrate or self.default_bitrate) / 8 * self.multiplier
+        return StreamPacer(self, rate, self.burst_seconds)
+
+    def release(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+    def fair_rate(self, rate: float) -> float:
+        """Return a stream's rate capped at its share of the worker budget."""
+        if not self.worker_rate:
+            return rate
+        return min(rate, self.worker_rate / max(self.active, 1))
+
+
+# Per-process scheduler shared by the stream iterators
+bandwidth_scheduler = BandwidthScheduler(
+    worker_rate=settings.VIDEO_STREAM_WORKER_RATE,
+    multiplier=settings.VIDEO_STREAM_PACING_MULTIPLIER,
+    burst_seconds=settings.VIDEO_STREAM_PACING_BURST_SECONDS,
+    default_bitrate=settings.VIDEO_STREAM_DEFAULT_BITRATE,
+)
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .cache import VideoFileInfo, video_file_cache
+
+
+class VideoPrefixCache:
+    """Size-bounded LRU of the first bytes of recently streamed videos.
+
+    Most viewers abandon a short within seconds, so most Range requests
+    hit the head of the file. Ranges that fall entirely inside the prefix
+    are answered from memory, or from the Django cache named by
+    ``cache_alias`` so several workers can share one copy. Entries are
+    keyed by video ID and ETag, so a changed file never serves stale bytes.
+    """
+
+    def __init__(
+        self, prefix_bytes: int, max_bytes: int, cache_alias: str | None = None
+    ) -> None:
+        self.prefix_bytes = prefix_bytes
+        self.max_bytes = max_bytes
+        self.cache_alias = cache_alias
+        self.entries: OrderedDict[tuple[int, str], bytes] = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def covers(self, info: VideoFileInfo, start: int, end: int) -> bool:
+        """Return True if the inclusive range lies inside the cached prefix."""
+        return self.prefix_bytes > 0 and end < min(self.prefix_bytes, info.size)
+
+    def read(self, info: VideoFileInfo, start: int, end: int) -> bytes:
+        """Return the bytes of a covered range, loading the prefix on a miss."""
+        data = self.get(info)
+        if data is None:
+            with self.lock:
+                self.misses += 1
+            file = video_file_cache.open(info)
+            try:
+                file.seek(0)
+                data = file.read(min(self.prefix_bytes, info.size))
+            finally:
+                file.close()
+            self.set(info, data)
+        else:
+            with self.lock:
+                self.hits += 1
+        return data[start : end + 1]
+
+    def get(self, info: VideoFileInfo) -> bytes | None:
+        if self.cache_alias:
+            return caches[self.cache_alias].get(self._cache_key(info))
+        with self.lock:
+            data = self.entries.get((info.video_id, info.etag))
+            if data is not None:
+                self.entries.move_to_end((info.video_id, info.etag))
+            return data
+
+    def set(self, info: VideoFileInfo, data: bytes) -> None:
+        if self.cache_alias:
+            caches[self.cache_alias].set(
+                self._cache_key(info), data, settings.VIDEO_PREFIX_CACHE_TIMEOUT
+            )
+            return
+        with self.lock:
+            key = (info.video_id, info.etag)
+            if key in self.entries:
+                return
+            self.entries[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes and self.entries:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def invalidate(self, video_id: int) -> None:
+        """Drop the in-memory prefixes of a video."""
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == video_id]:
+                self.total_bytes -= len(self.entries.pop(key))
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the memory held by this process."""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+            }
+
+    def _cache_key(self, info: VideoFileInfo) -> str:
+        etag = info.etag.strip('"')
+        return f"video_prefix:{info.video_id}:{etag}"
+
+
+# Per-process prefix cache shared by the stream views
+video_prefix_cache = VideoPrefixCache(
+    prefix_bytes=settings.VIDEO_PREFIX_CACHE_BYTES,
+    max_bytes=settings.VIDEO_PREFIX_CACHE_MAX_BYTES,
+    cache_alias=settings.VIDEO_PREFIX_CACHE_ALIAS,
+)
@@ -0,0 +1,85 @@
+import re
+
+from django.utils.http import parse_http_date_safe
+
+# Upper bound on ranges accepted in a single Range header
+MAX_RANGES = 16
+
+RANGE_SPEC_RE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+def parse_range_header(header: str, size: int) -> list[tuple[int, int]] | None:
+    """Parse an RFC 7233 ``Range`` header against a representation size.
+
+    Args:
+        header (str): Value of the ``Range`` request header.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        list[tuple[int, int]] | None: Sorted, coalesced inclusive
+        ``(start, end)`` ranges clamped to the file size. An empty list
+        means no range is satisfiable (416). ``None`` means the header is
+        invalid or abusive and must be ignored (full 200 response).
+    """
+    unit, separator, specs = header.partition("=")
+    if not separator or unit.strip().lower() != "bytes":
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for spec in specs.split(","):
+        match = RANGE_SPEC_RE.match(spec)
+        if match is None:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+
+        if first:
+            # bytes=a-b or bytes=a-
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start >= size:
+                continue
+            ranges.append((start, min(end, size - 1)))
+        else:
+            # bytes=-n, the last n bytes
+            suffix = int(last)
+            if suffix == 0 or size == 0:
+                continue
+            ranges.append((max(size - suffix, 0), size - 1))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+    return coalesce_ranges(ranges)
+
+
+def coalesce_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent ranges into the fewest ranges."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(request, etag: str, last_modified: int) -> bool:
+    """Return True if the ``Range`` header may be honoured.
+
+    ``If-Range`` carries either an entity tag, compared strongly, or an
+    HTTP date that must equal the ``Last-Modified`` time exactly.
+    """
+    if_range = request.headers.get("If-Range", "").strip()
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def make_etag(size: int, mtime_ns: int) -> str:
+    """Build a strong entity tag from the file size and modification time."""
+    return f'"{mtime_ns:x}-{size:x}"'
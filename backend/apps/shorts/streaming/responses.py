@@ -0,0 +1,95 @@
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+
+from core.zerocopy_asgi_handler import ZEROCOPY_EXTENSION
+
+from .files import AsyncRangeIterator, MultipartRangeFile, RangeFile, RangeIterator
+from .pacing import bandwidth_scheduler
+
+# Streaming modes supported by the VIDEO_STREAM_MODE setting
+PYTHON_MODE = "python"
+SENDFILE_MODE = "sendfile"
+OFFLOAD_MODE = "offload"
+
+
+def build_stream_response(
+    request,
+    body: RangeFile | MultipartRangeFile,
+    content_type: str,
+    status: int = 200,
+    bitrate: int | None = None,
+) -> StreamingHttpResponse:
+    """Build a streaming response that sends ``body.length`` bytes of ``body``.
+
+    In ``sendfile`` mode a ``RangeFile`` body is exposed through
+    ``FileResponse.file_to_stream``, so the WSGI server's
+    ``wsgi.file_wrapper`` or an ASGI server offering the
+    ``http.response.zerocopysend`` extension can copy the bytes with
+    ``os.sendfile`` instead of looping through Python.
+
+    Under ASGI without zero-copy support the bytes are streamed by an
+    async iterator reading large chunks in the thread pool, instead of a
+    sync iterator Django would have to drive through ``sync_to_async``.
+
+    With ``VIDEO_STREAM_PACING`` enabled, Python iterators are paced to
+    the video ``bitrate`` (bits per second) and a fair share of the
+    worker budget. Zero-copy sends are left to the server.
+    """
+    scope = getattr(request, "scope", None)
+
+    if (
+        settings.VIDEO_STREAM_MODE == SENDFILE_MODE
+        and isinstance(body, RangeFile)
+        and (scope is None or ZEROCOPY_EXTENSION in (scope.get("extensions") or {}))
+    ):
+        response = FileResponse(body, status=status, content_type=content_type)
+        response.block_size = settings.VIDEO_STREAM_BLOCK_SIZE
+        if body.recorder is not None:
+            # The server may copy the bytes without calling read()
+            body.recorder.offloaded = True
+    else:
+        pacer = None
+        if settings.VIDEO_STREAM_PACING:
+            pacer = bandwidth_scheduler.open(bitrate)
+        iterator_class = AsyncRangeIterator if scope is not None else RangeIterator
+        response = StreamingHttpResponse(
+            iterator_class(body, settings.VIDEO_STREAM_BLOCK_SIZE, pacer),
+            status=status,
+            content_type=content_type,
+        )
+
+    response["Content-Length"] = str(body.length)
+    return response
+
+
+def build_offload_response(
+    file_name: str, file_path: str, content_type: str, base_url: str | None = None
+) -> HttpResponse:
+    """Build an empty response that tells the reverse proxy to send the file.
+
+    The header name and whether it carries an internal URL (nginx
+    ``X-Accel-Redirect``) or a filesystem path (``X-Sendfile``) come from
+    the ``VIDEO_STREAM_OFFLOAD_HEADERS`` entry selected by
+    ``VIDEO_STREAM_OFFLOAD_BACKEND``. Internal URLs are built under
+    ``base_url``, ``VIDEO_STREAM_OFFLOAD_URL`` by default. The proxy
+    handles Range requests itself, so the file is never opened here.
+    """
+    backend = settings.VIDEO_STREAM_OFFLOAD_BACKEND
+    mapping = settings.VIDEO_STREAM_OFFLOAD_HEADERS.get(backend)
+    if mapping is None:
+        raise ImproperlyConfigured(
+            f"No offload header configured for stream backend '{backend}'."
+        )
+
+    if mapping["value"] == "url":
+        base_url = base_url or settings.VIDEO_STREAM_OFFLOAD_URL
+        value = base_url.rstrip("/") + "/" + quote(file_name)
+    else:
+        value = file_path
+
+    response = HttpResponse(content_type=content_type)
+    response[mapping["header"]] = value
+    return response
@@ -0,0 +1,64 @@
+import math
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core import signing
+
+# Salt separating stream tokens from other signed values
+STREAM_TOKEN_SALT = "shorts.video-stream"
+
+
+@dataclass(frozen=True)
+class StreamToken:
+    """Decoded claims of a signed stream URL."""
+
+    video_id: int
+    name: str
+    expires_at: int
+    private: bool
+
+
+def sign_stream_token(video_id: int, name: str, private: bool) -> str:
+    """Sign the claims needed to stream a video without auth or a DB query.
+
+    The expiry is rounded up to a whole ``VIDEO_STREAM_SIGNED_URL_TTL``
+    window, so every viewer of a public video gets the same URL within a
+    window and a shared cache or CDN can reuse the responses.
+
+    Args:
+        video_id (int): The video to stream.
+        name (str): The video file name relative to MEDIA_ROOT.
+        private (bool): Whether responses must not be stored in shared caches.
+
+    Returns:
+        str: The URL-safe signed token.
+    """
+    ttl = settings.VIDEO_STREAM_SIGNED_URL_TTL
+    expires_at = (math.ceil(time.time() / ttl) + 1) * ttl
+    # A plain Signer keeps the token free of a signing timestamp
+    return signing.Signer(salt=STREAM_TOKEN_SALT).sign_object(
+        {"v": video_id, "n": name, "e": expires_at, "p": int(private)},
+        compress=True,
+    )
+
+
+def unsign_stream_token(token: str) -> StreamToken | None:
+    """Verify a stream token's HMAC and expiry.
+
+    Returns:
+        StreamToken | None: The token claims, or None if the signature is
+        invalid or the token has expired.
+    """
+    try:
+        claims = signing.Signer(salt=STREAM_TOKEN_SALT).unsign_object(token)
+    except signing.BadSignature:
+        return None
+    if claims["e"] < time.time():
+        return None
+    return StreamToken(
+        video_id=claims["v"],
+        name=claims["n"],
+        expires_at=claims["e"],
+        private=bool(claims["p"]),
+    )
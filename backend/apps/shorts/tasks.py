@@ -0,0 +1,90 @@
+from datetime import timedelta
+from logging import getLogger
+
+from django.apps import apps
+from django.core.management import call_command
+from jobs.registry import periodic_task, task
+from shorts.models.video import Video
+from shorts.processing import (
+    generate_storyboard,
+    generate_thumbnails,
+    probe_video,
+    process_pending_hls,
+    process_uploaded_video,
+)
+
+logger = getLogger(__name__)
+
+
+@task(queue="media", priority=10)
+def process_video(video_id: int) -> None:
+    """Prepare a new upload for streaming, then queue its derived media."""
+    video = Video.objects.filter(pk=video_id).first()
+    if video is None:
+        return
+    # ffmpeg and the MP4 parsers need the file on the local disk
+    if not video.has_local_file():
+        logger.info(f"Skipped processing of remote video {video_id}")
+        return
+
+    process_uploaded_video(video)
+    probe_video_metadata.enqueue(video_id)
+    generate_video_thumbnails.enqueue(video_id)
+    transcode_video_hls.enqueue(video_id)
+    generate_video_storyboard.enqueue(video_id)
+
+
+@task(queue="media", priority=5)
+def probe_video_metadata(video_id: int) -> None:
+    """Store the duration, resolution, bitrate and codecs of a video."""
+    video = Video.objects.filter(pk=video_id).first()
+    if video is not None and video.has_local_file():
+        probe_video(video)
+
+
+@task(queue="media", priority=5)
+def generate_video_thumbnails(video_id: int) -> None:
+    """Render the feed card thumbnails of a video."""
+    video = Video.objects.filter(pk=video_id).first()
+    if video is not None and video.has_local_file():
+        generate_thumbnails(video)
+
+
+@task(queue="media", max_attempts=1)
+def transcode_video_hls(video_id: int) -> None:
+    """Transcode a pending video into HLS, failures are recorded on the row."""
+    process_pending_hls(video_id)
+
+
+@task(queue="media")
+def generate_video_storyboard(video_id: int) -> None:
+    """Render the scrubbing storyboard of a video."""
+    video = Video.objects.filter(pk=video_id).first()
+    if video is not None and video.has_local_file():
+        generate_storyboard(video)
+
+
+@periodic_task(every=timedelta(hours=1))
+def clear_expired_uploads() -> None:
+    """Discard resumable and direct uploads that were never finalized."""
+    call_command("clear_expired_uploads")
+
+
+@task(queue="media")
+def release_tier_file(tier: str, name: str) -> None:
+    """Delete the copy a video left behind in its previous storage tier."""
+    Video.get_tier_storage(tier).delete(name)
+
+
+@task(queue="media")
+def release_media_file(label: str, name: str) -> None:
+    """Delete the old name of a file moved by ``shard_media_files``."""
+    app_label, model_name, field_name = label.split(".")
+    field = apps.get_model(app_label, model_name)._meta.get_field(field_name)
+    field.storage.delete(name)
+
+
+@periodic_task(every=timedelta(hours=1))
+def tier_videos() -> None:
+    """Move videos between the hot and cold storage by their recent views."""
+    call_command("tier_videos")
@@ -0,0 +1,67 @@
+import threading
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+# Prune expired in-process sessions once this many are remembered
+MAX_LOCAL_SESSIONS = 10000
+
+
+class StreamSessionRateThrottle(SimpleRateThrottle):
+    """
+    Throttle video streams per viewing session instead of per chunk.
+
+    The first request for a video opens a stream session and charges one
+    request against the ``stream_session`` rate. Later Range requests for
+    the same video within ``VIDEO_STREAM_SESSION_TTL`` seconds are let
+    through after an in-process lookup, or a single cache read when the
+    session was opened by another worker.
+    """
+
+    # Define the scope for this throttle class
+    # This scope should match the key in settings DEFAULT_THROTTLE_RATES
+    scope = "stream_session"
+
+    # Open sessions of this worker process, mapped to their expiry time
+    sessions: dict[str, float] = {}
+    sessions_lock = threading.Lock()
+
+    def get_cache_key(self, request, view) -> str:
+        """Identify the viewer by user ID, or by IP for anonymous requests."""
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+    def allow_request(self, request, view) -> bool:
+        video_id = view.kwargs.get("video_id")
+        if self.rate is None or video_id is None:
+            return super().allow_request(request, view)
+
+        session_key = f"{self.get_cache_key(request, view)}_video_{video_id}"
+        now = self.timer()
+
+        # Session already open in this worker, no cache round trip
+        with self.sessions_lock:
+            if self.sessions.get(session_key, 0) > now:
+                return True
+
+        # Session opened by another worker, or a new session to charge
+        if self.cache.get(session_key) is None:
+            if not super().allow_request(request, view):
+                return False
+            self.cache.set(session_key, True, settings.VIDEO_STREAM_SESSION_TTL)
+
+        self.remember_session(session_key, now + settings.VIDEO_STREAM_SESSION_TTL)
+        return True
+
+    def remember_session(self, session_key: str, expires_at: float) -> None:
+        """Record an open session locally, pruning expired ones when full."""
+        with self.sessions_lock:
+            if len(self.sessions) >= MAX_LOCAL_SESSIONS:
+                now = self.timer()
+                for key in [k for k, v in self.sessions.items() if v <= now]:
+                    del self.sessions[key]
+            if len(self.sessions) < MAX_LOCAL_SESSIONS:
+                self.sessions[session_key] = expires_at
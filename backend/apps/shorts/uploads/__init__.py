@@ -0,0 +1,56 @@
+"""
+Helpers for receiving short video uploads.
+
+Includes:
+- UploadError: Raised when a request violates the upload protocol
+- create_upload: Opens a resumable upload session with a sparse staging file
+- parse_upload_checksum: Parses a tus-style Upload-Checksum header
+- write_chunk: Writes and verifies one chunk of a resumable upload
+- finalize_upload: Links a complete upload into the video storage location
+- discard_upload: Removes the staging file of an upload
+- HashingVideoUploadHandler: Streams a multipart video upload to the staging
+  area while computing its SHA-256, size and MIME type
+- sniff_video_content_type: Guesses a video MIME type from its leading bytes
+- find_blob: Looks up a stored blob by digest and size
+- issue_blob_challenge: Asks a client to prove it holds a stored file
+- verify_blob_challenge: Checks a proof and returns the claimed blob
+- create_direct_upload: Issues a presigned URL to upload straight to storage
+- confirm_direct_upload: Checks a directly uploaded object before use
+- discard_direct_upload: Deletes an unconfirmed direct upload and its object
+"""
+
+from .dedup import find_blob, issue_blob_challenge, verify_blob_challenge
+from .direct import confirm_direct_upload, create_direct_upload, discard_direct_upload
+from .handlers import (
+    HashingVideoUploadHandler,
+    StagedUploadedFile,
+    sniff_video_content_type,
+)
+from .resumable import (
+    UploadError,
+    create_upload,
+    discard_upload,
+    finalize_upload,
+    get_staging_path,
+    parse_upload_checksum,
+    write_chunk,
+)
+
+__all__ = [
+    "UploadError",
+    "create_upload",
+    "discard_upload",
+    "finalize_upload",
+    "get_staging_path",
+    "parse_upload_checksum",
+    "write_chunk",
+    "HashingVideoUploadHandler",
+    "StagedUploadedFile",
+    "sniff_video_content_type",
+    "find_blob",
+    "issue_blob_challenge",
+    "verify_blob_challenge",
+    "create_direct_upload",
+    "confirm_direct_upload",
+    "discard_direct_upload",
+]
@@ -0,0 +1,78 @@
+import hmac
+import secrets
+
+from django.conf import settings
+from django.core import signing
+from shorts.models.blob import Blob
+from shorts.storage import content_addressed_storage
+
+from .handlers import SNIFF_BYTES, sniff_video_content_type
+
+# Salt separating blob claim tokens from other signed values
+BLOB_CLAIM_SALT = "shorts.blob-claim"
+
+
+def is_video_blob(blob: Blob) -> bool:
+    """Return whether a blob holds a video rather than, say, a thumbnail."""
+    try:
+        with content_addressed_storage.open(blob.name, "rb") as file:
+            head = file.read(SNIFF_BYTES)
+    except FileNotFoundError:
+        return False
+    return sniff_video_content_type(head).startswith("video/")
+
+
+def find_blob(sha256: str, size: int) -> Blob | None:
+    """Return the stored video blob with the given digest and size, if any."""
+    blob = Blob.objects.filter(sha256=sha256.lower(), size=size).first()
+    if blob is None or not is_video_blob(blob):
+        return None
+    return blob
+
+
+def issue_blob_challenge(blob: Blob, user_id: int) -> dict | None:
+    """Ask the client to hash a byte range of a file it claims to hold.
+
+    Knowing a digest alone must not grant access to someone else's video,
+    so reusing a stored blob requires proof that the client has the bytes.
+
+    Returns:
+        dict | None: The range to hash and a signed token to send back,
+        or None if the blob has no sampled ranges.
+    """
+    if not blob.challenges:
+        return None
+
+    index = secrets.randbelow(len(blob.challenges))
+    offset, length, _ = blob.challenges[index]
+    token = signing.dumps(
+        {"b": blob.pk, "u": user_id, "i": index}, salt=BLOB_CLAIM_SALT, compress=True
+    )
+    return {"offset": offset, "length": length, "token": token}
+
+
+def verify_blob_challenge(token: str, proof: str, user_id: int) -> Blob | None:
+    """Check a client's hex SHA-256 of the challenged byte range.
+
+    Returns:
+        Blob | None: The claimed blob, or None if the token is invalid,
+        expired, issued to another user, the proof does not match or the
+        blob is not a video.
+    """
+    try:
+        claims = signing.loads(
+            token, salt=BLOB_CLAIM_SALT, max_age=settings.VIDEO_BLOB_CHALLENGE_TTL
+        )
+    except signing.BadSignature:
+        return None
+    if claims["u"] != user_id:
+        return None
+
+    blob = Blob.objects.filter(pk=claims["b"]).first()
+    if blob is None or claims["i"] >= len(blob.challenges):
+        return None
+    if not hmac.compare_digest(blob.challenges[claims["i"]][2], proof.lower()):
+        return None
+    if not is_video_blob(blob):
+        return None
+    return blob
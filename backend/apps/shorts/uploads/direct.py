@@ -0,0 +1,121 @@
+import os
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+from shorts.models.video import Video
+from shorts.models.video_upload import VideoDirectUpload
+from shorts.storage import (
+    get_video_storage,
+    presign_put_url,
+    read_object_head,
+    supports_presigned_uploads,
+)
+
+from .handlers import SNIFF_BYTES, sniff_video_content_type
+from .resumable import UploadError
+
+# Salt separating direct upload tokens from other signed values
+DIRECT_UPLOAD_SALT = "shorts.direct-upload"
+
+
+def create_direct_upload(user, filename: str, size: int, content_type: str) -> dict:
+    """Issue a presigned URL for uploading a video straight to object storage.
+
+    The object key is chosen by the server and recorded as a pending
+    ``VideoDirectUpload``, so objects that are never confirmed are deleted
+    once it expires. The returned token refers to that record.
+
+    Returns:
+        dict: The ``url`` and ``headers`` of the PUT request, the storage
+        ``name``, the confirmation ``token`` and the URL's ``expires_at``.
+
+    Raises:
+        UploadError: If the video storage cannot take direct uploads.
+    """
+    storage = get_video_storage()
+    if not supports_presigned_uploads(storage):
+        raise UploadError("Direct uploads need an S3-compatible video storage.")
+
+    ext = os.path.splitext(filename)[1].lower()
+    field = Video._meta.get_field("video")
+    name = field.generate_filename(None, f"{uuid.uuid4().hex}{ext}")
+    expiry = settings.VIDEO_DIRECT_UPLOAD_EXPIRY
+    upload = VideoDirectUpload.objects.create(
+        owner=user,
+        name=name,
+        size=size,
+        expires_at=timezone.now() + timedelta(seconds=settings.VIDEO_UPLOAD_EXPIRY),
+    )
+
+    return {
+        "method": "PUT",
+        "url": presign_put_url(storage, name, content_type, expiry),
+        "headers": {"Content-Type": content_type},
+        "name": name,
+        "token": signing.dumps(
+            {"i": str(upload.pk), "u": user.pk},
+            salt=DIRECT_UPLOAD_SALT,
+            compress=True,
+        ),
+        "expires_at": timezone.now() + timedelta(seconds=expiry),
+    }
+
+
+def confirm_direct_upload(user, token: str) -> str:
+    """Check a directly uploaded object before a video is created for it.
+
+    The pending record is locked and deleted, so concurrent confirmations
+    of one token cannot both succeed. Call this in the transaction that
+    creates the video, a failed save then restores the record. Objects
+    that are too large or are not videos are left to
+    ``clear_expired_uploads``, which deletes them with their record, as a
+    storage delete could not be rolled back.
+
+    Returns:
+        str: The storage name of the uploaded video file.
+
+    Raises:
+        UploadError: If the token is invalid, the object is missing,
+        already used, of the wrong size or not a video.
+    """
+    try:
+        claims = signing.loads(
+            token, salt=DIRECT_UPLOAD_SALT, max_age=settings.VIDEO_UPLOAD_EXPIRY
+        )
+    except signing.BadSignature:
+        raise UploadError("The upload token is invalid or has expired.")
+    if claims["u"] != user.pk:
+        raise UploadError("The upload token is invalid or has expired.")
+
+    upload = (
+        VideoDirectUpload.objects.select_for_update()
+        .filter(pk=claims["i"], owner=user, expires_at__gt=timezone.now())
+        .first()
+    )
+    if upload is None:
+        raise UploadError("The upload was already confirmed or has expired.")
+
+    name = upload.name
+    storage = get_video_storage()
+    if not storage.exists(name):
+        raise UploadError("The file has not been uploaded yet.")
+
+    size = storage.size(name)
+    if size != upload.size or size > settings.VIDEO_UPLOAD_MAX_SIZE:
+        raise UploadError(f"Expected {upload.size} bytes, received {size}.")
+
+    head = read_object_head(storage, name, SNIFF_BYTES)
+    if not sniff_video_content_type(head).startswith("video/"):
+        raise UploadError("The uploaded file is not a valid video.")
+
+    upload.delete()
+    return name
+
+
+def discard_direct_upload(upload: VideoDirectUpload) -> None:
+    """Delete an unconfirmed direct upload and its object, if it was uploaded."""
+    get_video_storage().delete(upload.name)
+    upload.delete()
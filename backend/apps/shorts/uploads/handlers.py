@@ -0,0 +1,101 @@
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+
+# Leading bytes kept from each upload to sniff its container format
+SNIFF_BYTES = 64
+
+
+def sniff_video_content_type(head: bytes) -> str:
+    """Guess the MIME type of a video from its leading bytes."""
+    if head[4:8] == b"ftyp":
+        brand = head[8:12]
+        if brand == b"qt  ":
+            return "video/quicktime"
+        if brand.startswith(b"3g"):
+            return "video/3gpp"
+        return "video/mp4"
+    if head[:4] == b"\x1aE\xdf\xa3":
+        return "video/webm" if b"webm" in head else "video/x-matroska"
+    if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+        return "video/x-msvideo"
+    return "application/octet-stream"
+
+
+class StagedUploadedFile(TemporaryUploadedFile):
+    """Temporary upload created next to the video storage instead of in /tmp.
+
+    The file system storage moves files exposing ``temporary_file_path``
+    with a rename, so a staged upload reaches ``upload_to`` without its
+    bytes being copied again.
+    """
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        staging_dir = os.path.join(
+            settings.MEDIA_ROOT, settings.VIDEO_UPLOAD_STAGING_DIR
+        )
+        os.makedirs(staging_dir, exist_ok=True)
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(suffix=".upload" + ext, dir=staging_dir)
+        UploadedFile.__init__(
+            self, file, name, content_type, size, charset, content_type_extra
+        )
+        self.sha256 = ""
+
+
+class HashingVideoUploadHandler(FileUploadHandler):
+    """Stream the video field of a multipart upload to the staging area.
+
+    The SHA-256, size and sniffed MIME type are computed while the chunks
+    are written, so the bytes are handled once. Other file fields fall
+    through to the default upload handlers.
+    """
+
+    # Form field holding the video file
+    video_field = "video"
+
+    def new_file(self, field_name, *args, **kwargs) -> None:
+        super().new_file(field_name, *args, **kwargs)
+        if field_name != self.video_field:
+            self.file = None
+            return
+
+        self.file = StagedUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
+        self.digest = hashlib.sha256()
+        self.head = b""
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
+        if self.file is None:
+            return raw_data
+
+        self.file.write(raw_data)
+        self.digest.update(raw_data)
+        if len(self.head) < SNIFF_BYTES:
+            self.head += raw_data[: SNIFF_BYTES - len(self.head)]
+        return None
+
+    def file_complete(self, file_size: int) -> StagedUploadedFile | None:
+        if self.file is None:
+            return None
+
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.digest.hexdigest()
+        self.file.content_type = sniff_video_content_type(self.head)
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        if getattr(self, "file", None) is not None:
+            temp_location = self.file.temporary_file_path()
+            try:
+                self.file.close()
+                os.remove(temp_location)
+            except FileNotFoundError:
+                pass
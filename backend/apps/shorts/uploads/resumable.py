@@ -0,0 +1,175 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import tempfile
+from datetime import timedelta
+from logging import getLogger
+from typing import BinaryIO
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from shorts.models.video import Video
+from shorts.models.video_upload import VideoUpload, VideoUploadChunk
+from shorts.storage import hash_file
+
+logger = getLogger(__name__)
+
+# Bytes read from the request body per write while storing a chunk
+WRITE_BLOCK_SIZE = 256 * 1024
+
+
+class UploadError(Exception):
+    """Raised when a chunk or finalize request violates the upload protocol."""
+
+
+class StagedFile(File):
+    """Assembled upload the file system storage can move instead of copy."""
+
+    def temporary_file_path(self) -> str:
+        return self.file.name
+
+
+def get_staging_path(upload: VideoUpload) -> str:
+    """Return the absolute path chunks of an upload are assembled into."""
+    return os.path.join(
+        settings.MEDIA_ROOT, settings.VIDEO_UPLOAD_STAGING_DIR, f"{upload.pk}.part"
+    )
+
+
+def parse_upload_checksum(header: str) -> bytes | None:
+    """Parse a tus-style ``Upload-Checksum: sha256 <base64 digest>`` header."""
+    try:
+        algorithm, value = header.split()
+        digest = base64.b64decode(value, validate=True)
+    except (ValueError, binascii.Error):
+        return None
+    if algorithm.lower() != "sha256" or len(digest) != hashlib.sha256().digest_size:
+        return None
+    return digest
+
+
+def create_upload(owner, filename: str, size: int) -> VideoUpload:
+    """Open an upload session and reserve its staging file.
+
+    The staging file is created sparse at its final size, so chunks can
+    be written at their offsets in any order and in parallel.
+    """
+    upload = VideoUpload.objects.create(
+        owner=owner,
+        filename=os.path.basename(filename),
+        size=size,
+        chunk_size=settings.VIDEO_UPLOAD_CHUNK_SIZE,
+        expires_at=timezone.now() + timedelta(seconds=settings.VIDEO_UPLOAD_EXPIRY),
+    )
+    staging_path = get_staging_path(upload)
+    os.makedirs(os.path.dirname(staging_path), exist_ok=True)
+    with open(staging_path, "wb") as file:
+        file.truncate(size)
+    return upload
+
+
+def write_chunk(
+    upload: VideoUpload, index: int, stream: BinaryIO, checksum: bytes
+) -> VideoUploadChunk:
+    """Write one chunk at its offset, verifying its length and SHA-256.
+
+    A chunk may be sent again, in which case it simply overwrites the
+    same byte range. The body is received and verified into a spooled
+    buffer first, so parallel chunks only hold the upload row lock while
+    it is copied into the staging file and cannot race ``finalize_upload``.
+
+    Raises:
+        UploadError: If the index, length or checksum is wrong, or the
+        upload was finalized meanwhile.
+    """
+    if not 0 <= index < upload.total_chunks:
+        raise UploadError(
+            f"Chunk index must be between 0 and {upload.total_chunks - 1}."
+        )
+
+    length = upload.get_chunk_length(index)
+    offset = index * upload.chunk_size
+    digest = hashlib.sha256()
+    received = 0
+
+    with tempfile.SpooledTemporaryFile(max_size=WRITE_BLOCK_SIZE) as buffer:
+        while received < length:
+            data = stream.read(min(WRITE_BLOCK_SIZE, length - received))
+            if not data:
+                break
+            digest.update(data)
+            buffer.write(data)
+            received += len(data)
+        trailing = stream.read(1)
+
+        if received != length or trailing:
+            raise UploadError(f"Chunk {index} must be exactly {length} bytes.")
+        if not hmac.compare_digest(digest.digest(), checksum):
+            raise UploadError(f"Checksum of chunk {index} does not match.")
+
+        with transaction.atomic():
+            # Finalizing holds this lock while it moves the staging file
+            locked = VideoUpload.objects.select_for_update().filter(pk=upload.pk)
+            if locked.first() is None:
+                raise UploadError("The upload was already finalized.")
+
+            buffer.seek(0)
+            written = 0
+            fd = os.open(get_staging_path(upload), os.O_WRONLY)
+            try:
+                while data := buffer.read(WRITE_BLOCK_SIZE):
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.pwrite(fd, view, offset + written) :]
+                    written += len(data)
+            finally:
+                os.close(fd)
+
+            chunk, _ = VideoUploadChunk.objects.update_or_create(
+                upload=upload, index=index, defaults={"checksum": digest.hexdigest()}
+            )
+    return chunk
+
+
+def finalize_upload(upload: VideoUpload) -> tuple[str, str]:
+    """Save a complete upload through the storage of ``Video.video``.
+
+    The staging file lives under MEDIA_ROOT and is handed to the storage
+    as a temporary file, so it is moved into place instead of copied.
+    Callers lock the upload row first, so only one request finalizes it.
+
+    Returns:
+        tuple[str, str]: The storage name to assign to ``Video.video`` and
+        the hex SHA-256 of the file.
+
+    Raises:
+        UploadError: If any chunk has not been received yet.
+    """
+    missing = upload.total_chunks - upload.chunks.count()
+    if missing:
+        raise UploadError(f"{missing} of {upload.total_chunks} chunks are missing.")
+
+    field = Video._meta.get_field("video")
+    with open(get_staging_path(upload), "rb") as file:
+        staged = StagedFile(file, upload.filename)
+        staged.sha256 = hash_file(staged)
+        name = field.storage.save(
+            field.generate_filename(None, upload.filename),
+            staged,
+            max_length=field.max_length,
+        )
+
+    logger.info(f"Finalized upload {upload.pk} into: {name}")
+    return name, staged.sha256
+
+
+def discard_upload(upload: VideoUpload) -> None:
+    """Remove the staging file of a cancelled, expired or finalized upload."""
+    try:
+        os.remove(get_staging_path(upload))
+    except FileNotFoundError:
+        pass
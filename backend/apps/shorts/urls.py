@@ -5,9 +5,23 @@ from .views.comment import CommentModelViewSet
 from .views.follow import FollowModelViewSet
 from .views.like import LikeModelViewSet
 from .views.report import ReportModelViewSet
+from .views.signed_video_stream import SignedVideoStreamAPIView
 from .views.tag import TagModelViewSet
 from .views.video import VideoModelViewSet
+from .views.video_blob import VideoBlobCheckAPIView, VideoBlobClaimAPIView
+from .views.video_direct_upload import (
+    VideoDirectUploadAPIView,
+    VideoDirectUploadConfirmAPIView,
+)
+from .views.video_segment import VideoSegmentAPIView
 from .views.video_stream import VideoStreamAPIView
+from .views.video_stream_metrics import VideoStreamMetricsAPIView
+from .views.video_upload import (
+    VideoUploadAPIView,
+    VideoUploadChunkAPIView,
+    VideoUploadDetailAPIView,
+    VideoUploadFinalizeAPIView,
+)
 from .views.view import ViewModelViewSet
 
 # Define empty urlpatterns
@@ -17,7 +31,68 @@ urlpatterns = [
         "videos/streams/<int:video_id>/",
         VideoStreamAPIView.as_view(),
         name="videos-stream",
-    )
+    ),
+    # Add short videos signed streams endpoint
+    path(
+        "videos/streams/signed/<str:token>/",
+        SignedVideoStreamAPIView.as_view(),
+        name="videos-stream-signed",
+    ),
+    # Add short videos HLS playlists and segments endpoint
+    path(
+        "videos/streams/<int:video_id>/hls/<path:file_name>",
+        VideoSegmentAPIView.as_view(),
+        name="videos-stream-hls",
+    ),
+    # Add short videos streams metrics endpoint
+    path(
+        "videos/streams/metrics/",
+        VideoStreamMetricsAPIView.as_view(),
+        name="videos-stream-metrics",
+    ),
+    # Add short videos resumable uploads endpoints
+    path(
+        "videos/uploads/",
+        VideoUploadAPIView.as_view(),
+        name="videos-upload",
+    ),
+    path(
+        "videos/uploads/<uuid:upload_id>/",
+        VideoUploadDetailAPIView.as_view(),
+        name="videos-upload-detail",
+    ),
+    path(
+        "videos/uploads/<uuid:upload_id>/chunks/<int:index>/",
+        VideoUploadChunkAPIView.as_view(),
+        name="videos-upload-chunk",
+    ),
+    path(
+        "videos/uploads/<uuid:upload_id>/finalize/",
+        VideoUploadFinalizeAPIView.as_view(),
+        name="videos-upload-finalize",
+    ),
+    # Add short videos deduplicated upload endpoints
+    path(
+        "videos/blobs/check/",
+        VideoBlobCheckAPIView.as_view(),
+        name="videos-blob-check",
+    ),
+    path(
+        "videos/blobs/claim/",
+        VideoBlobClaimAPIView.as_view(),
+        name="videos-blob-claim",
+    ),
+    # Add short videos direct-to-storage upload endpoints
+    path(
+        "videos/direct-uploads/",
+        VideoDirectUploadAPIView.as_view(),
+        name="videos-direct-upload",
+    ),
+    path(
+        "videos/direct-uploads/confirm/",
+        VideoDirectUploadConfirmAPIView.as_view(),
+        name="videos-direct-upload-confirm",
+    ),
 ]
 
 # Create a default Drf router
@@ -0,0 +1,86 @@
+import time
+
+from django.http import (
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseGone,
+    HttpResponseNotFound,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from rest_framework.permissions import AllowAny
+from shorts.models.video import Video
+from shorts.streaming import StreamToken, unsign_stream_token, video_file_cache
+
+from .video_stream import VideoStreamAPIView
+
+
+class SignedVideoStreamAPIView(VideoStreamAPIView):
+    """View to stream short videos from HMAC-signed, expiring URLs.
+
+    The signature already carries the access decision, so requests skip
+    authentication, throttling and, while the file is cached, the ``Video``
+    query.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    throttle_classes = []
+
+    def get(
+        self, request, token
+    ) -> HttpResponse | HttpResponseForbidden | StreamingHttpResponse:
+        started_at = time.monotonic()
+
+        claims = unsign_stream_token(token)
+        if claims is None:
+            return HttpResponseForbidden("Stream URL is invalid or has expired.")
+
+        info = video_file_cache.get(claims.video_id)
+        if info is not None and info.name == claims.name:
+            try:
+                return self.cache_response(
+                    self.stream_video(request, info, started_at), claims
+                )
+            except FileNotFoundError:
+                # Another worker evicted the file from the disk cache
+                video_file_cache.invalidate(claims.video_id)
+
+        # Only the file name and tier are looked up when the file cache misses
+        row = (
+            Video.objects.filter(id=claims.video_id)
+            .values_list("video", "storage_tier")
+            .first()
+        )
+        if row is None:
+            return HttpResponseNotFound("Video file not found.")
+        name, tier = row
+        if name != claims.name:
+            # The file was replaced after the URL was signed
+            return HttpResponseGone("Stream URL no longer points to the video file.")
+
+        storage = Video.get_tier_storage(tier)
+        path = self.get_local_path(storage, claims.name)
+        if path is None:
+            return HttpResponseRedirect(storage.url(claims.name))
+
+        try:
+            info = video_file_cache.load(
+                claims.video_id,
+                claims.name,
+                path,
+                cold=tier == Video.STORAGE_COLD,
+            )
+        except FileNotFoundError:
+            # Deleted or moved to another tier since the row was read
+            return HttpResponseNotFound("Video file not found.")
+        return self.cache_response(self.stream_video(request, info, started_at), claims)
+
+    def cache_response(
+        self, response: HttpResponse | StreamingHttpResponse, claims: StreamToken
+    ) -> HttpResponse | StreamingHttpResponse:
+        """Let caches keep the response until the signed URL expires."""
+        max_age = max(int(claims.expires_at - time.time()), 0)
+        visibility = "private" if claims.private else "public"
+        response["Cache-Control"] = f"{visibility}, max-age={max_age}"
+        return response
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_core.viewsets.mixins import ModelChoiceFieldActionMixin
 from rest_framework import filters
@@ -7,7 +8,9 @@ from rest_framework.viewsets import ModelViewSet
 from shorts.filters import VideoFilterSet
 from shorts.models.video import Video
 from shorts.permissions import CanUpdateAndDelete
-from shorts.serializers.video import VideoSerializer
+from shorts.serializers.video import VideoDetailSerializer, VideoSerializer
+from shorts.tasks import generate_video_thumbnails, process_video
+from shorts.uploads import HashingVideoUploadHandler
 from rest_core.cache.mixins import CacheMixin
 
 
@@ -32,8 +35,57 @@ class VideoModelViewSet(
     filterset_class = VideoFilterSet
     # filterset_fields = ["owner", "tags"]
     search_fields = ["caption"]
-    ordering_fields = ["id", "updated_at"]
+    ordering_fields = ["id", "updated_at", "duration", "height", "bitrate"]
+
+    def initialize_request(self, request, *args, **kwargs):
+        """Stream uploaded videos to the staging area while hashing them."""
+        request.upload_handlers = [
+            HashingVideoUploadHandler(request),
+            *request.upload_handlers,
+        ]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def get_serializer_class(self):
+        """Expose the storyboard sprite and map on the detail payload only."""
+        if self.action == "retrieve":
+            return VideoDetailSerializer
+        return super().get_serializer_class()
+
+    def get_serializer_context(self) -> dict:
+        """Pick the thumbnail size that fits a list card or a detail page."""
+        context = super().get_serializer_context()
+        size = self.request.query_params.get("thumbnail_size")
+        if size not in settings.VIDEO_THUMBNAIL_SIZES:
+            size = (
+                settings.VIDEO_THUMBNAIL_LIST_SIZE
+                if self.action == "list"
+                else settings.VIDEO_THUMBNAIL_DETAIL_SIZE
+            )
+        context["thumbnail_size"] = size
+        return context
 
     def perform_create(self, serializer) -> None:
-        """Create a new short video with the owner."""
-        serializer.save(owner=self.request.user)
+        """Create a new short video with the owner and queue its processing."""
+        video_file = serializer.validated_data.get("video")
+        video = serializer.save(
+            owner=self.request.user, sha256=getattr(video_file, "sha256", "")
+        )
+        process_video.enqueue(video.pk)
+
+    def perform_update(self, serializer) -> None:
+        """Update a short video, recording the digest of a replaced file."""
+        video_file = serializer.validated_data.get("video")
+        if video_file is None:
+            video = serializer.save()
+            if "thumbnail" in serializer.validated_data:
+                generate_video_thumbnails.enqueue(video.pk)
+            return
+
+        # Derived media of the previous file must be rebuilt
+        video = serializer.save(
+            sha256=getattr(video_file, "sha256", ""),
+            is_faststart=False,
+            hls_status=Video.HLS_PENDING,
+            storage_tier=Video.STORAGE_HOT,
+        )
+        process_video.enqueue(video.pk)
@@ -0,0 +1,79 @@
+from django.conf import settings
+from rest_core.response import failure_response, success_response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
+from rest_framework.views import APIView
+from shorts.serializers.video import VideoSerializer
+from shorts.serializers.video_upload import VideoUploadFinalizeSerializer
+from shorts.storage import content_addressed_storage
+from shorts.tasks import process_video
+from shorts.uploads import find_blob, issue_blob_challenge, verify_blob_challenge
+
+
+class VideoBlobCheckAPIView(APIView):
+    """API view to ask whether the server already holds a video file.
+
+    When it does, the response carries a challenge; answering it through
+    ``VideoBlobClaimAPIView`` creates the video without sending the bytes.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request) -> Response:
+        sha256 = str(request.data.get("sha256", "")).lower()
+        try:
+            size = int(request.data.get("size", ""))
+        except (TypeError, ValueError):
+            size = None
+
+        if len(sha256) != 64 or size is None:
+            return failure_response(
+                message="Invalid file digest",
+                errors={"sha256": ["Send the hex SHA-256 and the size of the file."]},
+            )
+
+        blob = None
+        if settings.VIDEO_CONTENT_ADDRESSED_STORAGE:
+            blob = find_blob(sha256, size)
+        challenge = blob and issue_blob_challenge(blob, request.user.id)
+        if not challenge:
+            return success_response(message="File not found", data={"exists": False})
+
+        return success_response(
+            message="File found", data={"exists": True, "challenge": challenge}
+        )
+
+
+class VideoBlobClaimAPIView(APIView):
+    """API view to create a short video from a file the server already holds"""
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request) -> Response:
+        serializer = VideoUploadFinalizeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return failure_response(
+                message="Invalid video details", errors=serializer.errors
+            )
+
+        blob = verify_blob_challenge(
+            str(request.data.get("token", "")),
+            str(request.data.get("proof", "")),
+            request.user.id,
+        )
+        if blob is None or not content_addressed_storage.retain(blob.name):
+            return failure_response(
+                message="Invalid file claim",
+                errors={"proof": ["The challenge is invalid, expired or unmet."]},
+            )
+
+        video = serializer.save(owner=request.user, video=blob.name, sha256=blob.sha256)
+        process_video.enqueue(video.pk)
+
+        return success_response(
+            message="Video created",
+            data=VideoSerializer(video, context={"request": request}).data,
+        )
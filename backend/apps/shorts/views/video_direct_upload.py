@@ -0,0 +1,72 @@
+from django.db import transaction
+from rest_core.response import failure_response, success_response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.throttling import UserRateThrottle
+from rest_framework.views import APIView
+from shorts.serializers.video import VideoSerializer
+from shorts.serializers.video_upload import (
+    VideoDirectUploadSerializer,
+    VideoUploadFinalizeSerializer,
+)
+from shorts.tasks import process_video
+from shorts.uploads import UploadError, confirm_direct_upload, create_direct_upload
+
+
+class VideoDirectUploadAPIView(APIView):
+    """API view to issue a presigned URL for uploading straight to storage.
+
+    The client PUTs the file to the returned URL with the returned headers,
+    so the bytes never pass through the app servers, then confirms the
+    upload through ``VideoDirectUploadConfirmAPIView``.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request) -> Response:
+        serializer = VideoDirectUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return failure_response(message="Invalid upload", errors=serializer.errors)
+
+        try:
+            upload = create_direct_upload(request.user, **serializer.validated_data)
+        except UploadError as error:
+            return failure_response(
+                message="Direct uploads unavailable", errors={"upload": [str(error)]}
+            )
+
+        return success_response(message="Upload URL created", data=upload)
+
+
+class VideoDirectUploadConfirmAPIView(APIView):
+    """API view to create a short video from a directly uploaded file"""
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request) -> Response:
+        serializer = VideoUploadFinalizeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return failure_response(
+                message="Invalid video details", errors=serializer.errors
+            )
+
+        try:
+            # The pending upload stays locked until the video row exists
+            with transaction.atomic():
+                name = confirm_direct_upload(
+                    request.user, str(request.data.get("token", ""))
+                )
+                video = serializer.save(owner=request.user, video=name)
+        except UploadError as error:
+            return failure_response(
+                message="Upload not confirmed", errors={"token": [str(error)]}
+            )
+
+        process_video.enqueue(video.pk)
+
+        return success_response(
+            message="Video created",
+            data=VideoSerializer(video, context={"request": request}).data,
+        )
@@ -0,0 +1,62 @@
+import os
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import HttpResponse, HttpResponseNotFound, StreamingHttpResponse
+from django.utils._os import safe_join
+from rest_framework.views import APIView
+from shorts.processing import get_hls_dir
+from shorts.streaming import RangeFile, build_offload_response, build_stream_response
+from shorts.streaming.responses import OFFLOAD_MODE
+from shorts.throttling import StreamSessionRateThrottle
+
+# Content types of the files in an HLS rendition directory
+SEGMENT_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".m4s": "video/iso.segment",
+    ".mp4": "video/mp4",
+    ".ts": "video/mp2t",
+}
+
+
+class VideoSegmentAPIView(APIView):
+    """View to serve HLS playlists and segments of short videos"""
+
+    throttle_classes = [StreamSessionRateThrottle]
+
+    def get(
+        self, request, video_id, file_name
+    ) -> HttpResponse | HttpResponseNotFound | StreamingHttpResponse:
+        content_type = SEGMENT_CONTENT_TYPES.get(os.path.splitext(file_name)[1])
+        if content_type is None:
+            return HttpResponseNotFound("Segment file not found.")
+
+        try:
+            file_path = safe_join(get_hls_dir(video_id), file_name)
+        except SuspiciousFileOperation:
+            return HttpResponseNotFound("Segment file not found.")
+        if not os.path.isfile(file_path):
+            return HttpResponseNotFound("Segment file not found.")
+
+        if settings.VIDEO_STREAM_MODE == OFFLOAD_MODE:
+            response = build_offload_response(
+                os.path.relpath(file_path, settings.MEDIA_ROOT),
+                file_path,
+                content_type,
+            )
+        else:
+            file = open(file_path, "rb")
+            size = os.fstat(file.fileno()).st_size
+            response = build_stream_response(
+                request, RangeFile(file, 0, size), content_type
+            )
+
+        # Segment URLs carry the transcode generation, so their bytes never
+        # change; the master playlist is rewritten by every transcode
+        if content_type == SEGMENT_CONTENT_TYPES[".m3u8"]:
+            response["Cache-Control"] = (
+                f"public, max-age={settings.VIDEO_HLS_PLAYLIST_MAX_AGE}"
+            )
+        else:
+            response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
@@ -1,54 +1,267 @@
 import os
-from wsgiref.util import FileWrapper
+import time
+from typing import BinaryIO
 
-from django.http import HttpResponseNotFound, StreamingHttpResponse
+from django.conf import settings
+from django.core.files.storage import Storage
+from django.http import (
+    HttpResponse,
+    HttpResponseNotFound,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import get_random_string
+from django.utils.http import http_date
 from rest_core.views.mixins import ModelObjectMixin
-from rest_framework.throttling import UserRateThrottle
 from rest_framework.views import APIView
 from shorts.models.video import Video
+from shorts.processing import find_keyframe
+from shorts.storage import is_local_storage
+from shorts.streaming import (
+    CoalescedRangeFile,
+    MultipartRangeFile,
+    RangeFile,
+    VideoFileInfo,
+    build_offload_response,
+    build_stream_response,
+    if_range_matches,
+    media_disk_cache,
+    parse_range_header,
+    stream_metrics,
+    video_file_cache,
+    video_prefix_cache,
+)
+from shorts.streaming.responses import OFFLOAD_MODE
+from shorts.throttling import StreamSessionRateThrottle
 
 
 class VideoStreamAPIView(ModelObjectMixin[Video], APIView):
     """View to handle short videos stream"""
 
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [StreamSessionRateThrottle]
     queryset = Video.objects.all()
 
-    def get(self, request, video_id) -> HttpResponseNotFound | StreamingHttpResponse:
+    def get(
+        self, request, video_id
+    ) -> HttpResponse | HttpResponseNotFound | StreamingHttpResponse:
+        started_at = time.monotonic()
+
+        # Hot videos are served from the file cache without a query or stat
+        info = video_file_cache.get(video_id)
+        if info is not None:
+            try:
+                return self.stream_video(request, info, started_at)
+            except FileNotFoundError:
+                # Another worker evicted the file from the disk cache
+                video_file_cache.invalidate(video_id)
+
         video_obj = self.get_object(id=video_id)
         if video_obj is None:
             return HttpResponseNotFound("Video file not found.")
 
-        file_path = video_obj.video.path
-        file_size = os.path.getsize(file_path)
-        range_header = request.headers.get("Range", "").strip()
+        # The file may live in the hot or the cold storage tier
+        storage = video_obj.get_video_file_storage()
+        path = self.get_local_path(storage, video_obj.video.name)
+        if path is None:
+            # Object storage serves ranges itself from a presigned URL
+            return HttpResponseRedirect(storage.url(video_obj.video.name))
+
+        info = video_file_cache.load(
+            video_id,
+            video_obj.video.name,
+            path,
+            keyframes=video_obj.keyframe_index,
+            bitrate=video_obj.bitrate,
+            cold=video_obj.storage_tier == Video.STORAGE_COLD,
+        )
+        return self.stream_video(request, info, started_at)
+
+    def get_local_path(self, storage: Storage, name: str) -> str | None:
+        """Return the local path to stream a video file from.
+
+        Remote files are served from the disk cache once they are hot.
+
+        Returns:
+            str | None: The path, or None to redirect to the storage URL.
+        """
+        if is_local_storage(storage):
+            return storage.path(name)
+        if settings.VIDEO_STREAM_MODE == OFFLOAD_MODE:
+            return None
+
+        path = media_disk_cache.get_path(name)
+        if path is None:
+            media_disk_cache.record_miss(storage, name)
+        return path
+
+    def stream_video(
+        self, request, info: VideoFileInfo, started_at: float
+    ) -> HttpResponse | StreamingHttpResponse:
+        """Build the full, ranged or conditional response for a video file."""
         content_type = "video/mp4"
-        file = open(file_path, "rb")
-
-        if range_header:
-            # Parse byte range
-            start, end = 0, file_size - 1
-            match = range_header.replace("bytes=", "").split("-")
-            if match[0]:
-                start = int(match[0])
-            if len(match) > 1 and match[1]:
-                end = int(match[1])
-            length = end - start + 1
-
-            file.seek(start)
-            response = StreamingHttpResponse(
-                FileWrapper(file, blksize=8192), status=206, content_type=content_type
+        content_disposition = f'inline; filename="{os.path.basename(info.path)}"'
+
+        # Let the reverse proxy send the bytes after Django's checks
+        if settings.VIDEO_STREAM_MODE == OFFLOAD_MODE:
+            # The proxy maps each storage tier to its own internal location
+            base_url = settings.VIDEO_STREAM_OFFLOAD_COLD_URL if info.cold else None
+            response = build_offload_response(
+                info.name, info.path, content_type, base_url
             )
-            response["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            response["Content-Disposition"] = content_disposition
+            return response
+
+        file_size = info.size
+        last_modified = info.mtime
+        etag = info.etag
+
+        # Answer If-None-Match / If-Modified-Since / If-Match preconditions
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return self.finalize_response_headers(
+                response, etag, last_modified, content_disposition
+            )
+
+        # Honour Range only when If-Range (if any) still matches
+        ranges = None
+        range_header = request.headers.get("Range", "").strip()
+        if range_header and if_range_matches(request, etag, last_modified):
+            ranges = parse_range_header(range_header, file_size)
+
+        # ?t=<seconds> seeks to the nearest preceding keyframe in one request
+        keyframe = self.get_seek_keyframe(request, info)
+        if keyframe is not None:
+            ranges = [(keyframe[1], file_size - 1)]
+
+        if ranges is not None and not ranges:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{file_size}"
+            return self.finalize_response_headers(
+                response, etag, last_modified, content_disposition
+            )
+
+        # HEAD answers with the headers of the same GET, the file is never opened
+        if request.method == "HEAD":
+            response_content_type, status, length = content_type, 200, file_size
+            if ranges is not None and len(ranges) == 1:
+                start, end = ranges[0]
+                status, length = 206, end - start + 1
+            elif ranges is not None:
+                # The multipart length only depends on the ranges and headers
+                boundary = get_random_string(32)
+                body = MultipartRangeFile(
+                    None, ranges, file_size, content_type, boundary
+                )
+                response_content_type = f"multipart/byteranges; boundary={boundary}"
+                status, length = 206, body.length
+
+            response = HttpResponse(content_type=response_content_type, status=status)
             response["Content-Length"] = str(length)
+            if ranges is not None and len(ranges) == 1:
+                response["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            if keyframe is not None:
+                response["X-Keyframe-Time"] = f"{keyframe[0] / 1000:.3f}"
+            return self.finalize_response_headers(
+                response, etag, last_modified, content_disposition
+            )
+
+        # Ranges inside the head of the file are served from the prefix cache
+        if (
+            ranges is not None
+            and len(ranges) == 1
+            and video_prefix_cache.covers(info, *ranges[0])
+        ):
+            start, end = ranges[0]
+            recorder = stream_metrics.start(info.video_id, end - start + 1, started_at)
+            response = HttpResponse(
+                video_prefix_cache.read(info, start, end),
+                status=206,
+                content_type=content_type,
+            )
+            recorder.record_sent(end - start + 1)
+            recorder.finish()
+            response["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            response["Content-Length"] = str(end - start + 1)
+            if keyframe is not None:
+                response["X-Keyframe-Time"] = f"{keyframe[0] / 1000:.3f}"
+            return self.finalize_response_headers(
+                response, etag, last_modified, content_disposition
+            )
+
+        file = video_file_cache.open(info)
+        if ranges is None:
+            body = self.get_range_file(info, file, 0, file_size)
+            response_content_type, status = content_type, 200
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            body = self.get_range_file(info, file, start, end - start + 1)
+            response_content_type, status = content_type, 206
         else:
-            response = StreamingHttpResponse(
-                FileWrapper(file, blksize=8192), content_type=content_type
+            boundary = get_random_string(32)
+            body = MultipartRangeFile(file, ranges, file_size, content_type, boundary)
+            response_content_type = f"multipart/byteranges; boundary={boundary}"
+            status = 206
+
+        # Track the stream until the server closes the response body
+        body.recorder = stream_metrics.start(info.video_id, body.length, started_at)
+        response = build_stream_response(
+            request, body, response_content_type, status=status, bitrate=info.bitrate
+        )
+        if ranges is not None and len(ranges) == 1:
+            start, end = ranges[0]
+            response["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        if keyframe is not None:
+            response["X-Keyframe-Time"] = f"{keyframe[0] / 1000:.3f}"
+
+        return self.finalize_response_headers(
+            response, etag, last_modified, content_disposition
+        )
+
+    def get_seek_keyframe(self, request, info: VideoFileInfo) -> list[int] | None:
+        """Return the ``[milliseconds, byte_offset]`` keyframe for ``?t=``, if any."""
+        try:
+            seconds = float(request.query_params["t"])
+        except (KeyError, ValueError):
+            return None
+        if not 0 <= seconds < float("inf"):
+            return None
+
+        # Signed streams skip the Video query, so fetch the index on first seek
+        if info.keyframes is None:
+            info.keyframes = (
+                Video.objects.filter(id=info.video_id)
+                .values_list("keyframe_index", flat=True)
+                .first()
+                or []
             )
-            response["Content-Length"] = str(file_size)
 
+        keyframe = find_keyframe(info.keyframes, seconds)
+        if keyframe is None or keyframe[1] >= info.size:
+            return None
+        return keyframe
+
+    def get_range_file(
+        self, info: VideoFileInfo, file: BinaryIO, start: int, length: int
+    ) -> RangeFile:
+        """Return the range body, sharing disk reads when coalescing is on."""
+        if settings.VIDEO_STREAM_COALESCE_READS:
+            key = f"{info.video_id}:{info.etag}"
+            return CoalescedRangeFile(file, start, length, key)
+        return RangeFile(file, start, length)
+
+    def finalize_response_headers(
+        self,
+        response: HttpResponse | StreamingHttpResponse,
+        etag: str,
+        last_modified: int,
+        content_disposition: str,
+    ) -> HttpResponse | StreamingHttpResponse:
+        """Set the validator and range headers shared by all stream responses."""
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
         response["Accept-Ranges"] = "bytes"
-        response["Content-Disposition"] = (
-            f'inline; filename="{os.path.basename(file_path)}"'
-        )
+        response["Content-Disposition"] = content_disposition
         return response
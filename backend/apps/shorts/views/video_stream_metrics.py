@@ -0,0 +1,27 @@
+from django.http import HttpResponse
+from rest_framework.views import APIView
+from shorts.permissions import HasStreamMetricsToken
+from shorts.streaming import (
+    media_disk_cache,
+    stream_metrics,
+    video_file_cache,
+    video_prefix_cache,
+)
+
+
+class VideoStreamMetricsAPIView(APIView):
+    """View to expose this worker's streaming metrics for scraping"""
+
+    authentication_classes = []
+    permission_classes = [HasStreamMetricsToken]
+    throttle_classes = []
+
+    def get(self, request) -> HttpResponse:
+        body = stream_metrics.render(
+            extra={
+                "prefix_cache": video_prefix_cache.stats(),
+                "file_cache": {"entries": len(video_file_cache.entries)},
+                "disk_cache": media_disk_cache.stats(),
+            }
+        )
+        return HttpResponse(body, content_type="text/plain; version=0.0.4")
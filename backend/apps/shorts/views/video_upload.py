@@ -0,0 +1,160 @@
+from io import BytesIO
+
+from django.db import transaction
+from django.utils import timezone
+from rest_core.response import failure_response, success_response
+from rest_core.views.mixins import ModelObjectMixin
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle, UserRateThrottle
+from rest_framework.views import APIView
+from shorts.models.video_upload import VideoUpload
+from shorts.serializers.video import VideoSerializer
+from shorts.serializers.video_upload import (
+    VideoUploadFinalizeSerializer,
+    VideoUploadSerializer,
+)
+from shorts.tasks import process_video
+from shorts.uploads import (
+    UploadError,
+    create_upload,
+    finalize_upload,
+    parse_upload_checksum,
+    write_chunk,
+)
+
+
+class VideoUploadObjectMixin(ModelObjectMixin[VideoUpload]):
+    """Look up an unexpired upload session owned by the requester."""
+
+    queryset = VideoUpload.objects.all()
+
+    def get_upload(self, request, upload_id) -> VideoUpload:
+        upload = self.get_object(id=upload_id, owner=request.user)
+        if upload is None or upload.expires_at <= timezone.now():
+            raise NotFound("Upload not found or expired.")
+        return upload
+
+
+class VideoUploadAPIView(APIView):
+    """API view to open a resumable, chunked video upload"""
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request) -> Response:
+        """Create an upload session for a file of the given size."""
+        serializer = VideoUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return failure_response(message="Invalid upload", errors=serializer.errors)
+
+        upload = create_upload(
+            request.user,
+            serializer.validated_data["filename"],
+            serializer.validated_data["size"],
+        )
+        return success_response(
+            message="Upload created", data=VideoUploadSerializer(upload).data
+        )
+
+
+class VideoUploadDetailAPIView(VideoUploadObjectMixin, APIView):
+    """API view to inspect or cancel a resumable video upload"""
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def get(self, request, upload_id) -> Response:
+        """Return the received chunks so a client can resume the upload."""
+        upload = self.get_upload(request, upload_id)
+        return success_response(
+            message="Upload status", data=VideoUploadSerializer(upload).data
+        )
+
+    def delete(self, request, upload_id) -> Response:
+        """Cancel the upload and discard the received chunks."""
+        self.get_upload(request, upload_id).delete()
+        return success_response(
+            message="Upload cancelled",
+            data={"detail": "The upload and its received chunks were discarded."},
+        )
+
+
+class VideoUploadChunkAPIView(VideoUploadObjectMixin, APIView):
+    """API view to receive one chunk of a resumable video upload.
+
+    The chunk is the raw request body, verified against a tus-style
+    ``Upload-Checksum: sha256 <base64 digest>`` header. Chunks may arrive
+    in any order and in parallel.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "upload_chunk"
+
+    def patch(self, request, upload_id, index) -> Response:
+        upload = self.get_upload(request, upload_id)
+
+        checksum = parse_upload_checksum(request.headers.get("Upload-Checksum", ""))
+        if checksum is None:
+            return failure_response(
+                message="Invalid chunk checksum",
+                errors={
+                    "Upload-Checksum": ["Send 'sha256 <base64 digest>' of the chunk."]
+                },
+            )
+
+        try:
+            write_chunk(upload, index, request.stream or BytesIO(), checksum)
+        except UploadError as error:
+            return failure_response(
+                message="Invalid chunk", errors={"chunk": [str(error)]}
+            )
+
+        return success_response(
+            message="Chunk received", data=VideoUploadSerializer(upload).data
+        )
+
+
+class VideoUploadFinalizeAPIView(VideoUploadObjectMixin, APIView):
+    """API view to turn a complete upload into a short video"""
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def post(self, request, upload_id) -> Response:
+        upload = self.get_upload(request, upload_id)
+
+        serializer = VideoUploadFinalizeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return failure_response(
+                message="Invalid video details", errors=serializer.errors
+            )
+
+        with transaction.atomic():
+            # Concurrent requests wait here and then find the upload gone
+            upload = (
+                VideoUpload.objects.select_for_update().filter(pk=upload.pk).first()
+            )
+            if upload is None:
+                return failure_response(
+                    message="Upload already finalized",
+                    errors={"upload": ["The upload was already finalized."]},
+                )
+
+            try:
+                name, sha256 = finalize_upload(upload)
+            except UploadError as error:
+                return failure_response(
+                    message="Upload incomplete", errors={"chunks": [str(error)]}
+                )
+
+            video = serializer.save(owner=request.user, video=name, sha256=sha256)
+            upload.delete()
+        process_video.enqueue(video.pk)
+
+        return success_response(
+            message="Video created",
+            data=VideoSerializer(video, context={"request": request}).data,
+        )
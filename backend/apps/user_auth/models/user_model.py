@@ -1,3 +1,4 @@
+from core.sharded_upload_to import ShardedUploadTo
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.validators import MinLengthValidator
@@ -80,7 +81,7 @@ class User(UniqueUsernameMixin, AbstractBaseUser, PermissionsMixin):
         },
     )
     picture = models.ImageField(
-        upload_to="users/pictures/",
+        upload_to=ShardedUploadTo("users/pictures/"),
         max_length=100,
         null=True,
         blank=True,
@@ -7,16 +7,21 @@ ASGI provides a standard interface between async-capable Python web servers, fra
 The main purposes of this file are:
 1. Setting up the ASGI application variable for the web server
 2. Configuring Django settings module path
-3. Creating the ASGI application instance
+3. Creating the ASGI application instance with zero-copy file support
 """
 
 import os
 
-# Import Django's ASGI handler
-from django.core.asgi import get_asgi_application
+import django
+
+# Import the zero-copy aware ASGI handler
+from core.zerocopy_asgi_handler import ZeroCopyASGIHandler
 
 # Configure Django settings module path
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "apps_config.settings")
 
+# Set up Django the same way get_asgi_application() does
+django.setup(set_prefix=False)
+
 # Create ASGI application instance
-application = get_asgi_application()
+application = ZeroCopyASGIHandler()
@@ -63,6 +63,7 @@ INSTALLED_APPS += [
     "apps.user_auth",
     "apps.google_auth",
     "apps.shorts",
+    "apps.jobs",
 ]
 
 # Middleware Configuration Settings
@@ -154,6 +155,258 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_ROOT = BASE_DIR / "uploads"
 MEDIA_URL = "/media/"
 
+# Video Stream Configuration Settings
+# -----------------------------------
+# "python" streams through a Python iterator, "sendfile" hands the file
+# to the server (wsgi.file_wrapper / ASGI zerocopysend) for os.sendfile
+# and "offload" lets the reverse proxy send it (X-Accel-Redirect/X-Sendfile).
+# Under ASGI, chunks of VIDEO_STREAM_BLOCK_SIZE are read in the thread pool.
+VIDEO_STREAM_MODE = config("VIDEO_STREAM_MODE", cast=str, default="python")
+VIDEO_STREAM_BLOCK_SIZE = config(
+    "VIDEO_STREAM_BLOCK_SIZE", cast=int, default=1024 * 1024
+)
+
+# Reverse proxy offload headers per backend. "url" values point at an
+# internal proxy location, "path" values are absolute file paths. For
+# nginx the internal location must alias MEDIA_ROOT, for example:
+#   location /protected-media/ { internal; alias /srv/backend/uploads/; }
+VIDEO_STREAM_OFFLOAD_BACKEND = config(
+    "VIDEO_STREAM_OFFLOAD_BACKEND", cast=str, default="nginx"
+)
+VIDEO_STREAM_OFFLOAD_URL = config(
+    "VIDEO_STREAM_OFFLOAD_URL", cast=str, default="/protected-media/"
+)
+# Internal location of cold-tier files, e.g. aliasing VIDEO_COLD_STORAGE_ROOT:
+#   location /protected-media-cold/ { internal; alias /srv/backend/cold/; }
+VIDEO_STREAM_OFFLOAD_COLD_URL = config(
+    "VIDEO_STREAM_OFFLOAD_COLD_URL", cast=str, default="/protected-media-cold/"
+)
+VIDEO_STREAM_OFFLOAD_HEADERS = {
+    "nginx": {"header": "X-Accel-Redirect", "value": "url"},
+    "apache": {"header": "X-Sendfile", "value": "path"},
+    "lighttpd": {"header": "X-Sendfile", "value": "path"},
+}
+
+# Per-process cache of video file metadata and open descriptors. The TTL
+# bounds staleness for videos changed by other worker processes.
+VIDEO_FILE_CACHE_MAX_ENTRIES = config(
+    "VIDEO_FILE_CACHE_MAX_ENTRIES", cast=int, default=256
+)
+VIDEO_FILE_CACHE_POOL_SIZE = config("VIDEO_FILE_CACHE_POOL_SIZE", cast=int, default=2)
+VIDEO_FILE_CACHE_TTL = config("VIDEO_FILE_CACHE_TTL", cast=int, default=60)
+
+# Prefix cache of the first bytes of hot videos. Set the alias to a
+# CACHES entry to share prefixes between workers instead of memory.
+VIDEO_PREFIX_CACHE_BYTES = config(
+    "VIDEO_PREFIX_CACHE_BYTES", cast=int, default=512 * 1024
+)
+VIDEO_PREFIX_CACHE_MAX_BYTES = config(
+    "VIDEO_PREFIX_CACHE_MAX_BYTES", cast=int, default=64 * 1024 * 1024
+)
+VIDEO_PREFIX_CACHE_ALIAS = config("VIDEO_PREFIX_CACHE_ALIAS", default=None)
+VIDEO_PREFIX_CACHE_TIMEOUT = config(
+    "VIDEO_PREFIX_CACHE_TIMEOUT", cast=int, default=60 * 60
+)
+
+# Signed stream URLs emitted by VideoSerializer. Expiry is rounded up to
+# a whole TTL window so shared caches can reuse public URLs.
+VIDEO_STREAM_SIGNED_URLS = config("VIDEO_STREAM_SIGNED_URLS", cast=bool, default=True)
+VIDEO_STREAM_SIGNED_URL_TTL = config(
+    "VIDEO_STREAM_SIGNED_URL_TTL", cast=int, default=60 * 60
+)
+
+# Share concurrent reads of the same aligned blocks between streams
+VIDEO_STREAM_COALESCE_READS = config(
+    "VIDEO_STREAM_COALESCE_READS", cast=bool, default=True
+)
+VIDEO_STREAM_COALESCE_BLOCK_SIZE = config(
+    "VIDEO_STREAM_COALESCE_BLOCK_SIZE", cast=int, default=256 * 1024
+)
+
+# Token bucket pacing of Python-streamed videos: each stream gets the
+# video bitrate (bits/s) times the multiplier after a full-speed burst,
+# capped at a fair share of the per-worker budget (bytes/s, 0 = no cap).
+VIDEO_STREAM_PACING = config("VIDEO_STREAM_PACING", cast=bool, default=False)
+VIDEO_STREAM_DEFAULT_BITRATE = config(
+    "VIDEO_STREAM_DEFAULT_BITRATE", cast=int, default=4_000_000
+)
+VIDEO_STREAM_PACING_MULTIPLIER = config(
+    "VIDEO_STREAM_PACING_MULTIPLIER", cast=float, default=1.5
+)
+VIDEO_STREAM_PACING_BURST_SECONDS = config(
+    "VIDEO_STREAM_PACING_BURST_SECONDS", cast=float, default=5.0
+)
+VIDEO_STREAM_WORKER_RATE = config(
+    "VIDEO_STREAM_WORKER_RATE", cast=int, default=100 * 1024 * 1024
+)
+
+# Lifetime of a stream session charged once by StreamSessionRateThrottle
+VIDEO_STREAM_SESSION_TTL = config("VIDEO_STREAM_SESSION_TTL", cast=int, default=30 * 60)
+
+# Bearer token for scraping videos/streams/metrics/ (disabled when empty)
+VIDEO_STREAM_METRICS_TOKEN = config("VIDEO_STREAM_METRICS_TOKEN", cast=str, default="")
+
+# Background Job Configuration Settings (see `manage.py run_jobs`)
+# ----------------------------------------------------------------
+# Run tasks inline instead of queueing them, e.g. when no worker runs
+JOBS_EAGER = config("JOBS_EAGER", cast=bool, default=False)
+JOBS_CONCURRENCY = config("JOBS_CONCURRENCY", cast=int, default=2)
+JOBS_POLL_INTERVAL = 2.0
+JOBS_MAX_ATTEMPTS = 5
+# Retry delays double from JOBS_RETRY_BACKOFF up to JOBS_RETRY_BACKOFF_MAX seconds
+JOBS_RETRY_BACKOFF = 30
+JOBS_RETRY_BACKOFF_MAX = 60 * 60
+# Running jobs are presumed lost after this many seconds (above FFMPEG_TIMEOUT)
+JOBS_VISIBILITY_TIMEOUT = 2 * 60 * 60
+JOBS_RETENTION = 7 * 24 * 60 * 60
+
+# FFmpeg Configuration Settings
+# -----------------------------
+FFMPEG_BINARY = config("FFMPEG_BINARY", cast=str, default="ffmpeg")
+FFPROBE_BINARY = config("FFPROBE_BINARY", cast=str, default="ffprobe")
+FFMPEG_TIMEOUT = config("FFMPEG_TIMEOUT", cast=int, default=30 * 60)
+
+# HLS Rendition Configuration Settings (see `manage.py transcode_hls`)
+# --------------------------------------------------------------------
+VIDEO_HLS_DIR = "shorts/hls"
+VIDEO_HLS_SEGMENT_SECONDS = 4
+VIDEO_HLS_PLAYLIST_MAX_AGE = 60
+VIDEO_HLS_LADDER = [
+    {"name": "240p", "height": 240, "video_bitrate": "400k", "audio_bitrate": "64k"},
+    {"name": "480p", "height": 480, "video_bitrate": "1000k", "audio_bitrate": "96k"},
+    {"name": "720p", "height": 720, "video_bitrate": "2500k", "audio_bitrate": "128k"},
+]
+
+# Resumable Upload Configuration Settings (see `manage.py clear_expired_uploads`)
+# -------------------------------------------------------------------------------
+# Chunks are assembled under MEDIA_ROOT so finalizing links instead of copying
+VIDEO_UPLOAD_STAGING_DIR = "shorts/uploads"
+VIDEO_UPLOAD_CHUNK_SIZE = config(
+    "VIDEO_UPLOAD_CHUNK_SIZE", cast=int, default=5 * 1024 * 1024
+)
+VIDEO_UPLOAD_MAX_SIZE = config(
+    "VIDEO_UPLOAD_MAX_SIZE", cast=int, default=1024 * 1024 * 1024
+)
+VIDEO_UPLOAD_EXPIRY = config("VIDEO_UPLOAD_EXPIRY", cast=int, default=24 * 60 * 60)
+
+# Content-Addressed Storage Configuration Settings (see `manage.py recount_blobs`)
+# -------------------------------------------------------------------------------
+# Store Video.video/thumbnail once per content under blobs/ab/cd/<sha256>
+VIDEO_CONTENT_ADDRESSED_STORAGE = config(
+    "VIDEO_CONTENT_ADDRESSED_STORAGE", cast=bool, default=True
+)
+# Byte ranges sampled per blob for proving possession before a claim
+VIDEO_BLOB_CHALLENGE_COUNT = 8
+VIDEO_BLOB_CHALLENGE_LENGTH = 64 * 1024
+VIDEO_BLOB_CHALLENGE_TTL = 5 * 60
+
+# Object Storage Configuration Settings
+# -------------------------------------
+# "local" keeps Video files under MEDIA_ROOT, "s3" stores them in an
+# S3-compatible bucket (AWS S3, MinIO, ...) through django-storages and
+# lets clients upload straight to the bucket with presigned PUT URLs.
+VIDEO_STORAGE_BACKEND = config("VIDEO_STORAGE_BACKEND", cast=str, default="local")
+AWS_STORAGE_BUCKET_NAME = config("AWS_STORAGE_BUCKET_NAME", cast=str, default="")
+AWS_ACCESS_KEY_ID = config("AWS_ACCESS_KEY_ID", cast=str, default="")
+AWS_SECRET_ACCESS_KEY = config("AWS_SECRET_ACCESS_KEY", cast=str, default="")
+AWS_S3_REGION_NAME = config("AWS_S3_REGION_NAME", cast=str, default="us-east-1")
+# For a local MinIO: AWS_S3_ENDPOINT_URL=http://localhost:9000
+AWS_S3_ENDPOINT_URL = config("AWS_S3_ENDPOINT_URL", cast=str, default=None)
+AWS_S3_ADDRESSING_STYLE = config("AWS_S3_ADDRESSING_STYLE", cast=str, default="path")
+AWS_S3_SIGNATURE_VERSION = "s3v4"
+AWS_S3_FILE_OVERWRITE = False
+AWS_DEFAULT_ACL = None
+# Lifetime of presigned GET URLs returned for stored files
+AWS_QUERYSTRING_EXPIRE = config("AWS_QUERYSTRING_EXPIRE", cast=int, default=60 * 60)
+
+# Default cold-tier location. Like MEDIA_URL, VIDEO_COLD_STORAGE_URL is
+# only served by Django with DEBUG, production proxies must alias it to
+# VIDEO_COLD_STORAGE_ROOT (see VIDEO_STREAM_OFFLOAD_COLD_URL for offload).
+VIDEO_COLD_STORAGE_ROOT = config(
+    "VIDEO_COLD_STORAGE_ROOT", cast=str, default=str(BASE_DIR / "cold")
+)
+VIDEO_COLD_STORAGE_URL = "/media-cold/"
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    # Only instantiated when VIDEO_STORAGE_BACKEND is "s3"
+    "videos": {"BACKEND": "storages.backends.s3.S3Storage"},
+    # Cheaper storage of rarely watched videos (see `manage.py tier_videos`).
+    # May be any storage, e.g. an S3Storage with its own "bucket_name" and
+    # "object_parameters": {"StorageClass": "STANDARD_IA"}.
+    "cold_videos": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {
+            "location": VIDEO_COLD_STORAGE_ROOT,
+            "base_url": VIDEO_COLD_STORAGE_URL,
+        },
+    },
+}
+
+# Lifetime of presigned PUT URLs. Uploads can be confirmed until
+# VIDEO_UPLOAD_EXPIRY after the URL was issued, unconfirmed objects are
+# deleted afterwards by `manage.py clear_expired_uploads`.
+VIDEO_DIRECT_UPLOAD_EXPIRY = config(
+    "VIDEO_DIRECT_UPLOAD_EXPIRY", cast=int, default=15 * 60
+)
+
+# Read-through cache of remote video files on a local (SSD) disk. Videos
+# requested VIDEO_DISK_CACHE_MIN_HITS times within the window are copied
+# in the background and streamed locally, colder ones are redirected to
+# the object storage. Offload mode always redirects remote videos.
+VIDEO_DISK_CACHE_DIR = config(
+    "VIDEO_DISK_CACHE_DIR", cast=str, default=str(BASE_DIR / "cache" / "media")
+)
+# Set to 0 to disable the cache
+VIDEO_DISK_CACHE_MAX_BYTES = config(
+    "VIDEO_DISK_CACHE_MAX_BYTES", cast=int, default=20 * 1024 * 1024 * 1024
+)
+VIDEO_DISK_CACHE_MIN_HITS = config("VIDEO_DISK_CACHE_MIN_HITS", cast=int, default=3)
+VIDEO_DISK_CACHE_HIT_WINDOW = config(
+    "VIDEO_DISK_CACHE_HIT_WINDOW", cast=int, default=10 * 60
+)
+VIDEO_DISK_CACHE_FILL_WORKERS = 2
+# Age after which the part file of a crashed fill is discarded
+VIDEO_DISK_CACHE_FILL_TIMEOUT = 30 * 60
+
+# Storage Tiering Configuration Settings (see `manage.py tier_videos`)
+# -------------------------------------------------------------------
+# Videos older than VIDEO_TIER_COLD_AFTER days without a view in that
+# time move to the cold storage. Cold videos with VIDEO_TIER_PROMOTE_VIEWS
+# views within VIDEO_TIER_PROMOTE_WINDOW hours move back.
+VIDEO_TIER_COLD_AFTER = config("VIDEO_TIER_COLD_AFTER", cast=int, default=30)
+VIDEO_TIER_PROMOTE_VIEWS = config("VIDEO_TIER_PROMOTE_VIEWS", cast=int, default=3)
+VIDEO_TIER_PROMOTE_WINDOW = config("VIDEO_TIER_PROMOTE_WINDOW", cast=int, default=24)
+# Videos moved per tiering run
+VIDEO_TIER_BATCH_SIZE = 100
+# Seconds a moved video's old copy is kept. It must outlast the file cache
+# TTL of every worker and presigned URLs already handed out.
+VIDEO_TIER_RELEASE_DELAY = config(
+    "VIDEO_TIER_RELEASE_DELAY", cast=int, default=AWS_QUERYSTRING_EXPIRE
+)
+
+# Thumbnail Rendition Configuration Settings (see `manage.py generate_thumbnails`)
+# --------------------------------------------------------------------------------
+VIDEO_THUMBNAIL_DIR = "shorts/thumbnails/renditions"
+# Rendition widths in pixels, keyed by the size names clients may request
+VIDEO_THUMBNAIL_SIZES = {"small": 180, "medium": 360, "large": 720}
+# Sizes served for list and detail payloads unless ?thumbnail_size= is given
+VIDEO_THUMBNAIL_LIST_SIZE = "medium"
+VIDEO_THUMBNAIL_DETAIL_SIZE = "large"
+# Frames compared by ffmpeg when picking a representative frame
+VIDEO_THUMBNAIL_SAMPLE_FRAMES = 120
+
+# Storyboard Sprite Configuration Settings (see `manage.py generate_storyboards`)
+# ------------------------------------------------------------------------------
+VIDEO_STORYBOARD_INTERVAL = 1.0
+VIDEO_STORYBOARD_MAX_FRAMES = 100
+VIDEO_STORYBOARD_COLUMNS = 10
+VIDEO_STORYBOARD_TILE_WIDTH = 90
+VIDEO_STORYBOARD_TILE_HEIGHT = 160
+# JPEG quality scale of ffmpeg, 2 (best) to 31 (smallest)
+VIDEO_STORYBOARD_QUALITY = 5
+
 # REST Framework Configuration Settings
 # -------------------------------------
 REST_FRAMEWORK = {
@@ -179,6 +432,8 @@ REST_FRAMEWORK = {
         "anon": "100/day",
         "auth": "8/hour",
         "user": "1000/day",
+        "stream_session": "500/day",
+        "upload_chunk": "10000/day",
     },
     "DEFAULT_PAGINATION_CLASS": "rest_core.pagination.PageNumberPagination",
     "PAGE_SIZE": 4,
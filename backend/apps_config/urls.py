@@ -53,3 +53,7 @@ if settings.DEBUG:
 
     # Serve media files during development
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    urlpatterns += static(
+        settings.VIDEO_COLD_STORAGE_URL,
+        document_root=settings.VIDEO_COLD_STORAGE_ROOT,
+    )
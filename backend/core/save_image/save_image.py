@@ -38,7 +38,11 @@ def save_image(
 
         extension = os.path.splitext(image_url)[1] or ".jpg"
         unique_filename = f"{image_save_name}{extension}"
-        file_path = os.path.join(upload_to_path, unique_filename)
+        if callable(upload_to_path):
+            # e.g. ShardedUploadTo nesting the file under hash-prefixed folders
+            file_path = upload_to_path(obj, unique_filename)
+        else:
+            file_path = os.path.join(upload_to_path, unique_filename)
 
         if default_storage.exists(file_path):
             logger.info(f"Image already exists at: {file_path}")
@@ -0,0 +1,3 @@
+from .sharded_upload_to import ShardedUploadTo, get_shard_path
+
+__all__ = ["ShardedUploadTo", "get_shard_path"]
@@ -0,0 +1,53 @@
+import hashlib
+import posixpath
+
+from django.utils.deconstruct import deconstructible
+
+
+def get_shard_path(
+    directory: str, filename: str, depth: int = 2, width: int = 2
+) -> str:
+    """Return ``directory/ab/cd/<filename>`` sharded by a hash of the file name.
+
+    Args:
+        directory (str): The base directory, e.g. ``shorts/videos/``.
+        filename (str): The file name, any leading directories are dropped.
+        depth (int): The number of nested shard directories.
+        width (int): The number of hex characters per shard directory.
+
+    Returns:
+        str: The sharded storage name of the file.
+    """
+    filename = posixpath.basename(filename)
+    digest = hashlib.md5(filename.encode(), usedforsecurity=False).hexdigest()
+    shards = [digest[i * width : (i + 1) * width] for i in range(depth)]
+    return posixpath.join(directory, *shards, filename)
+
+
+@deconstructible
+class ShardedUploadTo:
+    """Callable ``upload_to`` spreading files over hash-prefixed directories.
+
+    A flat upload directory slows down lookups, ``exists`` checks and
+    backups once it holds hundreds of thousands of files. With the default
+    depth and width every directory holds at most 256 sub-directories.
+
+    Example Usage:
+        picture = models.ImageField(upload_to=ShardedUploadTo("users/pictures/"))
+    """
+
+    def __init__(self, directory: str, depth: int = 2, width: int = 2) -> None:
+        self.directory = directory
+        self.depth = depth
+        self.width = width
+
+    def __call__(self, instance, filename: str) -> str:
+        return get_shard_path(self.directory, filename, self.depth, self.width)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, ShardedUploadTo)
+            and self.directory == other.directory
+            and self.depth == other.depth
+            and self.width == other.width
+        )
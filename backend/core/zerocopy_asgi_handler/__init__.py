@@ -0,0 +1,3 @@
+from .zerocopy_asgi_handler import ZEROCOPY_EXTENSION, ZeroCopyASGIHandler
+
+__all__ = ["ZEROCOPY_EXTENSION", "ZeroCopyASGIHandler"]
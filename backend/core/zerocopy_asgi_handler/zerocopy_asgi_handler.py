@@ -0,0 +1,65 @@
+from typing import Any
+
+from django.core.handlers.asgi import ASGIHandler
+
+# ASGI extension that lets the server send a file with os.sendfile
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class ZeroCopyASGIHandler(ASGIHandler):
+    """ASGI handler that hands file responses to the server for zero-copy sends.
+
+    When the ASGI server advertises the ``http.response.zerocopysend``
+    extension and a response streams a real file (``file_to_stream`` with
+    a ``fileno``), the body is sent as a single zero-copy message carrying
+    the file, offset and byte count instead of chunk by chunk through the
+    event loop. All other responses use Django's default behaviour.
+    """
+
+    async def run_get_response(self, request) -> Any:
+        response = await super().run_get_response(request)
+        extensions = request.scope.get("extensions") or {}
+        filelike = getattr(response, "file_to_stream", None)
+        response.zerocopy = (
+            ZEROCOPY_EXTENSION in extensions
+            and hasattr(filelike, "fileno")
+            and hasattr(filelike, "tell")
+            and response.has_header("Content-Length")
+        )
+        return response
+
+    async def send_response(self, response, send) -> None:
+        if not getattr(response, "zerocopy", False):
+            await super().send_response(response, send)
+            return
+
+        # Collect headers and cookies the same way Django does
+        response_headers = []
+        for header, value in response.items():
+            if isinstance(header, str):
+                header = header.encode("ascii")
+            if isinstance(value, str):
+                value = value.encode("latin1")
+            response_headers.append((bytes(header), bytes(value)))
+        for c in response.cookies.values():
+            response_headers.append((b"Set-Cookie", c.OutputString().encode("ascii")))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response_headers,
+            }
+        )
+
+        # Let the server copy the bytes straight from the file descriptor
+        filelike = response.file_to_stream
+        await send(
+            {
+                "type": ZEROCOPY_EXTENSION,
+                "file": filelike,
+                "offset": filelike.tell(),
+                "count": int(response["Content-Length"]),
+                "more_body": False,
+            }
+        )